@@ -30,6 +30,6 @@ GENERATE_CONTENT_CONFIG = types.GenerateContentConfig(
 SUPERVISOR_AGENT_TOOLS = ['create_governance_request', 'get_user_details_history', 'navigate_to_section']
 REPORT_GENERATOR_AGENT_TOOLS = ['create_report']
 RISK_ANALYSER_AGENT_TOOLS = ['create_risk_analysis']
-COMMITTEE_ASSIGNMENT_AGENT_TOOLS = ['get_committee_clarifications', 'update_committee_clarification', 'update_committee_status', 'navigate_to_section']
-ENVIRONMENT_SETUP_AGENT_TOOLS = ['create_environment_details', 'get_environment_clarifications', 'get_user_details_history']
-COST_ESTIMATOR_AGENT_TOOLS = ['create_cost_analysis', 'update_cost_clarification', 'get_cost_clarifications', 'get_user_details_history']
+COMMITTEE_ASSIGNMENT_AGENT_TOOLS = ['get_pending_clarifications', 'submit_committee_review', 'navigate_to_section']
+ENVIRONMENT_SETUP_AGENT_TOOLS = ['create_environment_details', 'get_pending_clarifications', 'get_governance_sections']
+COST_ESTIMATOR_AGENT_TOOLS = ['create_cost_analysis', 'update_cost_clarification', 'get_pending_clarifications', 'get_governance_sections']
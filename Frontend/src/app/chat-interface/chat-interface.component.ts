@@ -13,6 +13,7 @@ import { DomSanitizer, SafeHtml } from '@angular/platform-browser';
 import { marked } from 'marked';
 import { ChatbotService } from '../services/chatbot.service';
 import { DocumentUploadService } from '../services/document-upload.service';
+import { ChatHistoryWebsocketService } from '../services/chat-history-websocket.service';
 import { environment } from '../../environments/environment';
 // Configure PDF.js worker - version 3.x uses different worker path
 pdfjsLib.GlobalWorkerOptions.workerSrc = environment.pdfjsWorkerUrl;
@@ -52,7 +53,8 @@ export class ChatInterfaceComponent implements OnInit {
     private chatbotService: ChatbotService,
     private sanitizer: DomSanitizer,
     private cdr: ChangeDetectorRef,
-    private documentUploadService: DocumentUploadService
+    private documentUploadService: DocumentUploadService,
+    private chatHistoryWebsocket: ChatHistoryWebsocketService
   ) {}
   @ViewChild('userInputArea') userInputArea?: ElementRef<HTMLTextAreaElement>;
   @ViewChild('messageList') messageList?: ElementRef<HTMLOListElement>;
@@ -91,6 +93,9 @@ export class ChatInterfaceComponent implements OnInit {
   private createChatSession(): void {
     console.log('Creating chat session with ID:', this.sessionId);
 
+    // Receive governance broadcasts of this chat session only
+    this.chatHistoryWebsocket.subscribe({ sessionIds: [this.sessionId] });
+
     this.chatbotService
       .createSession(
         this.sessionId,
@@ -780,6 +785,7 @@ export class ChatInterfaceComponent implements OnInit {
   }
 
   createNewSession(): void {
+    this.chatHistoryWebsocket.unsubscribe({ sessionIds: [this.sessionId] });
     this.sessionId = this.generateUUID();
     this.attachments = [];
     this.userInput = '';
@@ -115,6 +115,8 @@ export class GovernanceDetailsComponent implements OnInit, OnDestroy {
   isLoading: boolean = false;
   searchError: string = '';
   currentGovernanceId: string = '';
+  // Governance ID subscribed to over the WebSocket for the current search
+  private searchedGovernanceId: string = '';
   isExecutingAgents: boolean = false;
 
   // Search dropdown properties
@@ -597,6 +599,22 @@ export class GovernanceDetailsComponent implements OnInit, OnDestroy {
     }, 200);
   }
 
+  /**
+   * Receive WebSocket broadcasts of the searched governance ID instead of the previous one
+   */
+  private followSearchedGovernance(governanceId: string): void {
+    if (this.searchedGovernanceId === governanceId) {
+      return;
+    }
+    if (this.searchedGovernanceId) {
+      this.chatHistoryWebsocket.unsubscribe({ governanceIds: [this.searchedGovernanceId] });
+    }
+    if (governanceId) {
+      this.chatHistoryWebsocket.subscribe({ governanceIds: [governanceId] });
+    }
+    this.searchedGovernanceId = governanceId;
+  }
+
   /**
    * Clear search and reset all data
    */
@@ -604,6 +622,7 @@ export class GovernanceDetailsComponent implements OnInit, OnDestroy {
     this.isClearing = true;
     this.searchGovernanceId = '';
     this.currentGovernanceId = '';
+    this.followSearchedGovernance('');
     this.searchError = '';
     this.showSearchDropdown = false;
     this.searchResults = [];
@@ -654,6 +673,7 @@ export class GovernanceDetailsComponent implements OnInit, OnDestroy {
           console.log('Search results received:', data);
 
           this.currentGovernanceId = this.searchGovernanceId.trim();
+          this.followSearchedGovernance(this.currentGovernanceId);
 
           // Update governance details (report, risk, cost, environment)
           this.updateGovernanceDetailsFromWebSocket(data);
@@ -21,6 +21,16 @@ export class ChatHistoryWebsocketService {
   private governanceDetailsSubject = new Subject<any>();
   private connectionStatusSubject = new BehaviorSubject<boolean>(false);
 
+  // Governance and session IDs this client receives broadcasts for,
+  // re-sent to the server after every reconnect
+  private subscribedGovernanceIds = new Set<string>();
+  private subscribedSessionIds = new Set<string>();
+
+  // Last broadcast sequence number received per governance ID, and the server
+  // epoch they belong to; sent on re-subscribe to receive only missed changes
+  private lastSeq: { [governanceId: string]: number } = {};
+  private epoch: string | null = null;
+
   // WebSocket server URL - configured from environment
   private wsUrl = environment.mcpServerWsUrl;
 
@@ -38,6 +48,7 @@ export class ChatHistoryWebsocketService {
       this.socket.onopen = () => {
         console.log('WebSocket connected to MCP Server');
         this.connectionStatusSubject.next(true);
+        this.sendSubscriptions();
       };
 
       this.socket.onmessage = (event) => {
@@ -47,12 +58,20 @@ export class ChatHistoryWebsocketService {
           console.log('Message type:', message.type);
           console.log('Message data:', message.data);
 
-          if (message.type === 'chat_history_update') {
+          if (message.type === 'subscribed') {
+            if (message.epoch !== this.epoch) {
+              this.epoch = message.epoch;
+              this.lastSeq = {};
+            }
+          } else if (message.type === 'chat_history_update') {
             const parsedData = this.parseChatHistory(message.data);
             console.log('Parsed data being emitted:', parsedData);
             this.chatHistorySubject.next(parsedData);
           } else if (message.type === 'governance_details_update') {
             console.log('Governance details update received:', message.data);
+            if (typeof message.seq === 'number' && message.data?.governance_id) {
+              this.lastSeq[message.data.governance_id] = message.seq;
+            }
             // Also parse and emit chat history from governance details
             if (message.data?.chat_history) {
               const parsedChatData = this.parseChatHistory(message.data);
@@ -216,6 +235,55 @@ export class ChatHistoryWebsocketService {
     }
   }
 
+  /**
+   * Receive broadcasts of the given governance IDs and chat sessions only
+   */
+  subscribe(topics: { governanceIds?: string[]; sessionIds?: string[] }): void {
+    (topics.governanceIds || []).forEach((id) => this.subscribedGovernanceIds.add(id));
+    (topics.sessionIds || []).forEach((id) => this.subscribedSessionIds.add(id));
+    if (this.socket && this.socket.readyState === WebSocket.OPEN) {
+      this.socket.send(
+        JSON.stringify({
+          type: 'subscribe',
+          governance_ids: topics.governanceIds || [],
+          session_ids: topics.sessionIds || [],
+          epoch: this.epoch,
+          last_seq: this.lastSeq,
+        })
+      );
+    }
+  }
+
+  /**
+   * Stop receiving broadcasts of the given governance IDs and chat sessions
+   */
+  unsubscribe(topics: { governanceIds?: string[]; sessionIds?: string[] }): void {
+    (topics.governanceIds || []).forEach((id) => this.subscribedGovernanceIds.delete(id));
+    (topics.sessionIds || []).forEach((id) => this.subscribedSessionIds.delete(id));
+    if (this.socket && this.socket.readyState === WebSocket.OPEN) {
+      this.socket.send(
+        JSON.stringify({
+          type: 'unsubscribe',
+          governance_ids: topics.governanceIds || [],
+          session_ids: topics.sessionIds || [],
+        })
+      );
+    }
+  }
+
+  /**
+   * Re-send the current subscriptions (after a reconnect)
+   */
+  private sendSubscriptions(): void {
+    if (this.subscribedGovernanceIds.size === 0 && this.subscribedSessionIds.size === 0) {
+      return;
+    }
+    this.subscribe({
+      governanceIds: Array.from(this.subscribedGovernanceIds),
+      sessionIds: Array.from(this.subscribedSessionIds),
+    });
+  }
+
   /**
    * Disconnect from the WebSocket server
    */
@@ -8,6 +8,7 @@ export const environment = {
   agenticApplicationPort: runtimeConfig.agenticApplicationPort,
   backendApiPort: runtimeConfig.backendApiPort,
   mcpServerPort: runtimeConfig.mcpServerPort,
+  mcpServerWsPath: runtimeConfig.mcpServerWsPath,
 
   // Constructed URLs
   get agenticApplicationUrl(): string {
@@ -20,7 +21,7 @@ export const environment = {
     return `http://${this.pcIpAddress}:${this.backendApiPort}`;
   },
   get mcpServerWsUrl(): string {
-    return `ws://${this.pcIpAddress}:${this.mcpServerPort}`;
+    return `ws://${this.pcIpAddress}:${this.mcpServerPort}${this.mcpServerWsPath}`;
   },
 
   // Application Configuration
@@ -21,4 +21,9 @@ export const runtimeConfig = {
   agenticApplicationPort: '8350',
   backendApiPort: '8353',
   mcpServerPort: '8354',
+
+  // Path of the MCP Server WebSocket endpoint: '' for the standalone
+  // WebSocket server (port 8354), '/ws' when it is served by the MCP app
+  // itself (WS_MODE=asgi, port 8351)
+  mcpServerWsPath: '',
 };
@@ -0,0 +1,93 @@
+"""
+Startup-time benchmark of the MCP server.
+
+Reports, over several runs in fresh interpreters:
+  - import time: time to import main (configuration, tool registration)
+  - ready time: time from launching `python main.py` until the MCP HTTP
+    endpoint answers on port 8351
+
+Ports 8351 and 8354 must be free while the benchmark runs. BACKEND_HOST is
+set to 127.0.0.1 unless already provided, so no network probe is made; pass
+--probe to leave it unset and include local IP detection in the timings.
+
+Usage (from the MCP Server directory):
+    python benchmarks/startup_benchmark.py [--runs N] [--probe]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+READY_URL = "http://127.0.0.1:8351/metrics"
+
+IMPORT_SNIPPET = (
+    "import time; started = time.perf_counter(); import main; "
+    "print(time.perf_counter() - started)"
+)
+
+
+def server_env(probe: bool) -> dict:
+    env = dict(os.environ)
+    if probe:
+        env.pop('BACKEND_HOST', None)
+    else:
+        env.setdefault('BACKEND_HOST', '127.0.0.1')
+    return env
+
+
+def measure_import(env: dict) -> float:
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SNIPPET],
+        cwd=SERVER_DIR, env=env, capture_output=True, text=True, check=True
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def measure_ready(env: dict, timeout: float = 60.0) -> float:
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "main.py"],
+        cwd=SERVER_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            if process.poll() is not None:
+                raise RuntimeError(f"MCP server exited with code {process.returncode}")
+            try:
+                with urllib.request.urlopen(READY_URL, timeout=1):
+                    return time.perf_counter() - started
+            except (urllib.error.URLError, ConnectionError, OSError):
+                time.sleep(0.01)
+        raise TimeoutError(f"MCP server not ready after {timeout}s")
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def summarize(label: str, samples: list):
+    print(f"{label:<14} median {statistics.median(samples) * 1000:8.1f} ms   "
+          f"min {min(samples) * 1000:8.1f} ms   max {max(samples) * 1000:8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure MCP server import and ready-to-serve time")
+    parser.add_argument("--runs", type=int, default=5, help="Number of runs per measurement")
+    parser.add_argument("--probe", action="store_true", help="Leave BACKEND_HOST unset (local IP detection)")
+    args = parser.parse_args()
+
+    env = server_env(args.probe)
+    print(f"BACKEND_HOST={env.get('BACKEND_HOST', '<unset>')}, {args.runs} runs")
+    summarize("import main", [measure_import(env) for _ in range(args.runs)])
+    summarize("ready to serve", [measure_ready(env) for _ in range(args.runs)])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Micro-benchmark of per-call payload validation cost.
+
+Compares the previous pattern, where the tools defined their Pydantic models
+inside the function body (rebuilding the schema on every call), with the
+shared models of utilities.validators that are compiled once at import.
+
+Usage (from the MCP Server directory):
+    python benchmarks/validation_benchmark.py [iterations]
+"""
+import os
+import sys
+import timeit
+from typing import List, Literal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pydantic import BaseModel, Field, field_validator
+
+from utilities.validators import (
+    SectionValidator,
+    SubSectionValidator,
+    UpdateCommitteeClarificationsRequest
+)
+
+
+CLARIFICATIONS = [
+    {"unique_code": "core_business_impact", "user_answer": "Low impact", "status": "completed"},
+    {"unique_code": "internal_users_only", "user_answer": "Yes", "status": "completed"},
+    {"unique_code": "tech_approved_org", "user_answer": "Approved stack", "status": "pending"}
+]
+
+
+def validate_section_inline(section: str, sub_section: str):
+    """Section validation as previously done inside get_user_details_history."""
+    class InlineSectionValidator(BaseModel):
+        section: Literal['governance_report', 'risk_details', 'commitee_approval', 'cost_details', 'environment_details', 'none'] = Field(default='none')
+
+    class InlineSubSectionValidator(BaseModel):
+        sub_section: Literal['committee_1', 'committee_2', 'committee_3', 'none'] = Field(default='none')
+
+    return InlineSectionValidator(section=section).section, InlineSubSectionValidator(sub_section=sub_section).sub_section
+
+
+def validate_section_shared(section: str, sub_section: str):
+    return SectionValidator(section=section).section, SubSectionValidator(sub_section=sub_section).sub_section
+
+
+def validate_committee_update_inline(committee: str, clarifications: list):
+    """Committee clarification validation as previously done inside update_committee_clarification."""
+    codes = ['core_business_impact', 'internal_users_only', 'tech_approved_org',
+             'sensitive_data', 'system_integration', 'block_other_teams',
+             'regulatory_compliance', 'reputation_impact', 'multi_business_scale']
+
+    class InlineItem(BaseModel):
+        unique_code: str
+        user_answer: str
+        status: str
+
+        @field_validator('unique_code')
+        @classmethod
+        def validate_unique_code(cls, v: str) -> str:
+            if v not in codes:
+                raise ValueError('invalid unique_code')
+            return v
+
+        @field_validator('user_answer')
+        @classmethod
+        def validate_user_answer(cls, v: str) -> str:
+            if not v or not v.strip():
+                raise ValueError('user_answer cannot be empty')
+            return v.strip()
+
+        @field_validator('status')
+        @classmethod
+        def validate_status(cls, v: str) -> str:
+            if v not in ['pending', 'completed']:
+                raise ValueError('invalid status')
+            return v
+
+    class InlineRequest(BaseModel):
+        committee: str
+        clarifications: List[InlineItem]
+
+    return InlineRequest(committee=committee, clarifications=clarifications)
+
+
+def validate_committee_update_shared(committee: str, clarifications: list):
+    return UpdateCommitteeClarificationsRequest(committee=committee, clarifications=clarifications)
+
+
+def per_call_us(fn, iterations: int, *args) -> float:
+    fn(*args)
+    return timeit.timeit(lambda: fn(*args), number=iterations) / iterations * 1e6
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    cases = [
+        ("section / sub_section", validate_section_inline, validate_section_shared, ('risk_details', 'none')),
+        ("committee clarifications", validate_committee_update_inline, validate_committee_update_shared, ('committee_1', CLARIFICATIONS))
+    ]
+
+    print(f"Per-call validation cost ({iterations} iterations)")
+    print(f"{'payload':<28}{'inline models':>16}{'shared models':>16}{'speedup':>10}")
+    for name, inline_fn, shared_fn, args in cases:
+        inline_us = per_call_us(inline_fn, iterations, *args)
+        shared_us = per_call_us(shared_fn, iterations, *args)
+        print(f"{name:<28}{inline_us:>13.1f} us{shared_us:>13.1f} us{inline_us / shared_us:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
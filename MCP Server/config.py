@@ -1,11 +1,14 @@
 """Configuration settings for MCP Server"""
 
 import os
-from utils import get_local_ip
 
 # API Configuration
-# Use environment variable or fallback to auto-detected local IP
-BACKEND_HOST = os.getenv('BACKEND_HOST', get_local_ip())
+# Use environment variable or fallback to auto-detected local IP. The
+# detection opens a socket, so it only runs when BACKEND_HOST is not set.
+BACKEND_HOST = os.getenv('BACKEND_HOST')
+if not BACKEND_HOST:
+    from utils import get_local_ip
+    BACKEND_HOST = get_local_ip()
 BACKEND_PORT = os.getenv('BACKEND_PORT', '8353')
 
 API_BASE_URL = f"http://{BACKEND_HOST}:{BACKEND_PORT}/api"
@@ -19,5 +22,106 @@ COST_CLARIFICATIONS_API_URL = f"{API_BASE_URL}/cost-clarifications"
 ENVIRONMENT_CLARIFICATIONS_API_URL = f"{API_BASE_URL}/environment-clarifications"
 COMMITTEE_CLARIFICATIONS_API_URL = f"{API_BASE_URL}/committee-clarifications"
 
+# Backend HTTP client settings (shared connection pool used by all tools)
+BACKEND_POOL_SIZE = int(os.getenv('BACKEND_POOL_SIZE', '20'))
+BACKEND_POOL_KEEPALIVE = int(os.getenv('BACKEND_POOL_KEEPALIVE', '10'))
+BACKEND_KEEPALIVE_EXPIRY = float(os.getenv('BACKEND_KEEPALIVE_EXPIRY', '30'))
+BACKEND_CONNECT_TIMEOUT = float(os.getenv('BACKEND_CONNECT_TIMEOUT', '10'))
+BACKEND_READ_TIMEOUT = float(os.getenv('BACKEND_READ_TIMEOUT', '10'))
+BACKEND_POOL_TIMEOUT = float(os.getenv('BACKEND_POOL_TIMEOUT', '10'))
+
+# Conditional GETs: last ETag and body per backend URL, revalidated with If-None-Match
+BACKEND_ETAG_CACHE_ENABLED = os.getenv('BACKEND_ETAG_CACHE_ENABLED', 'true').lower() == 'true'
+BACKEND_ETAG_CACHE_MAX_ENTRIES = int(os.getenv('BACKEND_ETAG_CACHE_MAX_ENTRIES', '2048'))
+
+# Retries of idempotent GET requests (exponential backoff with full jitter)
+BACKEND_RETRY_ATTEMPTS = int(os.getenv('BACKEND_RETRY_ATTEMPTS', '3'))
+BACKEND_RETRY_BASE_DELAY = float(os.getenv('BACKEND_RETRY_BASE_DELAY', '0.1'))
+BACKEND_RETRY_MAX_DELAY = float(os.getenv('BACKEND_RETRY_MAX_DELAY', '1.0'))
+# Time budget for all attempts of one call; no retry is started past it
+BACKEND_RETRY_DEADLINE_SECONDS = float(os.getenv('BACKEND_RETRY_DEADLINE_SECONDS', '15'))
+# Retry budget: retries may add at most this fraction of the request volume,
+# with a reserve of retries available under low traffic
+BACKEND_RETRY_BUDGET_RATIO = float(os.getenv('BACKEND_RETRY_BUDGET_RATIO', '0.2'))
+BACKEND_RETRY_BUDGET_RESERVE = float(os.getenv('BACKEND_RETRY_BUDGET_RESERVE', '10'))
+
+# Per-endpoint circuit breaker: opens after consecutive failures and fails fast until reset
+CIRCUIT_BREAKER_ENABLED = os.getenv('CIRCUIT_BREAKER_ENABLED', 'true').lower() == 'true'
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = int(os.getenv('CIRCUIT_BREAKER_FAILURE_THRESHOLD', '5'))
+CIRCUIT_BREAKER_RESET_SECONDS = float(os.getenv('CIRCUIT_BREAKER_RESET_SECONDS', '15'))
+
+# Maximum number of concurrent backend requests when refreshing governance data
+GOVERNANCE_FETCH_MAX_WORKERS = int(os.getenv('GOVERNANCE_FETCH_MAX_WORKERS', '8'))
+
+# Governance snapshot cache (per-section TTL, LRU bound on governance IDs)
+SNAPSHOT_CACHE_ENABLED = os.getenv('SNAPSHOT_CACHE_ENABLED', 'true').lower() == 'true'
+SNAPSHOT_CACHE_TTL_SECONDS = float(os.getenv('SNAPSHOT_CACHE_TTL_SECONDS', '30'))
+SNAPSHOT_CACHE_MAX_GOVERNANCES = int(os.getenv('SNAPSHOT_CACHE_MAX_GOVERNANCES', '256'))
+# Chat history is written by the agents outside of the MCP tools, so it is not cached by default
+CHAT_HISTORY_CACHE_TTL_SECONDS = float(os.getenv('CHAT_HISTORY_CACHE_TTL_SECONDS', '0'))
+
+# Optional on-disk second cache tier (SQLite): after a restart the last known
+# sections are served while they are revalidated against the backend
+SNAPSHOT_L2_ENABLED = os.getenv('SNAPSHOT_L2_ENABLED', 'false').lower() == 'true'
+SNAPSHOT_L2_PATH = os.getenv(
+    'SNAPSHOT_L2_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'governance_snapshots.sqlite3')
+)
+SNAPSHOT_L2_MAX_BYTES = int(os.getenv('SNAPSHOT_L2_MAX_BYTES', str(64 * 1024 * 1024)))
+SNAPSHOT_L2_MAX_AGE_SECONDS = float(os.getenv('SNAPSHOT_L2_MAX_AGE_SECONDS', '86400'))
+# Writes to the on-disk tier are applied by a background thread; when more are
+# waiting than this, they are replaced by clearing the on-disk tier
+SNAPSHOT_L2_WRITE_QUEUE_MAX = int(os.getenv('SNAPSHOT_L2_WRITE_QUEUE_MAX', '10000'))
+
+# Broadcast only the sections changed by a write instead of the full governance snapshot
+PARTIAL_BROADCASTS_ENABLED = os.getenv('PARTIAL_BROADCASTS_ENABLED', 'true').lower() == 'true'
+
+# Background broadcast dispatcher: broadcasts queued for the same governance ID
+# within the window are merged into a single fetch and send
+BROADCAST_DISPATCHER_ENABLED = os.getenv('BROADCAST_DISPATCHER_ENABLED', 'true').lower() == 'true'
+BROADCAST_COALESCE_WINDOW_SECONDS = float(os.getenv('BROADCAST_COALESCE_WINDOW_SECONDS', '0.2'))
+BROADCAST_MAX_PENDING = int(os.getenv('BROADCAST_MAX_PENDING', '1024'))
+# Number of governance IDs broadcast at the same time
+BROADCAST_MAX_WORKERS = int(os.getenv('BROADCAST_MAX_WORKERS', '4'))
+
+# Maximum number of remembered session_id -> governance_id mappings
+SESSION_CACHE_MAX_ENTRIES = int(os.getenv('SESSION_CACHE_MAX_ENTRIES', '10000'))
+
+# Number of governance snapshots the WebSocket manager keeps for delta broadcasts
+WS_STATE_MAX_GOVERNANCES = int(os.getenv('WS_STATE_MAX_GOVERNANCES', '256'))
+# When true, WebSocket clients only receive broadcasts of the governance or
+# session IDs they subscribed to; otherwise clients that never subscribed
+# receive all broadcasts (behaviour of frontends without subscriptions)
+WS_REQUIRE_SUBSCRIPTION = os.getenv('WS_REQUIRE_SUBSCRIPTION', 'false').lower() == 'true'
+# Minimum interval between backend lookups of a subscribed session whose
+# governance ID is not known yet (it may be created through another worker)
+WS_PENDING_SESSION_RETRY_SECONDS = float(os.getenv('WS_PENDING_SESSION_RETRY_SECONDS', '1.0'))
+# Outbound queue of each WebSocket client and what happens when it is full:
+# drop_oldest, latest_per_topic or disconnect
+WS_SEND_QUEUE_MAX_MESSAGES = int(os.getenv('WS_SEND_QUEUE_MAX_MESSAGES', '64'))
+WS_SLOW_CONSUMER_POLICY = os.getenv('WS_SLOW_CONSUMER_POLICY', 'latest_per_topic')
+# Number of sequence-numbered changes remembered per governance ID, so that a
+# re-subscribing client receives what it missed instead of the full snapshot
+WS_REPLAY_BUFFER_SIZE = int(os.getenv('WS_REPLAY_BUFFER_SIZE', '64'))
+# 'thread': WebSocket server on its own port and event loop in a background
+# thread; 'asgi': WebSocket endpoint at WS_PATH on the MCP server's port, served
+# by the same uvicorn event loop as the MCP tools
+WS_MODE = os.getenv('WS_MODE', 'thread')
+WS_PORT = int(os.getenv('WS_PORT', '8354'))
+WS_PATH = os.getenv('WS_PATH', '/ws')
+
+# Broadcast backplane: 'memory' delivers within this process only; 'redis'
+# publishes broadcasts on a Redis channel so that every worker delivers them
+# to its own WebSocket clients
+BROADCAST_BACKPLANE = os.getenv('BROADCAST_BACKPLANE', 'memory')
+BACKPLANE_REDIS_URL = os.getenv('BACKPLANE_REDIS_URL', 'redis://localhost:6379/0')
+BACKPLANE_CHANNEL = os.getenv('BACKPLANE_CHANNEL', 'governance-broadcasts')
+BACKPLANE_RECONNECT_SECONDS = float(os.getenv('BACKPLANE_RECONNECT_SECONDS', '1.0'))
+
+# Token budget of the governance data returned by read tools; larger results
+# are trimmed (longest strings first, then longest lists)
+PROJECTION_MAX_TOKENS = int(os.getenv('PROJECTION_MAX_TOKENS', '6000'))
+PROJECTION_CACHE_MAX_ENTRIES = int(os.getenv('PROJECTION_CACHE_MAX_ENTRIES', '256'))
+
 # Backward compatibility
 LOCAL_IP = BACKEND_HOST
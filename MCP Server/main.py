@@ -1,78 +1,142 @@
 from mcp.server.fastmcp import FastMCP
-from tools.get_weather import get_weather
-from tools.create_governance_request import create_governance_request
-from tools.get_user_details_history import get_user_details_history
-from tools.get_governance_report import get_governance_report
-from tools.get_risk_details import get_risk_details
-from tools.get_cost_details import get_cost_details
-from tools.get_environment_details import get_environment_details
-from tools.create_report import create_report
-from tools.create_cost_analysis import create_cost_analysis
-from tools.create_environment_details import create_environment_details
-from tools.create_risk_analysis import create_risk_analysis
-from tools.create_cost_clarification import create_cost_clarification
-from tools.update_cost_clarification import update_cost_clarification
-from tools.get_cost_clarifications import get_cost_clarifications
-from tools.create_environment_clarification import create_environment_clarification
-from tools.update_environment_clarification import update_environment_clarification
-from tools.get_environment_clarifications import get_environment_clarifications
-from tools.create_committee_clarification import create_committee_clarification
-from tools.update_committee_clarification import update_committee_clarification
-from tools.get_committee_clarifications import get_committee_clarifications
-from tools.update_committee_status import update_committee_status
-from tools.navigate_to_section import navigate_to_section
+from tools import tool_proxy
 import asyncio
+import contextlib
 import threading
-from websocket_manager import ws_manager
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import WebSocketRoute
+from config import WS_MODE, WS_PORT, WS_PATH
 
 mcp = FastMCP("StatefulServer", stateless_http=True)
 mcp.settings.host = "0.0.0.0"
 mcp.settings.port = 8351
 
+# Tools registered with the MCP server, in registration order. Only these
+# tool modules are imported, each on the first call of its tool; the others
+# are never loaded.
+REGISTERED_TOOLS = [
+    "create_governance_request",
+    "get_user_details_history",
+    "get_governance_report",
+    "get_risk_details",
+    "get_cost_details",
+    "get_environment_details",
+    "get_governance_sections",
+    "create_report",
+    "create_cost_analysis",
+    "create_environment_details",
+    "create_risk_analysis",
+    # "create_cost_clarification",
+    # "update_cost_clarification",
+    "get_cost_clarifications",
+    # "create_environment_clarification",
+    # "update_environment_clarification",
+    "get_environment_clarifications",
+    # "create_committee_clarification",
+    "update_committee_clarification",
+    "get_committee_clarifications",
+    "get_pending_clarifications",
+    "update_committee_status",
+    "submit_committee_review",
+    "navigate_to_section",
+]
+
 # Register all tools with the MCP server
-mcp.tool()(create_governance_request)
-mcp.tool()(get_user_details_history)
-mcp.tool()(get_governance_report)
-mcp.tool()(get_risk_details)
-mcp.tool()(get_cost_details)
-mcp.tool()(get_environment_details)
-mcp.tool()(create_report)
-mcp.tool()(create_cost_analysis)
-mcp.tool()(create_environment_details)
-mcp.tool()(create_risk_analysis)
-# mcp.tool()(create_cost_clarification)
-# mcp.tool()(update_cost_clarification)
-mcp.tool()(get_cost_clarifications)
-# mcp.tool()(create_environment_clarification)
-# mcp.tool()(update_environment_clarification)
-mcp.tool()(get_environment_clarifications)
-# mcp.tool()(create_committee_clarification)
-mcp.tool()(update_committee_clarification)
-mcp.tool()(get_committee_clarifications)
-mcp.tool()(update_committee_status)
-mcp.tool()(navigate_to_section)
+for tool_name in REGISTERED_TOOLS:
+    mcp.tool()(tool_proxy(tool_name))
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics(request: Request) -> JSONResponse:
+    """Expose cache counters so the MCP server caches can be sized"""
+    from websocket_manager import ws_manager
+    from utilities.snapshot_cache import snapshot_cache
+    from utilities.session_resolver import get_session_cache_stats
+    from utilities.api_helpers import get_fetch_stats, get_broadcast_stats
+    from utilities.resilience import get_resilience_stats
+    from utilities.etag_cache import etag_cache
+    from utilities.projection import get_projection_stats
+    from utilities.clarification_index import clarification_index
+    
+    return JSONResponse({
+        "snapshot_cache": snapshot_cache.stats(),
+        "session_cache": get_session_cache_stats(),
+        "governance_fetch": get_fetch_stats(),
+        "broadcast_dispatcher": get_broadcast_stats(),
+        "backend": get_resilience_stats(),
+        "conditional_get": etag_cache.stats(),
+        "projection": get_projection_stats(),
+        "pending_clarifications": clarification_index.stats(),
+        "websocket": ws_manager.stats()
+    })
 
 
 def start_websocket_server():
     """Start WebSocket server in a separate thread"""
+    from websocket_manager import ws_manager
+    
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
     
     async def run_ws():
-        await ws_manager.start_server(host="0.0.0.0", port=8354)
-        print("WebSocket server running on ws://0.0.0.0:8354")
+        await ws_manager.start_server(host="0.0.0.0", port=WS_PORT)
+        print(f"WebSocket server running on ws://0.0.0.0:{WS_PORT}")
         # Keep the server running
         await asyncio.Future()  # run forever
     
     loop.run_until_complete(run_ws())
 
 
-if __name__ == "__main__":
-    # Start WebSocket server in a separate thread
-    ws_thread = threading.Thread(target=start_websocket_server, daemon=True)
-    ws_thread.start()
-    print("Starting WebSocket server in background thread...")
+def build_asgi_app():
+    """
+    Build the streamable-HTTP MCP app with the WebSocket endpoint mounted at WS_PATH.
+    
+    The WebSocket manager is bound to the app's event loop for the app's
+    lifetime, so tools and WebSocket clients share one loop and one port.
+    """
+    from websocket_manager import ws_manager
+    
+    app = mcp.streamable_http_app()
+    app.router.routes.append(WebSocketRoute(WS_PATH, ws_manager.handle_asgi_client))
+    mcp_lifespan = app.router.lifespan_context
     
-    # Run MCP server (this blocks)
-    print("Starting MCP server on http://0.0.0.0:8351")
-    mcp.run(transport="streamable-http")
+    @contextlib.asynccontextmanager
+    async def lifespan(app):
+        await ws_manager.attach()
+        try:
+            async with mcp_lifespan(app):
+                yield
+        finally:
+            await ws_manager.detach()
+    
+    app.router.lifespan_context = lifespan
+    return app
+
+
+async def run_asgi_server():
+    """Serve MCP and the WebSocket endpoint from one uvicorn server"""
+    import uvicorn
+    
+    config = uvicorn.Config(
+        build_asgi_app(),
+        host=mcp.settings.host,
+        port=mcp.settings.port,
+        log_level=mcp.settings.log_level.lower()
+    )
+    await uvicorn.Server(config).serve()
+
+
+if __name__ == "__main__":
+    if WS_MODE == "asgi":
+        print(f"Starting MCP server on http://0.0.0.0:8351 with WebSocket endpoint ws://0.0.0.0:8351{WS_PATH}")
+        asyncio.run(run_asgi_server())
+    else:
+        # Start WebSocket server in a separate thread
+        ws_thread = threading.Thread(target=start_websocket_server, daemon=True)
+        ws_thread.start()
+        print("Starting WebSocket server in background thread...")
+        
+        # Run MCP server (this blocks)
+        print("Starting MCP server on http://0.0.0.0:8351")
+        mcp.run(transport="streamable-http")
@@ -0,0 +1,204 @@
+"""Test doubles shared by the tests."""
+import asyncio
+import contextlib
+import inspect
+import json
+import threading
+from unittest import mock
+
+import httpx
+
+
+@contextlib.contextmanager
+def serve_backend(handler):
+    """Patch the pooled backend clients so that handler(request) answers every request."""
+    from utilities import backend_client
+    
+    transport = httpx.MockTransport(handler)
+    with mock.patch.object(backend_client, "get_client", return_value=httpx.Client(transport=transport)), \
+            mock.patch.object(backend_client, "get_async_client", return_value=httpx.AsyncClient(transport=transport)):
+        yield
+
+
+class SectionBackend:
+    """
+    Backend answering the governance section GETs of utilities.api_helpers.
+    
+    Every section answers {"data": <section name>} unless a respond(section)
+    function is given (a coroutine function for async fetches); the requested
+    sections are recorded.
+    """
+
+    def __init__(self, respond=None, governance_id: str = "GOV0001"):
+        self.respond = respond or (lambda section: {"data": section})
+        self.governance_id = governance_id
+        self.requested = []
+        self._lock = threading.Lock()
+
+    def section_of(self, url: str) -> str:
+        from utilities.api_helpers import get_section_urls
+        
+        urls = get_section_urls(self.governance_id)
+        return next(section for section, section_url in urls.items() if section_url == url)
+
+    def get_json(self, url: str):
+        section = self.section_of(url)
+        with self._lock:
+            self.requested.append(section)
+        return self.respond(section)
+
+    async def get_json_async(self, url: str):
+        response = self.get_json(url)
+        return await response if inspect.isawaitable(response) else response
+
+    @contextlib.contextmanager
+    def serve(self):
+        """Patch api_helpers to fetch from this backend."""
+        from utilities import api_helpers
+        
+        with mock.patch.object(api_helpers, "get_json", side_effect=self.get_json), \
+                mock.patch.object(api_helpers, "get_json_async", side_effect=self.get_json_async):
+            yield self
+
+
+class WriteBackend:
+    """
+    Backend answering the POST and PUT writes of the tools with {"data": payload}.
+    
+    Writes whose URL ends with one of the failing suffixes are answered with
+    HTTP 500. The written URLs (relative to the API base URL), the peak number
+    of concurrent writes and the queued broadcasts are recorded.
+    """
+
+    def __init__(self, failing=(), governance_id: str = "GOV0001"):
+        self.failing = tuple(failing)
+        self.governance_id = governance_id
+        self.written = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.broadcast = mock.Mock()
+
+    async def write(self, url: str, payload: dict):
+        from utilities.backend_client import BackendHTTPError
+        
+        path = url.split("/api/", 1)[-1]
+        self.written.append(path)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        if path.endswith(self.failing):
+            raise BackendHTTPError(500, '{"message": "failed"}')
+        return {"data": payload}
+
+    @property
+    def broadcast_sections(self):
+        """Sections of the last queued broadcast, or None when nothing was broadcast."""
+        return self.broadcast.call_args.kwargs["sections"] if self.broadcast.called else None
+
+    def run(self, tool_name: str, **kwargs):
+        """Run a tool against this backend and return its result."""
+        from tools import load_tool
+        
+        tool = load_tool(tool_name)
+        with mock.patch("utilities.backend_client.post_json_async", side_effect=self.write), \
+                mock.patch("utilities.backend_client.put_json_async", side_effect=self.write), \
+                mock.patch("utilities.session_resolver.resolve_governance_id_async",
+                           mock.AsyncMock(return_value=self.governance_id)), \
+                mock.patch("utilities.api_helpers.queue_governance_broadcast", self.broadcast), \
+                mock.patch("utilities.api_helpers.patch_governance_section"), \
+                mock.patch("utilities.api_helpers.invalidate_governance_sections"):
+            return asyncio.run(tool(**kwargs))
+
+
+def use_snapshot_cache(test_case, **settings):
+    """
+    Give api_helpers an empty snapshot cache for the duration of a test.
+    
+    Returns:
+        The cache
+    """
+    from utilities import api_helpers
+    from utilities.snapshot_cache import GovernanceSnapshotCache
+    
+    cache = GovernanceSnapshotCache(**{"max_governances": 10, "ttl_seconds": 60, **settings})
+    patcher = mock.patch.object(api_helpers, "snapshot_cache", cache)
+    patcher.start()
+    test_case.addCleanup(patcher.stop)
+    return cache
+
+
+class RespStandIn:
+    """Minimal server speaking the RESP subset used by RedisBackplane."""
+
+    def __init__(self):
+        self.commands = []
+        self.subscribers = {}
+        self.connections = set()
+        self.server = None
+
+    async def start(self) -> int:
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def _handle(self, reader, writer):
+        from utilities.backplane import _encode_command, _read_reply
+        
+        self.connections.add(writer)
+        try:
+            while True:
+                command = await _read_reply(reader)
+                name = command[0].decode().upper()
+                self.commands.append([name] + [arg.decode() for arg in command[1:]])
+                if name == "SUBSCRIBE":
+                    self.subscribers.setdefault(command[1], set()).add(writer)
+                    writer.write(b"*3\r\n$9\r\nsubscribe\r\n" + _encode_command(command[1])[4:] + b":1\r\n")
+                elif name == "PUBLISH":
+                    receivers = list(self.subscribers.get(command[1], ()))
+                    for subscriber in receivers:
+                        subscriber.write(_encode_command("message", command[1], command[2]))
+                    writer.write(f":{len(receivers)}\r\n".encode())
+                else:
+                    writer.write(b"+OK\r\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.drop(writer)
+
+    def drop(self, writer):
+        self.connections.discard(writer)
+        for subscribers in self.subscribers.values():
+            subscribers.discard(writer)
+        writer.close()
+
+    def drop_all(self):
+        """Close every connection, like a server restart."""
+        for writer in list(self.connections):
+            self.drop(writer)
+
+    async def close(self):
+        self.drop_all()
+        self.server.close()
+
+
+class FakeWebSocket:
+    """Client connection recording the messages sent to it."""
+
+    def __init__(self):
+        self.sent = []
+        self.closed = None
+
+    async def send(self, message: str):
+        self.sent.append(json.loads(message))
+
+    async def close(self, code: int = 1000, reason: str = ""):
+        self.closed = (code, reason)
+
+    async def drain(self):
+        """Let the tasks sending to the client run."""
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+    def of_type(self, message_type: str) -> list:
+        return [message for message in self.sent if message.get("type") == message_type]
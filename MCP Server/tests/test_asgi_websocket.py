@@ -0,0 +1,75 @@
+"""Tests of the WebSocket endpoint served from the MCP ASGI app."""
+import asyncio
+import contextlib
+import json
+import unittest
+from unittest import mock
+
+from starlette.applications import Starlette
+from starlette.routing import WebSocketRoute
+from starlette.testclient import TestClient
+
+import websocket_manager
+from websocket_manager import WebSocketManager
+
+
+def _update(value: int) -> dict:
+    return {"governance_id": "GOV0001", "section": "none", "sub_section": "none", "risk_details": {"v": value}}
+
+
+class AsgiWebSocketTest(unittest.TestCase):
+    def setUp(self):
+        self.manager = WebSocketManager()
+
+        @contextlib.asynccontextmanager
+        async def lifespan(app):
+            await self.manager.attach()
+            try:
+                yield
+            finally:
+                await self.manager.detach()
+
+        app = Starlette(routes=[WebSocketRoute("/ws", self.manager.handle_asgi_client)], lifespan=lifespan)
+        self.client = TestClient(app)
+        self.client.__enter__()
+        self.addCleanup(self.client.__exit__, None, None, None)
+        patcher = mock.patch.object(websocket_manager, "ws_manager", self.manager)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_broadcast_on_the_app_loop_reaches_client(self):
+        with self.client.websocket_connect("/ws") as websocket:
+            websocket.send_text(json.dumps({"type": "subscribe", "governance_ids": ["GOV0001"]}))
+            self.assertEqual(json.loads(websocket.receive_text())["type"], "subscribed")
+            # Tools run on the same loop as the endpoint and await the broadcast directly
+            self.client.portal.call(websocket_manager.broadcast_governance_details_async, _update(1))
+            message = json.loads(websocket.receive_text())
+        self.assertEqual(message["type"], "governance_details_update")
+        self.assertEqual(message["data"]["risk_details"], {"v": 1})
+
+    def test_disconnect_unregisters_client(self):
+        with self.client.websocket_connect("/ws") as websocket:
+            websocket.send_text(json.dumps({"type": "hello", "capabilities": ["delta"]}))
+            self.client.portal.call(websocket_manager.broadcast_governance_details_async, _update(1))
+            websocket.receive_text()
+            self.assertEqual(len(self.manager.clients), 1)
+        self.client.portal.call(asyncio.sleep, 0.01)
+        self.assertEqual(len(self.manager.clients), 0)
+
+    def test_detached_manager_skips_broadcast(self):
+        detached = WebSocketManager()
+        with mock.patch.object(websocket_manager, "ws_manager", detached):
+            asyncio.run(websocket_manager.broadcast_governance_details_async(_update(1)))
+        self.assertEqual(detached.governance_state, {})
+
+
+class AsgiAppTest(unittest.TestCase):
+    def test_websocket_route_mounted_on_mcp_app(self):
+        import main
+        from config import WS_PATH
+        app = main.build_asgi_app()
+        self.assertIn(WS_PATH, [route.path for route in app.router.routes])
+
+
+if __name__ == "__main__":
+    unittest.main()
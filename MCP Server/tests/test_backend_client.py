@@ -0,0 +1,308 @@
+"""Tests of the pooled backend client: the shared and per-loop clients, error mapping, retries, circuit breaker probes and conditional GETs."""
+import asyncio
+import threading
+import unittest
+from unittest import mock
+
+import httpx
+
+from tests.fakes import serve_backend
+from utilities import backend_client
+from utilities.etag_cache import etag_cache
+from utilities.resilience import CircuitBreaker, RetryBudget, get_breaker
+
+
+def _open_breaker(url: str) -> CircuitBreaker:
+    """Open the breaker of the URL's endpoint so that the next call is a half-open probe."""
+    breaker = get_breaker(url)
+    breaker.reset_seconds = 0
+    breaker.failure_threshold = 1
+    breaker.record_failure()
+    return breaker
+
+
+class SharedClientTest(unittest.TestCase):
+    def setUp(self):
+        # Start from no client and close the one created by the test
+        patcher = mock.patch.object(backend_client, "_client", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(backend_client.close_client)
+
+    def test_one_client_shared_across_threads(self):
+        clients = []
+        threads = [threading.Thread(target=lambda: clients.append(backend_client.get_client())) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len({id(client) for client in clients}), 1)
+
+    def test_client_uses_configured_pool(self):
+        with mock.patch.object(backend_client.httpx, "Client") as client_class:
+            backend_client.get_client()
+            backend_client.get_client()
+        client_class.assert_called_once()
+        self.assertEqual(client_class.call_args.kwargs["limits"], httpx.Limits(
+            max_connections=backend_client.BACKEND_POOL_SIZE,
+            max_keepalive_connections=backend_client.BACKEND_POOL_KEEPALIVE,
+            keepalive_expiry=backend_client.BACKEND_KEEPALIVE_EXPIRY
+        ))
+
+    def test_closed_client_is_replaced(self):
+        client = backend_client.get_client()
+        backend_client.close_client()
+        self.assertTrue(client.is_closed)
+        self.assertIsNot(backend_client.get_client(), client)
+
+
+class AsyncClientPerLoopTest(unittest.TestCase):
+    def test_each_loop_keeps_its_own_client(self):
+        async def twice():
+            return backend_client.get_async_client(), backend_client.get_async_client()
+
+        first, second = asyncio.run(twice())
+        self.assertIs(first, second)
+
+        other = {}
+        thread = threading.Thread(target=lambda: other.update(pair=asyncio.run(twice())))
+        thread.start()
+        thread.join()
+        self.assertIsNot(other["pair"][0], first)
+
+    def test_another_loop_does_not_replace_the_client_of_a_running_loop(self):
+        async def main():
+            client = backend_client.get_async_client()
+            thread = threading.Thread(target=lambda: asyncio.run(self._use_client()))
+            thread.start()
+            thread.join()
+            self.assertIs(backend_client.get_async_client(), client)
+            self.assertFalse(client.is_closed)
+            await backend_client.close_async_client()
+            self.assertTrue(client.is_closed)
+            self.assertIsNot(backend_client.get_async_client(), client)
+            await backend_client.close_async_client()
+
+        asyncio.run(main())
+
+    @staticmethod
+    async def _use_client():
+        backend_client.get_async_client()
+        await backend_client.close_async_client()
+
+
+class ErrorMappingTest(unittest.TestCase):
+    def test_error_status_raised_with_backend_message(self):
+        with serve_backend(lambda request: httpx.Response(404, json={"message": "Governance not found"})):
+            with self.assertRaises(backend_client.BackendHTTPError) as raised:
+                backend_client.get_json("http://backend/api/governance/GOV0404")
+        self.assertEqual(raised.exception.to_error_dict(endpoint="governance"), {
+            "error": "HTTP 404: Governance not found", "status_code": 404, "endpoint": "governance"
+        })
+
+    def test_transport_error_raised_as_connection_error(self):
+        def refuse(request):
+            raise httpx.ConnectError("connection refused")
+
+        with serve_backend(refuse):
+            with self.assertRaisesRegex(backend_client.BackendConnectionError, "connection refused"):
+                backend_client.post_json("http://backend/api/governance", {"a": 1})
+
+    def test_async_requests_map_errors_the_same_way(self):
+        with serve_backend(lambda request: httpx.Response(404, json={"message": "Governance not found"})):
+            with self.assertRaises(backend_client.BackendHTTPError) as raised:
+                asyncio.run(backend_client.get_json_async("http://backend/api/governance/GOV0404"))
+        self.assertEqual(raised.exception.status_code, 404)
+
+
+class AsyncToolTest(unittest.TestCase):
+    def test_tool_awaits_the_async_client(self):
+        from tools.get_risk_details import get_risk_details
+
+        seen = []
+
+        def handler(request):
+            seen.append(str(request.url))
+            return httpx.Response(200, json={"data": [{"risk_level": "high"}]})
+
+        with serve_backend(handler):
+            self.assertEqual(asyncio.run(get_risk_details("GOV0001")), {"risk_level": "high"})
+        self.assertTrue(seen[0].endswith("/GOV0001"))
+
+
+class RetryTest(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch("utilities.backend_client.time.sleep")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self._use_budget(RetryBudget(0.2, 10))
+
+    def _use_budget(self, budget: RetryBudget):
+        for target in ("utilities.resilience.retry_budget", "utilities.backend_client.retry_budget"):
+            patcher = mock.patch(target, budget)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _request(self, method: str, url: str, statuses: list):
+        """Send a request to a backend answering with the given statuses in turn; returns (result or error, attempts)."""
+        responses = iter(statuses)
+        attempts = []
+
+        def handler(request):
+            attempts.append(request.method)
+            status = next(responses)
+            return httpx.Response(status, json={"status": status})
+
+        with serve_backend(handler):
+            try:
+                return backend_client.request_json(method, url, {} if method != "GET" else None), len(attempts)
+            except backend_client.BackendHTTPError as e:
+                return e, len(attempts)
+
+    def test_get_retried_on_unavailable_backend(self):
+        result, attempts = self._request("GET", "http://backend/api/retry-get/GOV0001", [503, 502, 200])
+        self.assertEqual(result, {"status": 200})
+        self.assertEqual(attempts, 3)
+
+    def test_get_gives_up_after_max_attempts(self):
+        with mock.patch("utilities.resilience.BACKEND_RETRY_ATTEMPTS", 2):
+            error, attempts = self._request("GET", "http://backend/api/retry-exhausted/GOV0001", [503, 503, 200])
+        self.assertEqual(error.status_code, 503)
+        self.assertEqual(attempts, 2)
+
+    def test_client_errors_and_writes_not_retried(self):
+        error, attempts = self._request("GET", "http://backend/api/retry-missing/GOV0001", [404, 200])
+        self.assertEqual((error.status_code, attempts), (404, 1))
+        error, attempts = self._request("POST", "http://backend/api/retry-post/GOV0001", [503, 200])
+        self.assertEqual((error.status_code, attempts), (503, 1))
+
+    def test_retried_get_counted_once_in_validator_stats(self):
+        url = "http://backend/api/retry-etag/GOV0001"
+        etag_cache.store(url, '"v1"', b'{"data": [1]}')
+        result, attempts = self._request("GET", url, [503, 200])
+        self.assertEqual((result, attempts), ({"status": 200}, 2))
+        stats = etag_cache.stats()["endpoints"]["retry-etag"]
+        self.assertEqual((stats["requests"], stats["conditional"]), (1, 1))
+
+    def test_empty_retry_budget_stops_retries(self):
+        budget = RetryBudget(0, 0)
+        self._use_budget(budget)
+        error, attempts = self._request("GET", "http://backend/api/retry-budget/GOV0001", [503, 200])
+        self.assertEqual((error.status_code, attempts), (503, 1))
+        self.assertEqual(budget.stats()["exhausted"], 1)
+
+
+class CircuitBreakerTest(unittest.TestCase):
+    def test_open_breaker_fails_fast(self):
+        url = "http://backend/api/breaker-open/GOV0001"
+        breaker = get_breaker(url)
+        breaker.failure_threshold = 2
+        calls = []
+
+        def handler(request):
+            calls.append(request.url)
+            return httpx.Response(500, json={"message": "boom"})
+
+        with serve_backend(handler):
+            for _ in range(2):
+                with self.assertRaises(backend_client.BackendHTTPError):
+                    backend_client.post_json(url, {})
+            with self.assertRaises(backend_client.BackendCircuitOpenError) as raised:
+                backend_client.post_json(url, {})
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(raised.exception.endpoint, "breaker-open")
+        self.assertEqual(breaker.stats()["rejected"], 1)
+
+
+class HalfOpenProbeTest(unittest.TestCase):
+    def test_cancelled_probe_is_released(self):
+        url = "http://backend/api/probe-cancelled/GOV0001"
+        breaker = _open_breaker(url)
+
+        async def hang(request):
+            await asyncio.sleep(10)
+
+        async def main():
+            with serve_backend(hang):
+                task = asyncio.ensure_future(backend_client.get_json_async(url))
+                await asyncio.sleep(0.05)
+                task.cancel()
+                with self.assertRaises(asyncio.CancelledError):
+                    await task
+
+        asyncio.run(main())
+        self.assertTrue(breaker.allow())
+
+    def test_cancelled_call_does_not_release_another_calls_probe(self):
+        url = "http://backend/api/probe-not-owned/GOV0001"
+        breaker = get_breaker(url)
+
+        async def hang(request):
+            await asyncio.sleep(10)
+
+        async def main():
+            with serve_backend(hang):
+                # Sent while the breaker is closed, so it does not hold the probe
+                task = asyncio.ensure_future(backend_client.get_json_async(url))
+                await asyncio.sleep(0.05)
+                _open_breaker(url)
+                self.assertEqual(breaker.admit(), (True, True))
+                task.cancel()
+                with self.assertRaises(asyncio.CancelledError):
+                    await task
+
+        asyncio.run(main())
+        self.assertFalse(breaker.allow())
+
+    def test_probe_failing_with_other_error_is_released(self):
+        url = "http://backend/api/probe-error/GOV0001"
+        breaker = _open_breaker(url)
+
+        def fail(request):
+            raise ValueError("unexpected")
+
+        with serve_backend(fail):
+            with self.assertRaises(ValueError):
+                backend_client.get_json(url)
+        self.assertTrue(breaker.allow())
+
+    def test_probe_outcome_closes_breaker(self):
+        url = "http://backend/api/probe-success/GOV0001"
+        breaker = _open_breaker(url)
+        with serve_backend(lambda request: httpx.Response(200, json={"ok": True})):
+            self.assertEqual(backend_client.get_json(url), {"ok": True})
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+
+class NotModifiedTest(unittest.TestCase):
+    def test_not_modified_without_stored_body_is_fetched_again(self):
+        url = "http://backend/api/not-modified-proxy/GOV0001"
+        requests = []
+
+        def handler(request):
+            requests.append(dict(request.headers))
+            if len(requests) == 1:
+                return httpx.Response(304)
+            return httpx.Response(200, json={"data": [1]})
+
+        with serve_backend(handler):
+            self.assertEqual(backend_client.get_json(url), {"data": [1]})
+        self.assertEqual(len(requests), 2)
+        self.assertEqual(requests[1].get("cache-control"), "no-cache")
+
+    def test_not_modified_with_stored_body_serves_it(self):
+        url = "http://backend/api/not-modified-cached/GOV0001"
+        etag_cache.store(url, '"v1"', b'{"data": [2]}')
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers.get("if-none-match"))
+            return httpx.Response(304)
+
+        with serve_backend(handler):
+            self.assertEqual(backend_client.get_json(url), {"data": [2]})
+        self.assertEqual(seen, ['"v1"'])
+
+
+if __name__ == "__main__":
+    unittest.main()
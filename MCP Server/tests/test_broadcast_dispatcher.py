@@ -0,0 +1,149 @@
+"""Tests of the background broadcast dispatcher."""
+import threading
+import time
+import unittest
+from unittest import mock
+
+from utilities.broadcast_dispatcher import BroadcastDispatcher
+
+
+class RecordingBroadcast:
+    """Broadcast function recording calls, threads and concurrency; blocks until released."""
+
+    def __init__(self, block: bool = False):
+        self.calls = []
+        self.threads = set()
+        self.running = {}
+        self.max_running = 0
+        self.max_running_same = 0
+        self.release = threading.Event()
+        if not block:
+            self.release.set()
+        self.lock = threading.Lock()
+        self.done = threading.Condition(self.lock)
+
+    def __call__(self, governance_id, section, sub_section, sections):
+        with self.lock:
+            self.threads.add(threading.get_ident())
+            self.running[governance_id] = self.running.get(governance_id, 0) + 1
+            self.max_running = max(self.max_running, sum(self.running.values()))
+            self.max_running_same = max(self.max_running_same, self.running[governance_id])
+        self.release.wait(5)
+        with self.lock:
+            self.running[governance_id] -= 1
+            self.calls.append((governance_id, section, sub_section, sections))
+            self.done.notify_all()
+
+    def wait_calls(self, count: int, timeout: float = 5.0):
+        with self.lock:
+            self.done.wait_for(lambda: len(self.calls) >= count, timeout)
+            return list(self.calls)
+
+
+class BroadcastDispatcherTest(unittest.TestCase):
+    def test_submit_does_not_block_on_broadcast(self):
+        broadcast = RecordingBroadcast(block=True)
+        dispatcher = BroadcastDispatcher(broadcast, window_seconds=0.0, max_pending=10, max_workers=2)
+        started = time.monotonic()
+        dispatcher.submit("g1")
+        dispatcher.submit("g2")
+        self.assertLess(time.monotonic() - started, 0.5)
+        broadcast.release.set()
+        self.assertEqual(len(broadcast.wait_calls(2)), 2)
+        self.assertNotIn(threading.get_ident(), broadcast.threads)
+
+    def test_different_governances_broadcast_concurrently(self):
+        broadcast = RecordingBroadcast(block=True)
+        dispatcher = BroadcastDispatcher(broadcast, window_seconds=0.0, max_pending=10, max_workers=3)
+        for gid in ("g1", "g2", "g3"):
+            dispatcher.submit(gid)
+        deadline = time.monotonic() + 5
+        while dispatcher.stats()["in_flight"] < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        broadcast.release.set()
+        broadcast.wait_calls(3)
+        self.assertEqual(broadcast.max_running, 3)
+
+    def test_same_governance_never_overlaps_and_merges(self):
+        broadcast = RecordingBroadcast(block=True)
+        dispatcher = BroadcastDispatcher(broadcast, window_seconds=0.0, max_pending=10, max_workers=4)
+        dispatcher.submit("g1", sections=["a"])
+        deadline = time.monotonic() + 5
+        while dispatcher.stats()["in_flight"] < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        # Queued while the first broadcast of g1 is running: merged and sent afterwards
+        dispatcher.submit("g1", sections=["b"])
+        dispatcher.submit("g1", "risk", "details", sections=["c"])
+        time.sleep(0.1)
+        broadcast.release.set()
+        calls = broadcast.wait_calls(2)
+        self.assertEqual(broadcast.max_running_same, 1)
+        self.assertEqual(calls, [("g1", "none", "none", ["a"]), ("g1", "risk", "details", ["b", "c"])])
+        self.assertEqual(dispatcher.stats()["merge_ratio"], 1.5)
+
+    def test_overflow_is_shed_not_run_inline(self):
+        broadcast = RecordingBroadcast(block=True)
+        dispatcher = BroadcastDispatcher(broadcast, window_seconds=10.0, max_pending=2, max_workers=1)
+        for gid in ("g1", "g2", "g3"):
+            dispatcher.submit(gid)
+        stats = dispatcher.stats()
+        self.assertEqual(stats["overflow"], 1)
+        self.assertEqual(stats["queue_depth"], 2)
+        self.assertEqual(broadcast.calls, [])
+        self.assertEqual(broadcast.threads, set())
+
+    def test_dispatch_now_runs_off_thread_and_is_bounded(self):
+        broadcast = RecordingBroadcast(block=True)
+        dispatcher = BroadcastDispatcher(broadcast, window_seconds=10.0, max_pending=2, max_workers=2)
+        for _ in range(3):
+            dispatcher.dispatch_now("g1", sections=["a"])
+        self.assertEqual(dispatcher.stats()["overflow"], 1)
+        broadcast.release.set()
+        self.assertEqual(broadcast.wait_calls(2), [("g1", "none", "none", ["a"])] * 2)
+        self.assertNotIn(threading.get_ident(), broadcast.threads)
+
+    def test_intents_merged_within_window(self):
+        broadcast = RecordingBroadcast()
+        dispatcher = BroadcastDispatcher(broadcast, window_seconds=0.05, max_pending=10, max_workers=2)
+        dispatcher.submit("g1", sections=["risk_details"])
+        dispatcher.submit("g2", sections=["cost_details"])
+        dispatcher.submit("g1", "risk_details", "none", sections=["committee_clarifications", "risk_details"])
+        calls = broadcast.wait_calls(2)
+        self.assertEqual(calls, [
+            ("g1", "risk_details", "none", ["risk_details", "committee_clarifications"]),
+            ("g2", "none", "none", ["cost_details"])
+        ])
+        self.assertEqual(dispatcher.stats()["merge_ratio"], 1.5)
+
+    def test_later_none_intent_keeps_navigation(self):
+        broadcast = RecordingBroadcast()
+        dispatcher = BroadcastDispatcher(broadcast, window_seconds=0.05, max_pending=10, max_workers=2)
+        dispatcher.submit("g1", "risk_details", "none", sections=["a"])
+        dispatcher.submit("g1", sections=["b"])
+        self.assertEqual(broadcast.wait_calls(1), [("g1", "risk_details", "none", ["a", "b"])])
+
+    def test_drop_navigation_keeps_sections(self):
+        broadcast = RecordingBroadcast()
+        dispatcher = BroadcastDispatcher(broadcast, window_seconds=0.05, max_pending=10, max_workers=2)
+        dispatcher.submit("g1", "commitee_approval", "Risk", sections=["risk_details"])
+        dispatcher.drop_navigation("g1")
+        self.assertEqual(broadcast.wait_calls(1), [("g1", "none", "none", ["risk_details"])])
+
+    def test_full_broadcast_absorbs_partial(self):
+        broadcast = RecordingBroadcast()
+        dispatcher = BroadcastDispatcher(broadcast, window_seconds=0.05, max_pending=10, max_workers=2)
+        dispatcher.submit("g1", sections=["risk_details"])
+        dispatcher.submit("g1")
+        self.assertEqual(broadcast.wait_calls(1), [("g1", "none", "none", None)])
+
+    def test_failed_broadcast_counted(self):
+        dispatcher = BroadcastDispatcher(mock.Mock(side_effect=RuntimeError("backend down")), window_seconds=0.0, max_pending=10, max_workers=2)
+        dispatcher.submit("g1")
+        deadline = time.monotonic() + 5
+        while dispatcher.stats()["dispatched"] < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(dispatcher.stats()["failed"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
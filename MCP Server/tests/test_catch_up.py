@@ -0,0 +1,122 @@
+"""Tests of the sequence-numbered catch-up of re-subscribing WebSocket clients."""
+import unittest
+from unittest import mock
+
+from tests.fakes import FakeWebSocket
+from utilities.snapshot_cache import snapshot_cache
+from websocket_manager import WebSocketManager
+
+
+def _update(governance_id: str, section: str = "none", **sections) -> dict:
+    return {"governance_id": governance_id, "section": section, "sub_section": "none", **sections}
+
+
+class SequenceTest(unittest.TestCase):
+    def test_seq_stays_monotonic_across_eviction(self):
+        manager = WebSocketManager()
+        with mock.patch("websocket_manager.WS_STATE_MAX_GOVERNANCES", 1):
+            manager._apply_governance_update(_update("G1", risk_details={"v": 1}))
+            manager._apply_governance_update(_update("G1", risk_details={"v": 2}))
+            seq_before_eviction = manager.governance_state["G1"]["seq"]
+            manager._apply_governance_update(_update("G2", risk_details={"v": 1}))
+            self.assertNotIn("G1", manager.governance_state)
+            manager._apply_governance_update(_update("G1", risk_details={"v": 3}))
+        self.assertGreater(manager.governance_state["G1"]["seq"], seq_before_eviction)
+
+    def test_replay_floor_follows_ring(self):
+        manager = WebSocketManager()
+        with mock.patch("websocket_manager.WS_REPLAY_BUFFER_SIZE", 2):
+            for n in range(4):
+                manager._apply_governance_update(_update("G1", risk_details={"v": n}))
+        state = manager.governance_state["G1"]
+        self.assertEqual([seq for seq, _ in state["changes"]], [3, 4])
+        self.assertEqual(state["replay_floor"], 2)
+
+
+class CatchUpTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.manager = WebSocketManager()
+        self.client = FakeWebSocket()
+        await self.manager.register(self.client)
+
+    async def asyncTearDown(self):
+        await self.manager.unregister(self.client)
+        snapshot_cache.clear()
+
+    def _broadcast(self, **sections):
+        self.manager._apply_governance_update(_update("G1", section="risk", **sections))
+        return self.manager.governance_state["G1"]["seq"]
+
+    async def _catch_up(self, last_seq, epoch=None):
+        await self.manager.send_catch_up(self.client, ["G1"], epoch or self.manager.epoch, {"G1": last_seq})
+        await self.client.drain()
+        return self.client.of_type("governance_details_update")
+
+    async def test_replay_sends_missed_sections_without_navigation(self):
+        seq = self._broadcast(risk_details={"v": 1}, cost_details={"v": 1})
+        self._broadcast(cost_details={"v": 2})
+        messages = await self._catch_up(seq)
+        self.assertEqual(len(messages), 1)
+        data = messages[0]["data"]
+        self.assertTrue(data["partial"])
+        self.assertEqual(data["cost_details"], {"v": 2})
+        self.assertNotIn("risk_details", data)
+        self.assertEqual((data["section"], data["sub_section"]), ("none", "none"))
+        self.assertEqual(messages[0]["seq"], self.manager.governance_state["G1"]["seq"])
+        self.assertEqual(self.manager.catch_up_counts["replayed"], 1)
+
+    async def test_snapshot_when_ring_does_not_cover_client(self):
+        with mock.patch("websocket_manager.WS_REPLAY_BUFFER_SIZE", 1):
+            seq = self._broadcast(risk_details={"v": 1})
+            self._broadcast(risk_details={"v": 2})
+            self._broadcast(cost_details={"v": 1})
+        messages = await self._catch_up(seq)
+        data = messages[0]["data"]
+        self.assertNotIn("partial", data)
+        self.assertEqual(data["risk_details"], {"v": 2})
+        self.assertEqual((data["section"], data["sub_section"]), ("none", "none"))
+        self.assertEqual(self.manager.catch_up_counts["snapshot"], 1)
+
+    async def test_snapshot_for_sequence_from_evicted_state(self):
+        with mock.patch("websocket_manager.WS_STATE_MAX_GOVERNANCES", 1):
+            seq = self._broadcast(risk_details={"v": 1})
+            self.manager._apply_governance_update(_update("G2", risk_details={"v": 1}))
+            self._broadcast(risk_details={"v": 2})
+        messages = await self._catch_up(seq)
+        self.assertNotIn("partial", messages[0]["data"])
+        self.assertEqual(self.manager.catch_up_counts["snapshot"], 1)
+
+    async def test_current_client_gets_nothing(self):
+        seq = self._broadcast(risk_details={"v": 1})
+        self.assertEqual(await self._catch_up(seq), [])
+        self.assertEqual(self.manager.catch_up_counts["current"], 1)
+
+    async def test_other_epoch_gets_snapshot(self):
+        seq = self._broadcast(risk_details={"v": 1})
+        messages = await self._catch_up(seq, epoch="old-epoch")
+        self.assertEqual(len(messages), 1)
+        self.assertEqual(self.manager.catch_up_counts["snapshot"], 1)
+
+    async def test_resync_does_not_navigate(self):
+        self._broadcast(risk_details={"v": 1})
+        await self.manager.send_resync(self.client, "G1")
+        await self.client.drain()
+        data = self.client.of_type("governance_details_update")[0]["data"]
+        self.assertEqual((data["section"], data["sub_section"]), ("none", "none"))
+
+    async def test_broadcasts_numbered_in_order(self):
+        await self.manager.subscribe(self.client, governance_ids=["G1"])
+        for n in range(2):
+            await self.manager.broadcast_governance_details(_update("G1", risk_details={"v": n}))
+        await self.client.drain()
+        self.assertEqual([message["seq"] for message in self.client.of_type("governance_details_update")], [1, 2])
+
+    async def test_broadcast_still_navigates(self):
+        await self.manager.subscribe(self.client, governance_ids=["G1"])
+        await self.manager.broadcast_governance_details(_update("G1", section="risk", risk_details={"v": 1}))
+        await self.client.drain()
+        self.assertEqual(self.client.of_type("governance_details_update")[0]["data"]["section"], "risk")
+
+
+if __name__ == "__main__":
+    unittest.main()
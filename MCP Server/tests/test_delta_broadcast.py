@@ -0,0 +1,102 @@
+import json
+import unittest
+
+from tests.fakes import FakeWebSocket
+from utilities.json_patch import content_hash, make_patch
+from websocket_manager import WebSocketManager
+
+
+def _chat(*events):
+    return {"data": {"chat_history": {"id": "S1", "events": list(events)}}}
+
+
+def _update(**sections) -> dict:
+    return {"governance_id": "G1", "section": "none", "sub_section": "none", **sections}
+
+
+class JsonPatchTest(unittest.TestCase):
+    def test_objects_diffed_key_by_key(self):
+        old = {"a": 1, "b": {"c": 1, "d": 2}, "gone": True}
+        new = {"a": 1, "b": {"c": 2, "d": 2}, "new": [1]}
+        self.assertEqual(make_patch(old, new), [
+            {"op": "remove", "path": "/gone"},
+            {"op": "replace", "path": "/b/c", "value": 2},
+            {"op": "add", "path": "/new", "value": [1]}
+        ])
+
+    def test_lists_replaced_whole_and_keys_escaped(self):
+        self.assertEqual(make_patch({"a/b~": [1]}, {"a/b~": [1, 2]}),
+                         [{"op": "replace", "path": "/a~1b~0", "value": [1, 2]}])
+
+    def test_equal_values_give_empty_patch(self):
+        self.assertEqual(make_patch({"a": [1]}, {"a": [1]}), [])
+
+    def test_content_hash_ignores_key_order(self):
+        self.assertEqual(content_hash({"a": 1, "b": 2}), content_hash({"b": 2, "a": 1}))
+        self.assertNotEqual(content_hash({"a": 1}), content_hash({"a": 2}))
+
+
+class DeltaBroadcastTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.manager = WebSocketManager()
+        self.delta_client = FakeWebSocket()
+        self.plain_client = FakeWebSocket()
+        for client in (self.delta_client, self.plain_client):
+            await self.manager.register(client)
+        await self.manager.handle_client_message(self.delta_client, json.dumps({"type": "hello", "capabilities": ["delta"]}))
+
+    async def asyncTearDown(self):
+        for client in (self.delta_client, self.plain_client):
+            await self.manager.unregister(client)
+
+    async def _broadcast(self, **sections):
+        await self.manager.broadcast_governance_details(_update(**sections))
+        for client in (self.delta_client, self.plain_client):
+            await client.drain()
+
+    async def test_first_broadcast_full_then_patch(self):
+        await self._broadcast(risk_details={"level": "low", "reason": "r"}, cost_details={"v": 1})
+        first_hash = self.manager.governance_state["G1"]["hash"]
+        await self._broadcast(risk_details={"level": "high", "reason": "r"}, cost_details={"v": 1})
+        self.assertEqual(len(self.delta_client.of_type("governance_details_update")), 1)
+        delta = self.delta_client.of_type("governance_details_delta")[0]
+        self.assertEqual(delta["base_hash"], first_hash)
+        self.assertEqual(delta["hash"], self.manager.governance_state["G1"]["hash"])
+        self.assertEqual(delta["patch"], [{"op": "replace", "path": "/risk_details/level", "value": "high"}])
+        # Clients without the capability receive the changed sections instead
+        second = self.plain_client.of_type("governance_details_update")[1]["data"]
+        self.assertTrue(second["partial"])
+        self.assertEqual(second["risk_details"], {"level": "high", "reason": "r"})
+        self.assertNotIn("cost_details", second)
+
+    async def test_new_section_added_whole(self):
+        await self._broadcast(risk_details={"v": 1})
+        await self._broadcast(cost_details={"v": 1})
+        delta = self.delta_client.of_type("governance_details_delta")[0]
+        self.assertEqual(delta["patch"], [{"op": "add", "path": "/cost_details", "value": {"v": 1}}])
+
+    async def test_chat_history_sends_appended_events(self):
+        await self._broadcast(chat_history=_chat("e1", "e2"))
+        await self._broadcast(chat_history=_chat("e1", "e2", "e3"))
+        delta = self.delta_client.of_type("governance_details_delta")[0]
+        self.assertEqual(delta["chat_events"], {"cursor": 2, "events": ["e3"]})
+        self.assertEqual(delta["patch"], [])
+
+    async def test_rewritten_chat_history_patched(self):
+        await self._broadcast(chat_history=_chat("e1", "e2"))
+        await self._broadcast(chat_history=_chat("x1"))
+        delta = self.delta_client.of_type("governance_details_delta")[0]
+        self.assertIsNone(delta["chat_events"])
+        self.assertEqual(delta["patch"], [{"op": "replace", "path": "/chat_history/data/chat_history/events", "value": ["x1"]}])
+
+    async def test_unchanged_broadcast_skipped(self):
+        await self._broadcast(risk_details={"v": 1})
+        seq = self.manager.seq
+        await self._broadcast(risk_details={"v": 1})
+        self.assertEqual(self.manager.seq, seq)
+        self.assertEqual(len(self.delta_client.sent), 1)
+        self.assertEqual(len(self.plain_client.sent), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
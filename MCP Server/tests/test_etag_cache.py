@@ -0,0 +1,108 @@
+"""Tests of the ETag store and the conditional GETs of the backend client."""
+import unittest
+from unittest import mock
+
+import httpx
+
+from tests.fakes import serve_backend
+from utilities import backend_client
+from utilities.etag_cache import ETagCache
+
+
+class ETagCacheTest(unittest.TestCase):
+    def test_store_and_lookup(self):
+        cache = ETagCache(max_entries=10)
+        url = "http://backend/api/governance/GOV0001"
+        self.assertIsNone(cache.lookup(url))
+        cache.store(url, '"v1"', b'{"a": 1}')
+        self.assertEqual(cache.lookup(url), ('"v1"', b'{"a": 1}'))
+
+    def test_response_without_etag_drops_entry(self):
+        cache = ETagCache(max_entries=10)
+        url = "http://backend/api/governance/GOV0001"
+        cache.store(url, '"v1"', b'{}')
+        cache.store(url, None, b'{}')
+        self.assertIsNone(cache.lookup(url))
+
+    def test_least_recently_used_evicted(self):
+        cache = ETagCache(max_entries=2)
+        for n in range(2):
+            cache.store(f"http://backend/api/items/{n}", f'"v{n}"', b'{}')
+        cache.lookup("http://backend/api/items/0")
+        cache.store("http://backend/api/items/2", '"v2"', b'{}')
+        self.assertIsNotNone(cache.lookup("http://backend/api/items/0"))
+        self.assertIsNone(cache.lookup("http://backend/api/items/1"))
+
+    def test_disabled_cache_stores_nothing(self):
+        cache = ETagCache(max_entries=10, enabled=False)
+        cache.store("http://backend/api/items/0", '"v0"', b'{}')
+        self.assertIsNone(cache.lookup("http://backend/api/items/0"))
+        self.assertEqual(cache.stats()["entries"], 0)
+
+    def test_not_modified_ratio_per_endpoint(self):
+        cache = ETagCache(max_entries=10)
+        url = "http://backend/api/governance/GOV0001"
+        cache.lookup(url)
+        cache.store(url, '"v1"', b'12345')
+        cache.lookup(url)
+        cache.record_not_modified(url, b'12345')
+        endpoints = cache.stats()["endpoints"]
+        self.assertEqual(len(endpoints), 1)
+        stats = next(iter(endpoints.values()))
+        self.assertEqual((stats["requests"], stats["conditional"], stats["not_modified"]), (2, 1, 1))
+        self.assertEqual(stats["bytes_saved"], 5)
+        self.assertEqual(stats["not_modified_ratio"], 0.5)
+
+
+class ConditionalGetTest(unittest.TestCase):
+    def setUp(self):
+        self.cache = ETagCache(max_entries=10)
+        patcher = mock.patch.object(backend_client, "etag_cache", self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_second_get_is_conditional_and_served_from_store(self):
+        url = "http://backend/api/conditional/GOV0001"
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers.get("if-none-match"))
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304, headers={"ETag": '"v1"'})
+            return httpx.Response(200, json={"data": [1]}, headers={"ETag": '"v1"'})
+
+        with serve_backend(handler):
+            first = backend_client.get_json(url)
+            first["data"].append("changed by caller")
+            second = backend_client.get_json(url)
+        self.assertEqual(seen, [None, '"v1"'])
+        # Each request decodes the stored body, so callers never share a response object
+        self.assertEqual(second, {"data": [1]})
+
+    def test_changed_resource_replaces_stored_body(self):
+        url = "http://backend/api/conditional-changed/GOV0001"
+        responses = iter([
+            httpx.Response(200, json={"v": 1}, headers={"ETag": '"v1"'}),
+            httpx.Response(200, json={"v": 2}, headers={"ETag": '"v2"'})
+        ])
+        with serve_backend(lambda request: next(responses)):
+            backend_client.get_json(url)
+            self.assertEqual(backend_client.get_json(url), {"v": 2})
+        self.assertEqual(self.cache.lookup(url)[0], '"v2"')
+
+    def test_writes_are_not_conditional(self):
+        url = "http://backend/api/conditional-write/GOV0001"
+        self.cache.store(url, '"v1"', b'{}')
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers.get("if-none-match"))
+            return httpx.Response(201, json={"ok": True})
+
+        with serve_backend(handler):
+            backend_client.post_json(url, {"a": 1})
+        self.assertEqual(seen, [None])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,231 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest import mock
+
+from tests.fakes import SectionBackend, use_snapshot_cache
+from utilities import api_helpers
+from utilities.backend_client import BackendHTTPError
+
+SECTIONS = ("governance_report", "risk_details", "cost_details")
+
+
+class FetchTestCase(unittest.TestCase):
+    def setUp(self):
+        # An empty cache per test, so every section is fetched from the backend
+        self.cache = use_snapshot_cache(self)
+
+
+class ConcurrentFetchTest(FetchTestCase):
+    def test_sections_fetched_concurrently(self):
+        # Every request waits until all sections are requested at the same time
+        barrier = threading.Barrier(len(SECTIONS), timeout=5)
+
+        def respond(section):
+            barrier.wait()
+            return {"data": section}
+
+        with SectionBackend(respond).serve():
+            data = api_helpers.fetch_governance_sections("GOV0001", SECTIONS)
+        self.assertEqual(data, {section: {"data": section} for section in SECTIONS})
+
+    def test_failing_section_does_not_fail_the_others(self):
+        def respond(section):
+            if section == "risk_details":
+                raise BackendHTTPError(500, '{"message": "boom"}')
+            return {"data": section}
+
+        with SectionBackend(respond).serve():
+            data = api_helpers.fetch_governance_sections("GOV0001", SECTIONS)
+        self.assertEqual(data["governance_report"], {"data": "governance_report"})
+        self.assertEqual(data["risk_details"]["status_code"], 500)
+        self.assertEqual(data["risk_details"]["endpoint"], "risk_details")
+        # Errors are not cached, so the section is fetched again next time
+        self.assertIsNone(self.cache.get("GOV0001", "risk_details"))
+
+    def test_async_sections_fetched_concurrently(self):
+        running = []
+        peak = []
+
+        async def respond(section):
+            running.append(section)
+            await asyncio.sleep(0.01)
+            peak.append(len(running))
+            running.remove(section)
+            return {"data": section}
+
+        with SectionBackend(respond).serve():
+            data = asyncio.run(api_helpers.fetch_governance_sections_async("GOV0001", SECTIONS))
+        self.assertEqual(data, {section: {"data": section} for section in SECTIONS})
+        self.assertEqual(max(peak), len(SECTIONS))
+
+    def test_all_sections_aggregated(self):
+        backend = SectionBackend()
+        with backend.serve():
+            data = api_helpers.fetch_all_governance_data("GOV0001", section="risk_details")
+        self.assertEqual(sorted(backend.requested), sorted(api_helpers.GOVERNANCE_SECTIONS))
+        self.assertEqual((data["governance_id"], data["section"], data["sub_section"]), ("GOV0001", "risk_details", "none"))
+        self.assertEqual(data["cost_details"], {"data": "cost_details"})
+
+
+class CoalescedFetchTest(FetchTestCase):
+    def setUp(self):
+        super().setUp()
+        self.flight = api_helpers._SingleFlight()
+        patcher = mock.patch.object(api_helpers, "_fetch_flight", self.flight)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _wait_coalesced(self, count: int):
+        while self.flight.stats()["coalesced"] < count:
+            time.sleep(0.001)
+
+    def test_concurrent_callers_share_one_fetch(self):
+        release = threading.Event()
+
+        def respond(section):
+            # Hold the leader's fetch open until the second caller has joined it
+            release.wait(timeout=5)
+            return {"data": section}
+
+        def release_when_coalesced():
+            self._wait_coalesced(1)
+            release.set()
+
+        backend = SectionBackend(respond)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(
+                api_helpers.fetch_governance_sections("GOV0001", SECTIONS, use_cache=False)))
+            for _ in range(2)
+        ]
+        threading.Thread(target=release_when_coalesced, daemon=True).start()
+        with backend.serve():
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=5)
+        self.assertEqual(len(backend.requested), len(SECTIONS))
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(self.flight.stats(), {"in_flight": 0, "executions": 1, "coalesced": 1})
+
+    def test_invalidation_starts_a_new_fetch(self):
+        backend = SectionBackend()
+        with backend.serve():
+            api_helpers.fetch_governance_sections("GOV0001", SECTIONS, use_cache=False)
+            self.cache.invalidate("GOV0001")
+            api_helpers.fetch_governance_sections("GOV0001", SECTIONS, use_cache=False)
+        self.assertEqual(len(backend.requested), 2 * len(SECTIONS))
+        self.assertEqual(self.flight.stats()["coalesced"], 0)
+
+    def test_leader_failure_raised_to_waiters(self):
+        started = threading.Event()
+        release = threading.Event()
+        errors = []
+
+        def leader():
+            started.set()
+            release.wait(timeout=5)
+            raise RuntimeError("backend down")
+
+        def call(fn):
+            try:
+                self.flight.do("key", fn)
+            except RuntimeError as e:
+                errors.append(e)
+
+        first = threading.Thread(target=call, args=(leader,))
+        first.start()
+        started.wait(timeout=5)
+        second = threading.Thread(target=call, args=(lambda: "not run",))
+        second.start()
+        self._wait_coalesced(1)
+        release.set()
+        first.join(timeout=5)
+        second.join(timeout=5)
+        self.assertEqual(len(errors), 2)
+        self.assertIs(errors[0], errors[1])
+
+    def test_async_callers_share_one_fetch(self):
+        async def respond(section):
+            await asyncio.sleep(0.01)
+            return {"data": section}
+
+        async def fetch_twice():
+            return await asyncio.gather(*(
+                api_helpers.fetch_governance_sections_async("GOV0001", SECTIONS, use_cache=False)
+                for _ in range(2)
+            ))
+
+        backend = SectionBackend(respond)
+        with backend.serve():
+            first, second = asyncio.run(fetch_twice())
+        self.assertEqual(first, second)
+        self.assertEqual(len(backend.requested), len(SECTIONS))
+        self.assertEqual(self.flight.stats(), {"in_flight": 0, "executions": 1, "coalesced": 1})
+
+    def test_sync_caller_joins_async_fetch(self):
+        async def main():
+            release = asyncio.Event()
+
+            async def respond(section):
+                await release.wait()
+                return {"data": section}
+
+            backend = SectionBackend(respond)
+            with backend.serve():
+                leader = asyncio.ensure_future(
+                    api_helpers.fetch_governance_sections_async("GOV0001", SECTIONS, use_cache=False))
+                await asyncio.sleep(0)
+                waiter = asyncio.ensure_future(asyncio.to_thread(
+                    api_helpers.fetch_governance_sections, "GOV0001", SECTIONS, use_cache=False))
+                while self.flight.stats()["coalesced"] < 1:
+                    await asyncio.sleep(0.001)
+                release.set()
+                results = await asyncio.gather(leader, waiter)
+            return backend.requested, results
+
+        requested, (first, second) = asyncio.run(main())
+        self.assertEqual(len(requested), len(SECTIONS))
+        self.assertEqual(first, second)
+        self.assertEqual(self.flight.stats(), {"in_flight": 0, "executions": 1, "coalesced": 1})
+
+    def test_async_callers_on_other_loops_join_a_fetch(self):
+        release = threading.Event()
+
+        def respond(section):
+            release.wait(timeout=5)
+            return {"data": section}
+
+        def release_when_coalesced():
+            self._wait_coalesced(2)
+            release.set()
+
+        backend = SectionBackend(respond)
+        results = []
+        # A thread fetches; callers on two other event loops join its fetch
+        leader = threading.Thread(target=lambda: results.append(
+            api_helpers.fetch_governance_sections("GOV0001", SECTIONS, use_cache=False)))
+        joiners = [
+            threading.Thread(target=lambda: results.append(asyncio.run(
+                api_helpers.fetch_governance_sections_async("GOV0001", SECTIONS, use_cache=False))))
+            for _ in range(2)
+        ]
+        threading.Thread(target=release_when_coalesced, daemon=True).start()
+        with backend.serve():
+            leader.start()
+            while self.flight.stats()["in_flight"] < 1:
+                time.sleep(0.001)
+            for thread in joiners:
+                thread.start()
+            for thread in [leader] + joiners:
+                thread.join(timeout=5)
+        self.assertEqual(len(backend.requested), len(SECTIONS))
+        self.assertEqual(len(results), 3)
+        self.assertTrue(all(result == results[0] for result in results))
+        self.assertEqual(self.flight.stats(), {"in_flight": 0, "executions": 1, "coalesced": 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
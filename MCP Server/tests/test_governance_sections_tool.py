@@ -0,0 +1,58 @@
+"""Tests of the get_governance_sections tool."""
+import asyncio
+import unittest
+from unittest import mock
+
+from tools import load_tool
+from utilities.projection import invalidate_projections
+
+SECTION_DATA = {
+    "risk_details": {"data": [{"risk_level": "high", "reason": "r", "internal": "dropped"}]},
+    "cost_clarifications": {"data": {"clarifications": []}},
+    "environment_details": {"error": "HTTP 500", "status_code": 500, "endpoint": "environment_details"}
+}
+
+
+class GetGovernanceSectionsTest(unittest.TestCase):
+    def setUp(self):
+        invalidate_projections()
+
+    def run_tool(self, sections, governance_id="GOV0001"):
+        async def fetch(governance_id, sections):
+            return {section: SECTION_DATA[section] for section in sections}
+
+        fetch_mock = mock.AsyncMock(side_effect=fetch)
+        broadcast = mock.Mock()
+        with mock.patch("utilities.api_helpers.fetch_governance_sections_async", fetch_mock), \
+                mock.patch("utilities.api_helpers.queue_governance_broadcast", broadcast):
+            result = asyncio.run(load_tool("get_governance_sections")(governance_id=governance_id, sections=sections))
+        broadcast.assert_not_called()
+        return result, fetch_mock
+
+    def test_sections_returned_with_field_mask(self):
+        result, fetch_mock = self.run_tool(["risk_details", "risk_details", "cost_clarifications", "environment_details"])
+        fetch_mock.assert_awaited_once_with("GOV0001", ["risk_details", "cost_clarifications", "environment_details"])
+        self.assertEqual(result["governance_id"], "GOV0001")
+        self.assertEqual(result["risk_details"], {
+            "risk_level": "high", "reason": "r", "committee_1": None, "committee_2": None, "committee_3": None
+        })
+        self.assertNotIn("section", result)
+        # Empty sections are reported as not found, failed fetches as errors
+        self.assertEqual(result["not_found"], ["cost_clarifications"])
+        self.assertEqual(result["errors"], {"environment_details": "HTTP 500"})
+
+    def test_unknown_section_rejected(self):
+        result, fetch_mock = self.run_tool(["risk_details", "secrets"])
+        self.assertIn("Invalid parameters", result["error"])
+        fetch_mock.assert_not_awaited()
+
+    def test_empty_request_rejected(self):
+        result, fetch_mock = self.run_tool([])
+        self.assertIn("Invalid parameters", result["error"])
+        result, fetch_mock = self.run_tool(["risk_details"], governance_id=" ")
+        self.assertIn("Invalid parameters", result["error"])
+        fetch_mock.assert_not_awaited()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+from unittest import mock
+
+from tests.fakes import FakeWebSocket, SectionBackend, use_snapshot_cache
+from utilities import api_helpers
+from websocket_manager import WebSocketManager
+
+
+class PartialBroadcastFetchTest(unittest.TestCase):
+    def setUp(self):
+        use_snapshot_cache(self)
+        self.backend = SectionBackend()
+        self.broadcast = mock.Mock()
+        self.enterContext(self.backend.serve())
+        self.enterContext(mock.patch("websocket_manager.broadcast_governance_details_sync", self.broadcast))
+
+    def test_only_touched_sections_fetched_and_sent(self):
+        api_helpers.broadcast_governance_data("GOV0001", sections=["risk_details", "committee_clarifications"])
+        self.assertEqual(sorted(self.backend.requested), ["committee_clarifications", "risk_details"])
+        payload = self.broadcast.call_args.args[0]
+        self.assertTrue(payload["partial"])
+        self.assertEqual(set(payload) - {"governance_id", "section", "sub_section", "partial"},
+                         {"risk_details", "committee_clarifications"})
+
+    def test_full_snapshot_without_sections(self):
+        api_helpers.broadcast_governance_data("GOV0001")
+        self.assertEqual(sorted(self.backend.requested), sorted(api_helpers.GOVERNANCE_SECTIONS))
+        self.assertNotIn("partial", self.broadcast.call_args.args[0])
+
+    def test_full_snapshot_when_partial_broadcasts_disabled(self):
+        with mock.patch("config.PARTIAL_BROADCASTS_ENABLED", False):
+            api_helpers.broadcast_governance_data("GOV0001", sections=["risk_details"])
+        self.assertEqual(sorted(self.backend.requested), sorted(api_helpers.GOVERNANCE_SECTIONS))
+        self.assertNotIn("partial", self.broadcast.call_args.args[0])
+
+
+class DirectBroadcastNavigationTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        use_snapshot_cache(self)
+        self.enterContext(SectionBackend().serve())
+        self.enterContext(mock.patch("websocket_manager.broadcast_governance_details_async", mock.AsyncMock()))
+        self.dispatcher = self.enterContext(mock.patch.object(api_helpers, "_broadcast_dispatcher"))
+
+    async def test_navigating_broadcast_drops_queued_navigation(self):
+        await api_helpers.broadcast_governance_data_async("GOV0001", section="risk_details")
+        self.dispatcher.drop_navigation.assert_called_once_with("GOV0001")
+
+    async def test_data_only_broadcast_keeps_queued_navigation(self):
+        await api_helpers.broadcast_governance_data_async("GOV0001", sections=["risk_details"])
+        self.dispatcher.drop_navigation.assert_not_called()
+
+
+class PartialBroadcastMergeTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.manager = WebSocketManager()
+        self.client = FakeWebSocket()
+        await self.manager.register(self.client)
+
+    async def asyncTearDown(self):
+        await self.manager.unregister(self.client)
+
+    async def test_partial_update_merged_into_snapshot(self):
+        await self.manager.broadcast_governance_details({
+            "governance_id": "GOV0001", "section": "none", "sub_section": "none",
+            "risk_details": {"v": 1}, "cost_details": {"v": 1}
+        })
+        await self.manager.broadcast_governance_details({
+            "governance_id": "GOV0001", "section": "none", "sub_section": "none", "partial": True,
+            "cost_details": {"v": 2}
+        })
+        await self.client.drain()
+        first, second = self.client.of_type("governance_details_update")
+        self.assertEqual(first["data"]["risk_details"], {"v": 1})
+        # The synced client receives only the changed section
+        self.assertEqual(second["data"]["cost_details"], {"v": 2})
+        self.assertNotIn("risk_details", second["data"])
+        # A client joining later receives the merged snapshot
+        late = FakeWebSocket()
+        await self.manager.register(late)
+        await self.manager.send_resync(late, "GOV0001")
+        await late.drain()
+        data = late.of_type("governance_details_update")[0]["data"]
+        self.assertEqual((data["risk_details"], data["cost_details"]), ({"v": 1}, {"v": 2}))
+        await self.manager.unregister(late)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+"""Tests of the pending clarification queue and its index."""
+import unittest
+from unittest import mock
+
+from tools.get_pending_clarifications import get_pending_clarifications
+from utilities.clarification_index import PendingClarificationIndex
+from utilities.snapshot_cache import GovernanceSnapshotCache
+
+SECTIONS = {
+    "committee_clarifications": {"data": {"clarifications": {
+        "committee_1": [{"unique_code": "C1", "clarification": "q1", "status": "pending"}],
+        "committee_2": [{"unique_code": "C2", "clarification": "q2", "status": "completed"}]
+    }}},
+    "environment_clarifications": {"status_code": 404, "error": "not found"},
+    "cost_clarifications": {"data": {"clarifications": [
+        {"unique_code": "K1", "clarification": "q3", "status": "pending"}
+    ]}}
+}
+
+
+class PendingClarificationsTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        patcher = mock.patch("utilities.api_helpers.fetch_governance_sections_async", mock.AsyncMock(return_value=SECTIONS))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch("utilities.api_helpers.queue_governance_broadcast")
+        self.queue_broadcast = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_queue_in_workflow_order(self):
+        result = await get_pending_clarifications("GOV0001")
+        self.assertEqual([(item["position"], item["unique_code"]) for item in result["queue"]], [(1, "C1"), (2, "K1")])
+        self.assertEqual(result["queue"][0]["committee"], "committee_1")
+        self.assertEqual(result["not_created"], ["environment_clarifications"])
+        self.queue_broadcast.assert_not_called()
+
+    async def test_navigates_to_requested_section(self):
+        await get_pending_clarifications("GOV0001", section="cost_details")
+        self.queue_broadcast.assert_called_once_with(
+            "GOV0001", section="cost_details", sub_section="none",
+            sections=["committee_clarifications", "environment_clarifications", "cost_clarifications"]
+        )
+
+    async def test_rejects_unknown_section(self):
+        result = await get_pending_clarifications("GOV0001", section="cost")
+        self.assertIn("error", result)
+        self.queue_broadcast.assert_not_called()
+
+
+class PendingClarificationIndexTest(unittest.TestCase):
+    def test_unchanged_sections_served_from_index(self):
+        index = PendingClarificationIndex(max_governances=10)
+        first = index.pending_queue("GOV0001", SECTIONS)
+        self.assertEqual(index.pending_queue("GOV0001", SECTIONS), first)
+        self.assertEqual(index.stats(), {"governances": 1, "hits": 3, "rebuilds": 3})
+
+    def test_snapshot_writes_reindex_sections(self):
+        index = PendingClarificationIndex(max_governances=10)
+        cache = GovernanceSnapshotCache(max_governances=10, ttl_seconds=60)
+        cache.add_listener(index.on_snapshot_change)
+        cost = SECTIONS["cost_clarifications"]
+        cache.put("GOV0001", "cost_clarifications", cost)
+        self.assertEqual(index.stats()["rebuilds"], 1)
+        self.assertEqual([item["unique_code"] for item in index.pending_queue("GOV0001", {"cost_clarifications": cost})], ["K1"])
+        self.assertEqual(index.stats()["hits"], 1)
+        cache.invalidate("GOV0001", ["cost_clarifications"])
+        index.pending_queue("GOV0001", {"cost_clarifications": cost})
+        self.assertEqual(index.stats()["rebuilds"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
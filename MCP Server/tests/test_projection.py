@@ -0,0 +1,147 @@
+"""Tests of the token-budgeted projection of governance data."""
+import json
+import unittest
+from unittest import mock
+
+from tests.fakes import use_snapshot_cache
+from utilities import projection
+from utilities.projection import (
+    MIN_STRING_LENGTH,
+    get_projection_stats,
+    invalidate_projections,
+    project_governance_data
+)
+
+
+def _size(value) -> int:
+    return len(json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+
+
+def _governance(clarifications: list, report: str = "report") -> dict:
+    return {
+        "governance_id": "GOV0001",
+        "section": "none",
+        "sub_section": "none",
+        "governance_report": {"data": [{"report_content": report, "documents": [], "internal": "dropped"}]},
+        "cost_clarifications": {"data": {"clarifications": clarifications}}
+    }
+
+
+class ProjectionTest(unittest.TestCase):
+    def setUp(self):
+        invalidate_projections()
+
+    def test_field_mask_without_trimming(self):
+        projected = project_governance_data(_governance([{"clarification": "q"}]), max_bytes=10000)
+        self.assertEqual(projected["governance_report"], {"report_content": "report", "documents": []})
+        self.assertEqual(projected["cost_clarifications"], [{"clarification": "q"}])
+        self.assertNotIn("truncated_fields", projected)
+
+    def test_longest_strings_trimmed_to_budget(self):
+        data = _governance([{"clarification": "a" * 3000}, {"clarification": "short"}], report="b" * 3000)
+        projected = project_governance_data(data, max_bytes=2000)
+        self.assertLessEqual(_size(projected), 2000)
+        self.assertEqual(projected["cost_clarifications"][1]["clarification"], "short")
+        self.assertTrue(projected["governance_report"]["report_content"].endswith("chars]"))
+        self.assertEqual(projected["truncated_fields"], ["governance_report.report_content", "cost_clarifications[*].clarification"])
+
+    def test_strings_not_cut_below_minimum(self):
+        data = _governance([{"clarification": "a" * 500}])
+        projected = project_governance_data(data, max_bytes=10)
+        kept = projected["cost_clarifications"][0]["clarification"]
+        self.assertTrue(kept.startswith("a" * MIN_STRING_LENGTH))
+
+    def test_longest_lists_halved_after_strings(self):
+        data = _governance([{"clarification": f"question {n}"} for n in range(200)])
+        projected = project_governance_data(data, max_bytes=1500)
+        items = projected["cost_clarifications"]
+        self.assertLessEqual(_size(projected), 1500)
+        self.assertRegex(items[-1], r"^\.\.\. \[\d+ more items\]$")
+        self.assertEqual(items[0], {"clarification": "question 0"})
+        self.assertIn("cost_clarifications", projected["truncated_fields"])
+
+    def test_trimming_is_deterministic(self):
+        data = _governance([{"clarification": "a" * 3000}] * 20, report="b" * 5000)
+        first = project_governance_data(data, max_bytes=3000)
+        invalidate_projections()
+        self.assertEqual(project_governance_data(data, max_bytes=3000), first)
+
+    def test_projection_cached_until_data_changes(self):
+        data = _governance([{"clarification": "q"}])
+        project_governance_data(data, max_bytes=10000)
+        stats = get_projection_stats()
+        project_governance_data(data, max_bytes=10000)
+        self.assertEqual(get_projection_stats()["hits"], stats["hits"] + 1)
+        project_governance_data(_governance([{"clarification": "changed"}]), max_bytes=10000)
+        self.assertEqual(get_projection_stats()["misses"], stats["misses"] + 1)
+
+    def test_callers_get_independent_copies(self):
+        data = _governance([{"clarification": "q"}])
+        first = project_governance_data(data, max_bytes=10000)
+        first["cost_clarifications"][0]["clarification"] = "changed"
+        first["governance_report"]["documents"].append("doc")
+
+        hits = get_projection_stats()["hits"]
+        second = project_governance_data(data, max_bytes=10000)
+        self.assertEqual(get_projection_stats()["hits"], hits + 1)
+        self.assertEqual(second["cost_clarifications"], [{"clarification": "q"}])
+        self.assertEqual(second["governance_report"]["documents"], [])
+        # The input (e.g. a snapshot cache payload) is not modified either
+        self.assertEqual(data["cost_clarifications"]["data"]["clarifications"], [{"clarification": "q"}])
+
+
+class SnapshotVersionKeyTest(unittest.TestCase):
+    def setUp(self):
+        invalidate_projections()
+        self.cache = use_snapshot_cache(self)
+        patcher = mock.patch.object(projection, "snapshot_cache", self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.hash = mock.Mock(side_effect=projection.content_hash)
+        patcher = mock.patch.object(projection, "content_hash", self.hash)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _cached_governance(self) -> dict:
+        """Governance data whose sections are the payloads cached in the snapshot cache."""
+        data = _governance([{"clarification": "q"}])
+        for section in ("governance_report", "cost_clarifications"):
+            if self.cache.get("GOV0001", section) is None:
+                self.cache.put("GOV0001", section, data[section])
+            data[section] = self.cache.get("GOV0001", section)
+        return data
+
+    def test_cached_sections_keyed_without_hashing(self):
+        project_governance_data(self._cached_governance(), max_bytes=10000)
+        hits = get_projection_stats()["hits"]
+        project_governance_data(self._cached_governance(), max_bytes=10000)
+        self.assertEqual(get_projection_stats()["hits"], hits + 1)
+        self.hash.assert_not_called()
+
+    def test_stored_payload_misses(self):
+        project_governance_data(self._cached_governance(), max_bytes=10000)
+        # Equal content, but a newly stored payload
+        self.cache.put("GOV0001", "cost_clarifications", {"data": {"clarifications": [{"clarification": "q"}]}})
+        misses = get_projection_stats()["misses"]
+        project_governance_data(self._cached_governance(), max_bytes=10000)
+        self.assertEqual(get_projection_stats()["misses"], misses + 1)
+
+    def test_mask_and_budget_are_part_of_the_key(self):
+        data = self._cached_governance()
+        full = project_governance_data(data, max_bytes=10000)
+        only_report = project_governance_data(data, {"governance_report": projection.DEFAULT_FIELD_MASK["governance_report"]}, max_bytes=10000)
+        self.assertIn("cost_clarifications", full)
+        self.assertNotIn("cost_clarifications", only_report)
+        misses = get_projection_stats()["misses"]
+        project_governance_data(data, max_bytes=5000)
+        self.assertEqual(get_projection_stats()["misses"], misses + 1)
+
+    def test_uncached_section_falls_back_to_hash(self):
+        data = self._cached_governance()
+        data["cost_clarifications"] = {"data": {"clarifications": [{"clarification": "q"}]}}
+        project_governance_data(data, max_bytes=10000)
+        self.hash.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+"""Tests of the bounded per-client WebSocket send queues."""
+import asyncio
+import unittest
+from unittest import mock
+
+from utilities.send_queue import ClientSendQueue
+
+
+class SendQueueTest(unittest.IsolatedAsyncioTestCase):
+    def _queue(self, policy: str, max_size: int = 2, snapshots=None, send=None):
+        self.sent = []
+
+        async def record(message):
+            self.sent.append(message)
+
+        self.disconnect = mock.AsyncMock()
+        self.on_closed = mock.AsyncMock()
+        snapshots = {} if snapshots is None else snapshots
+        return ClientSendQueue(1, send or record, max_size=max_size, policy=policy,
+                               snapshot=snapshots.get, on_overflow_disconnect=self.disconnect)
+
+    async def _drain(self, queue: ClientSendQueue):
+        # Start the writer only after the messages are queued, like a client that is slower than the broadcasts
+        queue.start(self.on_closed)
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+    async def test_unknown_policy_rejected(self):
+        with self.assertRaises(ValueError):
+            self._queue("block")
+
+    async def test_messages_sent_in_order(self):
+        queue = self._queue("drop_oldest", max_size=8)
+        for message in ("m1", "m2", "m3"):
+            self.assertTrue(queue.put(message, "A"))
+        await self._drain(queue)
+        self.assertEqual(self.sent, ["m1", "m2", "m3"])
+        self.assertEqual(queue.stats()["max_depth"], 3)
+
+    async def test_drop_oldest_closes_gap_with_snapshot(self):
+        queue = self._queue("drop_oldest", snapshots={"A": "snapshot A"})
+        queue.put("a1", "A")
+        queue.put("b1", "B")
+        queue.put("m1")
+        self.assertEqual(queue.stats()["dropped"], 1)
+        await self._drain(queue)
+        # a1 was dropped; once drained, the topic's full snapshot is sent instead
+        self.assertEqual(self.sent, ["b1", "m1", "snapshot A"])
+
+    async def test_latest_per_topic_drops_same_topic(self):
+        queue = self._queue("latest_per_topic", snapshots={"A": "snapshot A"})
+        queue.put("a1", "A")
+        queue.put("b1", "B")
+        queue.put("a2", "A")
+        await self._drain(queue)
+        # a2 is replaced by the snapshot, which contains it
+        self.assertEqual(self.sent, ["b1", "snapshot A"])
+        self.assertEqual(queue.stats()["dropped"], 1)
+
+    async def test_latest_per_topic_drops_oldest_for_new_topic(self):
+        queue = self._queue("latest_per_topic", snapshots={})
+        queue.put("a1", "A")
+        queue.put("b1", "B")
+        queue.put("c1", "C")
+        await self._drain(queue)
+        # Without a snapshot for the gap the next message is sent as is
+        self.assertEqual(self.sent, ["b1", "c1"])
+
+    async def test_disconnect_policy_closes_full_queue(self):
+        queue = self._queue("disconnect")
+        self.assertTrue(queue.put("a1", "A"))
+        self.assertTrue(queue.put("a2", "A"))
+        self.assertFalse(queue.put("a3", "A"))
+        self.assertTrue(queue.closed)
+        await asyncio.sleep(0)
+        self.disconnect.assert_awaited_once()
+        self.assertFalse(queue.put("a4", "A"))
+
+    async def test_send_failure_closes_queue(self):
+        async def fail(message):
+            raise ConnectionError("gone")
+
+        queue = self._queue("drop_oldest", send=fail)
+        queue.put("a1", "A")
+        await self._drain(queue)
+        self.assertTrue(queue.closed)
+        self.on_closed.assert_awaited_once()
+
+    async def test_slow_client_does_not_block_producer(self):
+        release = asyncio.Event()
+
+        async def slow(message):
+            await release.wait()
+
+        queue = self._queue("latest_per_topic", max_size=4, send=slow)
+        queue.start(self.on_closed)
+        for n in range(100):
+            self.assertTrue(queue.put(f"a{n}", "A"))
+        stats = queue.stats()
+        self.assertLessEqual(stats["depth"], 4)
+        self.assertGreaterEqual(stats["dropped"], 96)
+        queue.cancel()
+
+
+if __name__ == "__main__":
+    unittest.main()
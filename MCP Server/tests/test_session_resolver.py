@@ -0,0 +1,67 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from utilities import session_resolver
+from utilities.session_resolver import SessionNotFoundError
+
+
+def _session_data(governance_id):
+    return {"data": [{"governance_id": governance_id}]}
+
+
+class SessionResolverTest(unittest.TestCase):
+    def setUp(self):
+        # Each test starts with an empty mapping and fresh counters
+        for name, value in (("_session_governance", session_resolver.OrderedDict()),
+                            ("_stats", {"hits": 0, "misses": 0})):
+            patcher = mock.patch.object(session_resolver, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_resolved_mapping_is_remembered(self):
+        with mock.patch.object(session_resolver, "get_json", return_value=_session_data("GOV0001")) as get_json:
+            self.assertEqual(session_resolver.resolve_governance_id("S1"), "GOV0001")
+            self.assertEqual(session_resolver.resolve_governance_id("S1"), "GOV0001")
+        get_json.assert_called_once()
+        stats = session_resolver.get_session_cache_stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["entries"]), (1, 1, 1))
+
+    def test_created_mapping_skips_backend(self):
+        session_resolver.remember_session_governance("S1", "GOV0001")
+        with mock.patch.object(session_resolver, "get_json") as get_json:
+            self.assertEqual(session_resolver.resolve_governance_id("S1"), "GOV0001")
+        get_json.assert_not_called()
+
+    def test_unknown_session_not_remembered(self):
+        with mock.patch.object(session_resolver, "get_json", return_value={"data": []}) as get_json:
+            for _ in range(2):
+                with self.assertRaises(SessionNotFoundError):
+                    session_resolver.resolve_governance_id("S1")
+        self.assertEqual(get_json.call_count, 2)
+        self.assertEqual(session_resolver.get_session_cache_stats()["entries"], 0)
+
+    def test_least_recently_used_mapping_evicted(self):
+        with mock.patch.object(session_resolver, "SESSION_CACHE_MAX_ENTRIES", 2):
+            session_resolver.remember_session_governance("S1", "GOV0001")
+            session_resolver.remember_session_governance("S2", "GOV0002")
+            session_resolver.resolve_governance_id("S1")
+            session_resolver.remember_session_governance("S3", "GOV0003")
+        with mock.patch.object(session_resolver, "get_json", return_value=_session_data("GOV0002")) as get_json:
+            session_resolver.resolve_governance_id("S1")
+            get_json.assert_not_called()
+            session_resolver.resolve_governance_id("S2")
+            get_json.assert_called_once()
+
+
+    def test_async_resolution_shares_the_mapping(self):
+        get_json_async = mock.AsyncMock(return_value=_session_data("GOV0001"))
+        with mock.patch.object(session_resolver, "get_json_async", get_json_async):
+            self.assertEqual(asyncio.run(session_resolver.resolve_governance_id_async("S1")), "GOV0001")
+        with mock.patch.object(session_resolver, "get_json") as get_json:
+            self.assertEqual(session_resolver.resolve_governance_id("S1"), "GOV0001")
+        get_json.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
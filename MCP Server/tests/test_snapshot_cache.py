@@ -0,0 +1,185 @@
+import threading
+import unittest
+from unittest import mock
+
+from tests.fakes import SectionBackend, use_snapshot_cache
+from utilities import api_helpers
+from utilities.snapshot_cache import GovernanceSnapshotCache
+
+
+def _payload(value):
+    return {"message": "ok", "data": value}
+
+
+class SnapshotCacheTest(unittest.TestCase):
+    def test_sections_expire_after_their_ttl(self):
+        cache = GovernanceSnapshotCache(max_governances=10, ttl_seconds=30, section_ttls={"chat_history": 5})
+        with mock.patch("utilities.snapshot_cache.time.monotonic", return_value=100.0):
+            cache.put("g1", "risk_details", _payload(1))
+            cache.put("g1", "chat_history", _payload(2))
+        with mock.patch("utilities.snapshot_cache.time.monotonic", return_value=110.0):
+            self.assertEqual(cache.get("g1", "risk_details"), _payload(1))
+            self.assertIsNone(cache.get("g1", "chat_history"))
+        with mock.patch("utilities.snapshot_cache.time.monotonic", return_value=131.0):
+            self.assertIsNone(cache.get("g1", "risk_details"))
+
+    def test_zero_ttl_and_errors_not_cached(self):
+        cache = GovernanceSnapshotCache(max_governances=10, ttl_seconds=30, section_ttls={"chat_history": 0})
+        cache.put("g1", "chat_history", _payload(1))
+        cache.put("g1", "risk_details", {"error": "HTTP 500", "status_code": 500})
+        self.assertIsNone(cache.get("g1", "chat_history"))
+        self.assertIsNone(cache.get("g1", "risk_details"))
+
+    def test_least_recently_used_governance_evicted(self):
+        cache = GovernanceSnapshotCache(max_governances=2, ttl_seconds=30)
+        cache.put("g1", "risk_details", _payload(1))
+        cache.put("g2", "risk_details", _payload(2))
+        cache.get("g1", "risk_details")
+        cache.put("g3", "risk_details", _payload(3))
+        self.assertIsNotNone(cache.get("g1", "risk_details"))
+        self.assertIsNone(cache.get("g2", "risk_details"))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_invalidate_drops_given_sections_or_all(self):
+        cache = GovernanceSnapshotCache(max_governances=10, ttl_seconds=30)
+        for section in ("risk_details", "cost_details", "governance_report"):
+            cache.put("g1", section, _payload(section))
+        cache.invalidate("g1", ["risk_details"])
+        self.assertIsNone(cache.get("g1", "risk_details"))
+        self.assertIsNotNone(cache.get("g1", "cost_details"))
+        cache.invalidate("g1")
+        self.assertIsNone(cache.get("g1", "governance_report"))
+
+    def test_reads_served_from_cache_until_invalidated(self):
+        use_snapshot_cache(self, ttl_seconds=30)
+        backend = SectionBackend()
+        with backend.serve():
+            api_helpers.fetch_governance_sections("GOV0001", ["risk_details"])
+            api_helpers.fetch_governance_sections("GOV0001", ["risk_details"])
+            self.assertEqual(len(backend.requested), 1)
+            api_helpers.invalidate_governance_sections("GOV0001", ["risk_details"])
+            api_helpers.fetch_governance_sections("GOV0001", ["risk_details"])
+        self.assertEqual(len(backend.requested), 2)
+
+
+class SnapshotCacheVersionTest(unittest.TestCase):
+    def test_fetch_started_before_invalidation_is_not_cached(self):
+        cache = GovernanceSnapshotCache(max_governances=10, ttl_seconds=60)
+        version = cache.version("g1")
+        cache.invalidate("g1", ["risk_details"])
+        cache.put("g1", "risk_details", _payload("stale"), version)
+        self.assertIsNone(cache.get("g1", "risk_details"))
+
+    def test_versions_stay_monotonic_across_eviction(self):
+        cache = GovernanceSnapshotCache(max_governances=1, ttl_seconds=60)
+        version = cache.version("g1")
+        cache.invalidate("g1", ["risk_details"])
+        # Evicting g1 must not reset its version to the one read before the write
+        cache.put("g2", "risk_details", _payload("other"))
+        self.assertNotEqual(cache.version("g1"), version)
+        cache.put("g1", "risk_details", _payload("stale"), version)
+        self.assertIsNone(cache.get("g1", "risk_details"))
+
+    def test_versions_stay_monotonic_across_clear(self):
+        cache = GovernanceSnapshotCache(max_governances=10, ttl_seconds=60)
+        version = cache.version("g1")
+        cache.invalidate("g1")
+        cache.clear()
+        cache.put("g1", "risk_details", _payload("stale"), version)
+        self.assertIsNone(cache.get("g1", "risk_details"))
+        version = cache.version("g1")
+        cache.put("g1", "risk_details", _payload("fresh"), version)
+        self.assertEqual(cache.get("g1", "risk_details"), _payload("fresh"))
+
+    def test_update_rejects_fetches_started_before_it(self):
+        cache = GovernanceSnapshotCache(max_governances=10, ttl_seconds=60)
+        version = cache.version("g1")
+        cache.update("g1", "risk_details", _payload("written"))
+        cache.put("g1", "risk_details", _payload("stale"), version)
+        self.assertEqual(cache.get("g1", "risk_details"), _payload("written"))
+
+
+class SnapshotCachePatchTest(unittest.TestCase):
+    def test_concurrent_appends_are_not_lost(self):
+        cache = GovernanceSnapshotCache(max_governances=10, ttl_seconds=60)
+        cache.put("g1", "cost_details", _payload([]))
+
+        def append(value):
+            cache.patch("g1", "cost_details", lambda cached: {**cached, "data": cached["data"] + [value]})
+
+        threads = [threading.Thread(target=append, args=(i,)) for i in range(50)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sorted(cache.get("g1", "cost_details")["data"]), list(range(50)))
+
+    def test_patch_returning_none_drops_section(self):
+        cache = GovernanceSnapshotCache(max_governances=10, ttl_seconds=60)
+        cache.put("g1", "cost_details", _payload([1]))
+        notifications = []
+        cache.add_listener(lambda gid, section, data: notifications.append((gid, section, data)))
+        self.assertFalse(cache.patch("g1", "cost_details", lambda cached: None))
+        self.assertIsNone(cache.get("g1", "cost_details"))
+        self.assertEqual(notifications, [("g1", "cost_details", None)])
+
+    def test_patch_sees_missing_section_as_none(self):
+        cache = GovernanceSnapshotCache(max_governances=10, ttl_seconds=60)
+        seen = []
+        cache.patch("g1", "risk_details", lambda cached: seen.append(cached) or _payload("new"))
+        self.assertEqual(seen, [None])
+        self.assertEqual(cache.get("g1", "risk_details"), _payload("new"))
+
+
+class PatchFromWriteTest(unittest.TestCase):
+    def setUp(self):
+        self.cache = use_snapshot_cache(self)
+
+    def test_section_record_replaced_in_get_envelope(self):
+        self.cache.put("GOV0001", "cost_clarifications", {"message": "found", "governanceId": "GOV0001", "data": {}})
+        record = {"governance_id": "GOV0001", "clarifications": [{"status": "completed"}]}
+        self.assertTrue(api_helpers.patch_governance_section(
+            "GOV0001", "cost_clarifications", {"message": "updated", "data": record}
+        ))
+        self.assertEqual(self.cache.get("GOV0001", "cost_clarifications"),
+                         {"message": "found", "governanceId": "GOV0001", "data": record})
+
+    def test_created_record_appended_to_cached_list(self):
+        self.cache.put("GOV0001", "cost_details", {"count": 1, "data": [{"id": 1}]})
+        self.assertTrue(api_helpers.patch_governance_section(
+            "GOV0001", "cost_details", {"data": {"id": 2}}, append=True
+        ))
+        self.assertEqual(self.cache.get("GOV0001", "cost_details"), {"count": 2, "data": [{"id": 1}, {"id": 2}]})
+
+    def test_created_record_without_get_key_invalidates(self):
+        # The GET lists each record with its key as "id"; the POST returns it without
+        listed = {"message": "Cost details fetched successfully", "governanceId": "GOV0001", "count": 1,
+                  "data": [{"id": "-Nk1", "cost_details_id": "COST0001", "governance_id": "GOV0001"}]}
+        self.cache.put("GOV0001", "cost_details", listed)
+        created = {"cost_details_id": "COST0002", "governance_id": "GOV0001"}
+        self.assertFalse(api_helpers.patch_governance_section(
+            "GOV0001", "cost_details", {"message": "Cost details created successfully", "data": created}, append=True
+        ))
+        self.assertIsNone(self.cache.get("GOV0001", "cost_details"))
+
+        self.cache.put("GOV0001", "cost_details", listed)
+        self.assertTrue(api_helpers.patch_governance_section(
+            "GOV0001", "cost_details", {"data": {"id": "-Nk2", **created}}, append=True
+        ))
+        patched = self.cache.get("GOV0001", "cost_details")
+        self.assertEqual(patched["count"], 2)
+        self.assertEqual({key for record in patched["data"] for key in record}, set(listed["data"][0]))
+
+    def test_uncovered_section_invalidated(self):
+        self.assertFalse(api_helpers.patch_governance_section(
+            "GOV0001", "cost_details", {"data": {"id": 2}}, append=True
+        ))
+        self.cache.put("GOV0001", "risk_details", _payload("cached"))
+        self.assertFalse(api_helpers.patch_governance_section(
+            "GOV0001", "risk_details", {"data": {"governance_id": "GOV0002"}}
+        ))
+        self.assertIsNone(self.cache.get("GOV0001", "risk_details"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+"""Tests of the on-disk second tier of the snapshot cache."""
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from tests.fakes import SectionBackend, use_snapshot_cache
+from utilities import api_helpers
+from utilities.json_patch import content_hash
+from utilities.snapshot_cache import GovernanceSnapshotCache
+from utilities.snapshot_store import SQLiteSnapshotStore
+
+
+class BlockingStore:
+    """Store recording writes; every write waits until released."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.writes = []
+        self.data = {}
+
+    def _wait(self):
+        self.release.wait(5)
+
+    def put(self, governance_id, section, data):
+        self._wait()
+        self.writes.append(("put", governance_id, section))
+        self.data[(governance_id, section)] = data
+
+    def delete(self, governance_id, sections=None):
+        self._wait()
+        self.writes.append(("delete", governance_id, sections))
+        for key in list(self.data):
+            if key[0] == governance_id and (sections is None or key[1] in sections):
+                del self.data[key]
+
+    def clear(self):
+        self._wait()
+        self.writes.append(("clear",))
+        self.data.clear()
+
+    def get(self, governance_id, section):
+        data = self.data.get((governance_id, section))
+        return (data, "v") if data is not None else None
+
+    def stats(self):
+        return {}
+
+
+class WriteBehindTest(unittest.TestCase):
+    def test_cache_does_not_wait_for_store(self):
+        store = BlockingStore()
+        cache = GovernanceSnapshotCache(max_governances=10, ttl_seconds=60, store=store)
+        started = time.monotonic()
+        cache.put("g1", "risk_details", {"data": 1})
+        cache.invalidate("g1", ["risk_details"])
+        cache.put("g1", "risk_details", {"data": 2})
+        self.assertEqual(cache.get("g1", "risk_details"), {"data": 2})
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual(store.writes, [])
+        self.assertGreaterEqual(cache.stats()["persistent"]["write_queue_depth"], 2)
+
+        store.release.set()
+        self.assertTrue(cache.flush(5))
+        self.assertEqual(store.writes, [
+            ("put", "g1", "risk_details"),
+            ("delete", "g1", ["risk_details"]),
+            ("put", "g1", "risk_details")
+        ])
+        self.assertEqual(cache.get_persisted("g1", "risk_details"), {"data": 2})
+
+    def test_persisted_payload_not_served_while_write_pending(self):
+        store = BlockingStore()
+        store.data[("g1", "risk_details")] = {"data": "old"}
+        cache = GovernanceSnapshotCache(max_governances=10, ttl_seconds=60, store=store)
+        cache.invalidate("g1", ["risk_details"])
+        self.assertIsNone(cache.get_persisted("g1", "risk_details"))
+        store.release.set()
+        self.assertTrue(cache.flush(5))
+        self.assertIsNone(cache.get_persisted("g1", "risk_details"))
+
+    def test_overflow_replaces_queued_writes_with_clear(self):
+        store = BlockingStore()
+        cache = GovernanceSnapshotCache(max_governances=10, ttl_seconds=60, store=store, write_queue_max=2)
+        for i in range(5):
+            cache.put(f"g{i}", "risk_details", {"data": i})
+        self.assertGreater(cache.stats()["persistent"]["write_queue_overflows"], 0)
+        store.release.set()
+        self.assertTrue(cache.flush(5))
+        self.assertIn(("clear",), store.writes)
+        self.assertLessEqual(len(store.writes), 4)
+
+
+class SQLiteSnapshotStoreTest(unittest.TestCase):
+    def open_store(self, max_bytes: int = 1024 * 1024, max_age_seconds: float = 60) -> SQLiteSnapshotStore:
+        directory = self.enterContext(tempfile.TemporaryDirectory())
+        store = SQLiteSnapshotStore(os.path.join(directory, "snapshots.sqlite3"), max_bytes, max_age_seconds)
+        self.addCleanup(store._conn.close)
+        return store
+
+    def test_payload_stored_with_content_version(self):
+        store = self.open_store()
+        store.put("g1", "risk_details", {"data": [1, 2]})
+        self.assertEqual(store.get("g1", "risk_details"), ({"data": [1, 2]}, content_hash({"data": [1, 2]})))
+        store.delete("g1", ["risk_details"])
+        self.assertIsNone(store.get("g1", "risk_details"))
+
+    def test_least_recently_used_sections_evicted(self):
+        store = self.open_store(max_bytes=120)
+        store.put("g1", "risk_details", {"data": "a" * 40})
+        store.put("g1", "cost_details", {"data": "b" * 40})
+        store.get("g1", "risk_details")
+        store.put("g1", "environment_details", {"data": "c" * 40})
+        self.assertIsNotNone(store.get("g1", "risk_details"))
+        self.assertIsNone(store.get("g1", "cost_details"))
+        self.assertEqual(store.stats()["evictions"], 1)
+
+    def test_old_payloads_not_served(self):
+        store = self.open_store(max_age_seconds=60)
+        with mock.patch("utilities.snapshot_store.time.time", return_value=1000.0):
+            store.put("g1", "risk_details", {"data": 1})
+        with mock.patch("utilities.snapshot_store.time.time", return_value=1061.0):
+            self.assertIsNone(store.get("g1", "risk_details"))
+
+    def test_cache_writes_reach_store(self):
+        cache = GovernanceSnapshotCache(max_governances=10, ttl_seconds=60, store=self.open_store())
+        cache.put("g1", "risk_details", {"data": [1, 2]})
+        cache.put("g1", "cost_details", {"data": [3]})
+        cache.invalidate("g1", ["cost_details"])
+        self.assertTrue(cache.flush(5))
+        self.assertEqual(cache.get_persisted("g1", "risk_details"), {"data": [1, 2]})
+        self.assertIsNone(cache.get_persisted("g1", "cost_details"))
+
+    def test_persisted_section_served_then_revalidated(self):
+        store = self.open_store()
+        store.put("GOV0001", "risk_details", {"data": "persisted"})
+        use_snapshot_cache(self, store=store)
+        broadcast = self.enterContext(mock.patch.object(api_helpers, "queue_governance_broadcast"))
+        backend = SectionBackend()
+        with backend.serve():
+            data = api_helpers.fetch_governance_sections("GOV0001", ["risk_details"])
+            self.assertEqual(data, {"risk_details": {"data": "persisted"}})
+            deadline = time.monotonic() + 5
+            while not broadcast.called and time.monotonic() < deadline:
+                time.sleep(0.01)
+        broadcast.assert_called_once_with("GOV0001", sections=["risk_details"])
+        self.assertEqual(backend.requested, ["risk_details"])
+
+
+if __name__ == "__main__":
+    unittest.main()
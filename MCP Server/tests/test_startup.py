@@ -0,0 +1,91 @@
+"""Tests of the server start-up: lazy tool loading and the backend host configuration."""
+import asyncio
+import inspect
+import json
+import os
+import subprocess
+import sys
+import unittest
+from unittest import mock
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run(code: str, **env) -> dict:
+    """Run code in a fresh interpreter, so module imports are not shared with this test process."""
+    result = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", code],
+        cwd=SERVER_DIR, env={**os.environ, **env}, capture_output=True, text=True, timeout=120, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class LazyToolLoadingTest(unittest.TestCase):
+    def test_package_import_loads_no_tool(self):
+        loaded = _run("import json, sys, tools; print(json.dumps([m for m in sys.modules if m.startswith('tools.')]))")
+        self.assertEqual(loaded, [])
+
+    def test_attribute_access_loads_one_tool(self):
+        loaded = _run(
+            "import json, sys, tools; tools.get_risk_details; "
+            "print(json.dumps([m for m in sys.modules if m.startswith('tools.')]))"
+        )
+        self.assertEqual(loaded, ["tools.get_risk_details"])
+
+    def test_server_start_loads_no_tool_or_metrics_module(self):
+        result = _run(
+            "import json, sys, main; "
+            "print(json.dumps({'tools': [m for m in sys.modules if m.startswith('tools.')], "
+            "'metrics': [m for m in ('websocket_manager', 'utilities.snapshot_cache', 'utilities.clarification_index') "
+            "if m in sys.modules]}))",
+            BACKEND_HOST="backend.test"
+        )
+        self.assertEqual(result, {"tools": [], "metrics": []})
+
+    def test_unknown_tool_is_attribute_error(self):
+        import tools
+        with self.assertRaises(AttributeError):
+            tools.not_a_tool
+
+
+class ToolProxyTest(unittest.TestCase):
+    def test_proxy_keeps_signature_and_docstring(self):
+        from main import REGISTERED_TOOLS
+        from tools import load_tool, tool_proxy
+        for name in REGISTERED_TOOLS:
+            with self.subTest(tool=name):
+                proxy, tool = tool_proxy(name), load_tool(name)
+                self.assertEqual(proxy.__name__, name)
+                self.assertEqual(inspect.signature(proxy), inspect.signature(tool))
+                self.assertEqual(inspect.cleandoc(proxy.__doc__), inspect.cleandoc(tool.__doc__))
+                self.assertTrue(inspect.iscoroutinefunction(proxy))
+
+    def test_server_registers_the_tool_schema(self):
+        from mcp.server.fastmcp import FastMCP
+        from tools import load_tool, tool_proxy
+        proxied, loaded = FastMCP("proxied", log_level="WARNING"), FastMCP("loaded", log_level="WARNING")
+        proxied.tool()(tool_proxy("create_cost_analysis"))
+        loaded.tool()(load_tool("create_cost_analysis"))
+        proxied_tool, = asyncio.run(proxied.list_tools())
+        loaded_tool, = asyncio.run(loaded.list_tools())
+        self.assertEqual(proxied_tool.inputSchema, loaded_tool.inputSchema)
+
+    def test_call_imports_and_delegates_to_the_tool(self):
+        from tools import tool_proxy
+        proxy = tool_proxy("get_risk_details")
+        with mock.patch("tools.get_risk_details.get_risk_details", mock.AsyncMock(return_value={"risk_level": "high"})) as tool:
+            self.assertEqual(asyncio.run(proxy("GOV0001")), {"risk_level": "high"})
+        tool.assert_awaited_once_with("GOV0001")
+
+
+class BackendHostTest(unittest.TestCase):
+    def test_configured_host_skips_ip_probe(self):
+        result = _run(
+            "import json, sys, config; print(json.dumps({'host': config.BACKEND_HOST, 'probed': 'utils' in sys.modules}))",
+            BACKEND_HOST="backend.test"
+        )
+        self.assertEqual(result, {"host": "backend.test", "probed": False})
+
+
+if __name__ == "__main__":
+    unittest.main()
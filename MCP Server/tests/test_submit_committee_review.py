@@ -0,0 +1,67 @@
+"""Tests of the submit_committee_review tool."""
+import unittest
+
+from tests.fakes import WriteBackend
+
+ANSWER = {"unique_code": "system_integration", "user_answer": "No", "status": "completed"}
+
+
+class SubmitCommitteeReviewTest(unittest.TestCase):
+    def run_tool(self, failing_suffix: str = None, **kwargs):
+        """Run the tool against a fake backend; returns (result, written URL paths, broadcast mock)."""
+        backend = WriteBackend(failing=[failing_suffix] if failing_suffix else ())
+        result = backend.run("submit_committee_review", **kwargs)
+        return result, backend.written, backend.broadcast
+
+    def test_answers_stored_before_statuses_with_one_broadcast(self):
+        result, written, broadcast = self.run_tool(
+            governance_id="GOV0002",
+            committees=[{"committee": "committee_2", "status": "Approved"}, {"committee": "committee_1", "status": "Pending"}],
+            clarifications={"committee_2": [ANSWER]}
+        )
+        self.assertEqual(written, ["committee-clarifications/GOV0002/committee_2", "risk-analyse/update-committee"])
+        self.assertEqual(result["message"], "Committee review submitted successfully")
+        self.assertEqual(result["committee_status"]["data"],
+                         {"governance_id": "GOV0002", "committee_2": "Approved", "committee_1": "Pending"})
+        broadcast.assert_called_once_with("GOV0002", section="commitee_approval", sub_section="committee_2",
+                                          sections=["committee_clarifications", "risk_details"])
+
+    def test_invalid_input_writes_nothing(self):
+        for kwargs in (
+            {"committees": [{"committee": "committee_1", "status": "Approved"}],
+             "clarifications": {"committee_1": [ANSWER]}},
+            {"committees": [{"committee": "committee_1", "status": "Done"}]},
+            {"committees": [{"committee": "committee_1", "status": "Approved"}, {"committee": "committee_1", "status": "Rejected"}]},
+            {"committees": []}
+        ):
+            result, written, broadcast = self.run_tool(governance_id="GOV0002", **kwargs)
+            self.assertIn("Validation error", result["error"])
+            self.assertEqual(written, [])
+            broadcast.assert_not_called()
+
+    def test_statuses_not_updated_when_answers_fail(self):
+        result, written, broadcast = self.run_tool(
+            failing_suffix="committee_2",
+            governance_id="GOV0002",
+            committees=[{"committee": "committee_2", "status": "Approved"}],
+            clarifications={"committee_2": [ANSWER]}
+        )
+        self.assertEqual(written, ["committee-clarifications/GOV0002/committee_2"])
+        self.assertEqual(result["status_code"], 500)
+        self.assertEqual(result["message"], "Committee review not submitted")
+        broadcast.assert_not_called()
+
+    def test_failed_status_update_broadcasts_stored_answers(self):
+        result, written, broadcast = self.run_tool(
+            failing_suffix="update-committee",
+            governance_id="GOV0002",
+            committees=[{"committee": "committee_2", "status": "Approved"}],
+            clarifications={"committee_2": [ANSWER]}
+        )
+        self.assertEqual(result["message"], "Committee review partially submitted")
+        self.assertIsNone(result["committee_status"])
+        self.assertEqual(broadcast.call_args.kwargs["sections"], ["committee_clarifications"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+"""Tests of the per-governance topic routing of WebSocket broadcasts."""
+import json
+import unittest
+from unittest import mock
+
+from tests.fakes import FakeWebSocket
+from websocket_manager import WebSocketManager
+
+
+def _update(governance_id: str, value: int) -> dict:
+    return {"governance_id": governance_id, "section": "none", "sub_section": "none", "risk_details": {"v": value}}
+
+
+class TopicRoutingTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.manager = WebSocketManager()
+        self.clients = [FakeWebSocket(), FakeWebSocket(), FakeWebSocket()]
+        for client in self.clients:
+            await self.manager.register(client)
+
+    async def asyncTearDown(self):
+        for client in self.clients:
+            await self.manager.unregister(client)
+
+    async def _broadcast(self, governance_id: str, value: int):
+        await self.manager.broadcast_governance_details(_update(governance_id, value))
+        for client in self.clients:
+            await client.drain()
+
+    @staticmethod
+    def _received(client: FakeWebSocket) -> list:
+        return [message["data"]["governance_id"] for message in client.of_type("governance_details_update")]
+
+    async def test_subscribers_receive_only_their_topics(self):
+        first, second, unsubscribed = self.clients
+        await self.manager.subscribe(first, governance_ids=["G1"])
+        await self.manager.subscribe(second, governance_ids=["G2"])
+        await self._broadcast("G1", 1)
+        await self._broadcast("G2", 1)
+        self.assertEqual(self._received(first), ["G1"])
+        self.assertEqual(self._received(second), ["G2"])
+        # Clients that never subscribed receive every broadcast
+        self.assertEqual(self._received(unsubscribed), ["G1", "G2"])
+
+    async def test_subscription_required(self):
+        with mock.patch("websocket_manager.WS_REQUIRE_SUBSCRIPTION", True):
+            client = FakeWebSocket()
+            await self.manager.register(client)
+        await self.manager.broadcast_governance_details(_update("G1", 1))
+        await client.drain()
+        self.assertEqual(client.sent, [])
+        await self.manager.unregister(client)
+
+    async def test_session_subscription_resolved_to_governance(self):
+        client = self.clients[0]
+        with mock.patch("utilities.session_resolver.resolve_governance_id_async", mock.AsyncMock(return_value="G1")):
+            subscribed = await self.manager.subscribe(client, session_ids=["S1"])
+        self.assertEqual(subscribed, {"governance_ids": ["G1"], "pending_session_ids": []})
+        self.assertIn(client, self.manager.subscribers("G1"))
+
+    async def test_pending_session_bound_once_known(self):
+        client = self.clients[0]
+        with mock.patch("utilities.session_resolver.resolve_governance_id_async", mock.AsyncMock(side_effect=Exception("unknown"))):
+            subscribed = await self.manager.subscribe(client, session_ids=["S1"])
+        self.assertEqual(subscribed["pending_session_ids"], ["S1"])
+        with mock.patch("utilities.session_resolver.lookup_governance_id", return_value="G1"):
+            await self._broadcast("G1", 1)
+        self.assertEqual(self._received(client), ["G1"])
+        self.assertEqual(self.manager.pending_sessions, {})
+
+    async def test_unsubscribe_stops_delivery(self):
+        client = self.clients[0]
+        await self.manager.subscribe(client, governance_ids=["G1", "G2"])
+        self.manager.unsubscribe(client, governance_ids=["G1"])
+        await self._broadcast("G1", 1)
+        await self._broadcast("G2", 1)
+        self.assertEqual(self._received(client), ["G2"])
+        self.assertNotIn(client, self.manager.subscribers("G1"))
+
+    async def test_unregister_removes_topics(self):
+        client = self.clients[0]
+        await self.manager.subscribe(client, governance_ids=["G1"])
+        await self.manager.unregister(client)
+        self.assertNotIn("G1", self.manager.topics)
+        self.assertNotIn(client, self.manager.client_topics)
+
+    async def test_subscribe_message_acknowledged_with_epoch(self):
+        client = self.clients[0]
+        await self.manager.handle_client_message(client, json.dumps({"type": "subscribe", "governance_ids": ["G1"]}))
+        await client.drain()
+        acknowledgement = client.of_type("subscribed")[0]
+        self.assertEqual(acknowledgement["governance_ids"], ["G1"])
+        self.assertEqual(acknowledgement["epoch"], self.manager.epoch)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+"""Tests of the shared request validation models."""
+import unittest
+
+from pydantic import ValidationError
+
+from utilities.validators import (
+    CreateCommitteeClarificationRequest,
+    GovernanceSectionsRequest,
+    SectionValidator,
+    UpdateCommitteeClarificationsRequest,
+    UpdateCostClarificationsRequest,
+    UpdateEnvironmentClarificationsRequest
+)
+
+
+def _item(unique_code: str, user_answer: str = " 10 ", status: str = "completed") -> dict:
+    return {"unique_code": unique_code, "user_answer": user_answer, "status": status}
+
+
+class ClarificationValidatorTest(unittest.TestCase):
+    def test_answers_stripped_and_codes_checked_per_type(self):
+        validated = UpdateCostClarificationsRequest(clarifications=[_item("resource_count")])
+        self.assertEqual(validated.clarifications[0].user_answer, "10")
+        with self.assertRaisesRegex(ValidationError, "unique_code must be one of"):
+            UpdateCostClarificationsRequest(clarifications=[_item("pii_data")])
+        UpdateEnvironmentClarificationsRequest(clarifications=[_item("pii_data")])
+
+    def test_empty_answer_and_unknown_status_rejected(self):
+        with self.assertRaisesRegex(ValidationError, "user_answer cannot be empty"):
+            UpdateEnvironmentClarificationsRequest(clarifications=[_item("pii_data", user_answer="  ")])
+        with self.assertRaisesRegex(ValidationError, "status must be either"):
+            UpdateEnvironmentClarificationsRequest(clarifications=[_item("pii_data", status="done")])
+
+    def test_committee_codes_and_committee_checked(self):
+        UpdateCommitteeClarificationsRequest(committee="committee_3", clarifications=[_item("core_business_impact")])
+        with self.assertRaisesRegex(ValidationError, "Committee 1"):
+            UpdateCommitteeClarificationsRequest(committee="committee_1", clarifications=[_item("resource_count")])
+        with self.assertRaisesRegex(ValidationError, "committee must be one of"):
+            UpdateCommitteeClarificationsRequest(committee="committee_4", clarifications=[])
+
+    def test_validation_errors_are_value_errors(self):
+        # Tools report validation failures by catching ValueError
+        with self.assertRaises(ValueError):
+            CreateCommitteeClarificationRequest(governance_id="GOV0001", user_name="u", risk_level="severe")
+
+
+class SectionValidatorTest(unittest.TestCase):
+    def test_section_defaults_to_none(self):
+        self.assertEqual(SectionValidator().section, "none")
+        with self.assertRaises(ValidationError):
+            SectionValidator(section="unknown")
+
+    def test_sections_request_deduplicates(self):
+        validated = GovernanceSectionsRequest(governance_id=" GOV0001 ", sections=["risk_details", "risk_details", "cost_details"])
+        self.assertEqual(validated.governance_id, "GOV0001")
+        self.assertEqual(validated.sections, ["risk_details", "cost_details"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+"""Tests of the backend writes of the create_* tools."""
+import unittest
+from unittest import mock
+
+from tests.fakes import WriteBackend
+
+RISK_ANALYSIS = {"session_id": "s1", "user_name": "u", "risk_level": "high", "reason": "r"}
+REPORT = {"session_id": "s1", "user_name": "u", "report_content": "c"}
+
+
+class WriteOrderTest(unittest.TestCase):
+    def test_committee_clarifications_are_not_created_when_risk_post_fails(self):
+        backend = WriteBackend(failing=["risk-analyse"])
+        result = backend.run("create_risk_analysis", **RISK_ANALYSIS)
+        self.assertEqual(result["status_code"], 500)
+        self.assertEqual(backend.written, ["risk-analyse"])
+        self.assertIsNone(backend.broadcast_sections)
+
+    def test_committee_clarifications_follow_the_risk_post(self):
+        backend = WriteBackend()
+        result = backend.run("create_risk_analysis", **RISK_ANALYSIS)
+        self.assertEqual(result["data"]["risk_level"], "high")
+        self.assertEqual(backend.written, ["risk-analyse", "committee-clarifications"])
+        backend.broadcast.assert_called_once()
+        self.assertEqual(backend.broadcast_sections, ["risk_details", "committee_clarifications"])
+
+    def test_clarifications_are_not_created_when_report_post_fails(self):
+        backend = WriteBackend(failing=["generate-report"])
+        result = backend.run("create_report", **REPORT)
+        self.assertEqual(result["status_code"], 500)
+        self.assertEqual(backend.written, ["generate-report"])
+        self.assertIsNone(backend.broadcast_sections)
+
+    def test_clarifications_sent_together_after_the_report(self):
+        backend = WriteBackend()
+        result = backend.run("create_report", **REPORT)
+        self.assertEqual(result["data"]["report_content"], "c")
+        self.assertEqual(backend.written[0], "generate-report")
+        self.assertEqual(sorted(backend.written[1:]), ["cost-clarifications", "environment-clarifications"])
+        self.assertEqual(backend.peak_in_flight, 2)
+
+    def test_failed_clarification_is_not_broadcast(self):
+        backend = WriteBackend(failing=["cost-clarifications"])
+        result = backend.run("create_report", **REPORT)
+        self.assertEqual(result["data"]["report_content"], "c")
+        self.assertEqual(backend.written[0], "generate-report")
+        self.assertEqual(backend.broadcast_sections, ["governance_report", "environment_clarifications"])
+
+
+class UpdateCommitteeStatusTest(unittest.TestCase):
+    def test_one_broadcast_for_all_committees(self):
+        backend = WriteBackend()
+        # The tool binds the helpers at import time
+        with mock.patch("tools.update_committee_status.put_json_async", side_effect=backend.write), \
+                mock.patch("tools.update_committee_status.queue_governance_broadcast", backend.broadcast), \
+                mock.patch("tools.update_committee_status.invalidate_governance_sections"):
+            backend.run("update_committee_status", governance_id="GOV0002", committees=[
+                {"committee": "committee_2", "status": "Approved"},
+                {"committee": "committee_3", "status": "Rejected"}
+            ])
+        self.assertEqual(backend.written, ["risk-analyse/update-committee"])
+        backend.broadcast.assert_called_once_with("GOV0002", section="commitee_approval", sub_section="committee_2",
+                                                  sections=["risk_details"])
+
+
+if __name__ == "__main__":
+    unittest.main()
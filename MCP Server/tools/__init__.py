@@ -1,19 +1,16 @@
-"""Tools module for the MCP Server."""
-
-from .get_weather import get_weather
-from .get_governance_report import get_governance_report
-from .get_risk_details import get_risk_details
-from .get_cost_details import get_cost_details
-from .get_environment_details import get_environment_details
-from .create_report import create_report
-from .create_cost_analysis import create_cost_analysis
-from .create_environment_details import create_environment_details
-from .create_risk_analysis import create_risk_analysis
-from .create_committee_clarification import create_committee_clarification
-from .update_committee_clarification import update_committee_clarification
-from .get_committee_clarifications import get_committee_clarifications
-from .update_committee_status import update_committee_status
-from .navigate_to_section import navigate_to_section
+"""
+Tools module for the MCP Server.
+
+Tool modules are imported on first use (load_tool or attribute access), so
+importing the package does not load every tool and its dependencies.
+tool_proxy registers a tool with the server before its module is imported.
+"""
+
+import ast
+import importlib
+import inspect
+import os
+import typing
 
 __all__ = [
     'get_weather',
@@ -30,4 +27,82 @@ __all__ = [
     'get_committee_clarifications',
     'update_committee_status'
     , 'navigate_to_section'
+    , 'get_governance_sections'
+    , 'get_pending_clarifications'
+    , 'submit_committee_review'
 ]
+
+
+def load_tool(name: str):
+    """
+    Import a tool module and return its tool function.
+    
+    Args:
+        name: Name of the tool; the module tools/<name>.py defines a function of the same name
+    
+    Returns:
+        The tool function
+    """
+    module = importlib.import_module(f"{__name__}.{name}")
+    return getattr(module, name)
+
+
+def tool_proxy(name: str):
+    """
+    Return a stand-in for a tool that imports the tool module on its first call.
+    
+    The signature and docstring are read from the module's source without
+    importing it, so the server can register the tool with its real schema
+    and description while the module and its dependencies stay unloaded.
+    Annotations may only use builtins and typing names.
+    
+    Args:
+        name: Name of the tool, as for load_tool
+    
+    Returns:
+        An async function with the tool's name, signature and docstring
+    """
+    path = os.path.join(os.path.dirname(__file__), f"{name}.py")
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), path)
+    definition = next(
+        node for node in tree.body
+        if isinstance(node, ast.AsyncFunctionDef) and node.name == name
+    )
+    
+    def evaluate(annotation):
+        if annotation is None:
+            return inspect.Parameter.empty
+        return eval(compile(ast.Expression(annotation), path, "eval"), vars(typing).copy())
+    
+    args = definition.args.args
+    defaults = [inspect.Parameter.empty] * (len(args) - len(definition.args.defaults)) + [
+        ast.literal_eval(default) for default in definition.args.defaults
+    ]
+    signature = inspect.Signature(
+        [
+            inspect.Parameter(arg.arg, inspect.Parameter.POSITIONAL_OR_KEYWORD, default=default, annotation=evaluate(arg.annotation))
+            for arg, default in zip(args, defaults)
+        ],
+        return_annotation=evaluate(definition.returns)
+    )
+    
+    async def proxy(*args, **kwargs):
+        return await load_tool(name)(*args, **kwargs)
+    
+    proxy.__name__ = proxy.__qualname__ = name
+    proxy.__doc__ = ast.get_docstring(definition, clean=False)
+    proxy.__signature__ = signature
+    proxy.__annotations__ = {
+        param.name: param.annotation for param in signature.parameters.values()
+        if param.annotation is not inspect.Parameter.empty
+    }
+    if signature.return_annotation is not inspect.Signature.empty:
+        proxy.__annotations__["return"] = signature.return_annotation
+    return proxy
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        return load_tool(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,4 +1,4 @@
-def create_committee_clarification(
+async def create_committee_clarification(
     governance_id: str,
     user_name: str,
     risk_level: str
@@ -21,38 +21,10 @@ def create_committee_clarification(
             - message: Success message
             - data: Created committee clarifications with all committees and their questions
     """
-    import urllib.request
-    import json
     from config import API_BASE_URL
-    from pydantic import BaseModel, field_validator
-    from utilities.api_helpers import broadcast_governance_data
-    
-    # Pydantic validation model
-    class CreateCommitteeClarificationRequest(BaseModel):
-        governance_id: str
-        user_name: str
-        risk_level: str
-        
-        @field_validator('risk_level')
-        @classmethod
-        def validate_risk_level(cls, v: str) -> str:
-            if v not in ['low', 'medium', 'high']:
-                raise ValueError('risk_level must be one of: "low", "medium", or "high"')
-            return v
-        
-        @field_validator('governance_id')
-        @classmethod
-        def validate_governance_id(cls, v: str) -> str:
-            if not v or not v.strip():
-                raise ValueError('governance_id cannot be empty')
-            return v.strip()
-        
-        @field_validator('user_name')
-        @classmethod
-        def validate_user_name(cls, v: str) -> str:
-            if not v or not v.strip():
-                raise ValueError('user_name cannot be empty')
-            return v.strip()
+    from utilities.api_helpers import queue_governance_broadcast, invalidate_governance_sections
+    from utilities.backend_client import post_json_async, BackendHTTPError
+    from utilities.validators import CreateCommitteeClarificationRequest
     
     try:
         # Validate input
@@ -71,39 +43,20 @@ def create_committee_clarification(
             "clarifications": []
         }
         
-        data = json.dumps(payload).encode('utf-8')
-        req = urllib.request.Request(
-            url,
-            data=data,
-            headers={'Content-Type': 'application/json'},
-            method='POST'
-        )
+        response = await post_json_async(url, payload)
+        invalidate_governance_sections(validated.governance_id, ['committee_clarifications'])
         
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            response = json.load(resp)
-            
-            # Broadcast the updated governance data
-            broadcast_governance_data(governance_id)
-            
-            return response
+        # Broadcast the updated governance data
+        queue_governance_broadcast(governance_id, sections=['committee_clarifications'])
+        
+        return response
             
     except ValueError as e:
         return {
             "error": f"Validation error: {str(e)}"
         }
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode('utf-8')
-        try:
-            error_data = json.loads(error_body)
-            return {
-                "error": f"HTTP {e.code}: {error_data.get('message', 'Unknown error')}",
-                "status_code": e.code
-            }
-        except json.JSONDecodeError:
-            return {
-                "error": f"HTTP {e.code}: {error_body}",
-                "status_code": e.code
-            }
+    except BackendHTTPError as e:
+        return e.to_error_dict()
     except Exception as e:
         return {
             "error": f"Error creating committee clarifications: {str(e)}"
@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field, field_validator
 from typing import List, Optional
+from utilities.validators import CostClarificationItem
 
 
 class CostBreakdownItem(BaseModel):
@@ -10,35 +11,6 @@ class CostBreakdownItem(BaseModel):
     notes: Optional[str] = Field(None, description="Additional notes or details")
 
 
-class CostClarificationItem(BaseModel):
-    """Individual cost clarification item for updating."""
-    unique_code: str = Field(..., description="The clarification code")
-    user_answer: str = Field(..., description="The user's answer to the clarification")
-    status: str = Field(..., description="Status of the clarification")
-    
-    @field_validator('unique_code')
-    @classmethod
-    def validate_unique_code(cls, v: str) -> str:
-        valid_codes = ['resource_count', 'cost_per_resource', 'project_duration', 'licensed_software']
-        if v not in valid_codes:
-            raise ValueError(f'unique_code must be one of {valid_codes}')
-        return v
-    
-    @field_validator('user_answer')
-    @classmethod
-    def validate_user_answer(cls, v: str) -> str:
-        if not v or not v.strip():
-            raise ValueError('user_answer cannot be empty')
-        return v.strip()
-    
-    @field_validator('status')
-    @classmethod
-    def validate_status(cls, v: str) -> str:
-        if v not in ['pending', 'completed']:
-            raise ValueError('status must be either "pending" or "completed"')
-        return v
-
-
 class CostAnalysisPayload(BaseModel):
     """Payload for creating cost analysis."""
     user_name: str = Field(..., description="Name of the user creating the cost analysis")
@@ -61,7 +33,7 @@ class CostAnalysisPayload(BaseModel):
         return v
 
 
-def create_cost_analysis(
+async def create_cost_analysis(
     governance_id: str,
     user_name: str,
     total_estimated_cost: float,
@@ -90,10 +62,9 @@ def create_cost_analysis(
     Returns:
         dict: Dictionary containing success message and created cost analysis data, or error information.
     """
-    import urllib.request
-    import json
     from config import API_BASE_URL, COST_CLARIFICATIONS_API_URL
-    from utilities.api_helpers import broadcast_governance_data
+    from utilities.api_helpers import queue_governance_broadcast, patch_governance_section
+    from utilities.backend_client import post_json_async, put_json_async, BackendHTTPError, BackendConnectionError
     
     try:
         # Step 1: Validate the cost analysis payload using Pydantic
@@ -126,18 +97,7 @@ def create_cost_analysis(
         
         # Convert Pydantic model to dict for JSON serialization
         payload = validated_payload.model_dump()
-        data = json.dumps(payload).encode('utf-8')
-        
-        cost_req = urllib.request.Request(
-            cost_url,
-            data=data,
-            headers={'Content-Type': 'application/json'},
-            method='POST'
-        )
-        
-        cost_response = None
-        with urllib.request.urlopen(cost_req, timeout=10) as cost_resp:
-            cost_response = json.load(cost_resp)
+        cost_response = await post_json_async(cost_url, payload)
         
         # Step 4: Update cost clarifications if provided
         clarification_response = None
@@ -157,32 +117,30 @@ def create_cost_analysis(
                     ]
                 }
                 
-                clarification_data = json.dumps(clarification_payload).encode('utf-8')
-                
-                clarification_req = urllib.request.Request(
-                    clarification_url,
-                    data=clarification_data,
-                    headers={'Content-Type': 'application/json'},
-                    method='PUT'
-                )
-                
-                with urllib.request.urlopen(clarification_req, timeout=10) as clarification_resp:
-                    clarification_response = json.load(clarification_resp)
-                    print(f"Updated cost clarifications for {governance_id}")
+                clarification_response = await put_json_async(clarification_url, clarification_payload)
+                print(f"Updated cost clarifications for {governance_id}")
             
-            except urllib.error.HTTPError as clarification_error:
+            except BackendHTTPError as clarification_error:
                 # Log clarification update error but don't fail the entire operation
                 print(f"Warning: Failed to update cost clarifications: {clarification_error}")
             except Exception as clarification_error:
                 # Log clarification update error but don't fail the entire operation
                 print(f"Warning: Error updating cost clarifications: {str(clarification_error)}")
         
+        # Patch the cached sections from the write responses so the broadcast
+        # below does not refetch them
+        patch_governance_section(governance_id, 'cost_details', cost_response, append=True)
+        written_sections = ['cost_details']
+        if clarification_response:
+            patch_governance_section(governance_id, 'cost_clarifications', clarification_response)
+            written_sections.append('cost_clarifications')
+        
         # Step 5: Broadcast updated governance data to WebSocket clients
         try:
-            broadcast_governance_data(governance_id, section='cost_details', sub_section='none')
-            print(f"Broadcasted cost details for {governance_id}")
+            queue_governance_broadcast(governance_id, section='cost_details', sub_section='none', sections=written_sections)
+            print(f"Queued broadcast of cost details for {governance_id}")
         except Exception as broadcast_error:
-            print(f"Failed to broadcast cost details: {broadcast_error}")
+            print(f"Failed to queue broadcast of cost details: {broadcast_error}")
         
         # Return combined response
         response = {
@@ -193,21 +151,10 @@ def create_cost_analysis(
         
         return response
     
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode('utf-8')
-        try:
-            error_data = json.loads(error_body)
-            return {
-                "error": f"HTTP {e.code}: {error_data.get('message', 'Unknown error')}",
-                "status_code": e.code
-            }
-        except json.JSONDecodeError:
-            return {
-                "error": f"HTTP {e.code}: {error_body}",
-                "status_code": e.code
-            }
+    except BackendHTTPError as e:
+        return e.to_error_dict()
     
-    except urllib.error.URLError as e:
+    except BackendConnectionError as e:
         from config import LOCAL_IP
         return {
             "error": f"Connection error: {str(e.reason)}. Make sure the API server is running on http://{LOCAL_IP}:8353"
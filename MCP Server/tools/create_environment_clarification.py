@@ -1,4 +1,4 @@
-def create_environment_clarification(
+async def create_environment_clarification(
     governance_id: str,
     user_name: str
 ) -> dict:
@@ -21,9 +21,9 @@ def create_environment_clarification(
             - message: Success/error message
             - data: Created clarifications data with governance_id, user_name, and clarifications array
     """
-    import urllib.request
-    import json
     from config import ENVIRONMENT_CLARIFICATIONS_API_URL
+    from utilities.api_helpers import invalidate_governance_sections
+    from utilities.backend_client import post_json_async, BackendHTTPError
     
     try:
         url = ENVIRONMENT_CLARIFICATIONS_API_URL
@@ -35,35 +35,13 @@ def create_environment_clarification(
             "clarifications": []
         }
         
-        # Convert payload to JSON bytes
-        data = json.dumps(payload).encode('utf-8')
-        
-        # Create request with headers
-        req = urllib.request.Request(
-            url,
-            data=data,
-            headers={'Content-Type': 'application/json'},
-            method='POST'
-        )
-        
         # Make the API call
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            response_data = json.load(resp)
-            return response_data
+        response_data = await post_json_async(url, payload)
+        invalidate_governance_sections(governance_id, ['environment_clarifications'])
+        return response_data
     
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode('utf-8')
-        try:
-            error_data = json.loads(error_body)
-            return {
-                "error": f"HTTP {e.code}: {error_data.get('message', 'Unknown error')}",
-                "status_code": e.code
-            }
-        except json.JSONDecodeError:
-            return {
-                "error": f"HTTP {e.code}: {error_body}",
-                "status_code": e.code
-            }
+    except BackendHTTPError as e:
+        return e.to_error_dict()
     except Exception as e:
         return {
             "error": f"Error creating environment clarifications: {str(e)}"
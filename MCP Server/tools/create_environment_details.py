@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field, field_validator
 from typing import List, Optional
+from utilities.validators import EnvironmentClarificationItem
 
 
 class EnvironmentService(BaseModel):
@@ -8,35 +9,6 @@ class EnvironmentService(BaseModel):
     reason: str = Field(..., description="Reason for using this service")
 
 
-class EnvironmentClarificationItem(BaseModel):
-    """Individual environment clarification item for updating."""
-    unique_code: str = Field(..., description="The clarification code")
-    user_answer: str = Field(..., description="The user's answer to the clarification")
-    status: str = Field(..., description="Status of the clarification")
-    
-    @field_validator('unique_code')
-    @classmethod
-    def validate_unique_code(cls, v: str) -> str:
-        valid_codes = ['prefer_environment', 'pii_data', 'technologies', 'expected_user_count', 'architecture_type']
-        if v not in valid_codes:
-            raise ValueError(f'unique_code must be one of {valid_codes}')
-        return v
-    
-    @field_validator('user_answer')
-    @classmethod
-    def validate_user_answer(cls, v: str) -> str:
-        if not v or not v.strip():
-            raise ValueError('user_answer cannot be empty')
-        return v.strip()
-    
-    @field_validator('status')
-    @classmethod
-    def validate_status(cls, v: str) -> str:
-        if v not in ['pending', 'completed']:
-            raise ValueError('status must be either "pending" or "completed"')
-        return v
-
-
 class EnvironmentDetailsPayload(BaseModel):
     """Payload for creating environment details."""
     user_name: str = Field(..., description="Name of the user creating the environment details")
@@ -72,7 +44,7 @@ class EnvironmentDetailsPayload(BaseModel):
         return v
 
 
-def create_environment_details(
+async def create_environment_details(
     governance_id: str,
     user_name: str,
     environment: str,
@@ -102,10 +74,9 @@ def create_environment_details(
     Returns:
         dict: Dictionary containing success message and created environment details data, or error information.
     """
-    import urllib.request
-    import json
     from config import API_BASE_URL, ENVIRONMENT_CLARIFICATIONS_API_URL
-    from utilities.api_helpers import broadcast_governance_data
+    from utilities.api_helpers import queue_governance_broadcast, patch_governance_section
+    from utilities.backend_client import post_json_async, put_json_async, BackendHTTPError, BackendConnectionError
     
     try:
         # Step 1: Validate the environment details payload using Pydantic
@@ -139,18 +110,7 @@ def create_environment_details(
         
         # Convert Pydantic model to dict for JSON serialization
         payload = validated_payload.model_dump()
-        data = json.dumps(payload).encode('utf-8')
-        
-        env_req = urllib.request.Request(
-            env_url,
-            data=data,
-            headers={'Content-Type': 'application/json'},
-            method='POST'
-        )
-        
-        env_response = None
-        with urllib.request.urlopen(env_req, timeout=10) as env_resp:
-            env_response = json.load(env_resp)
+        env_response = await post_json_async(env_url, payload)
         
         # Step 4: Update environment clarifications if provided
         clarification_response = None
@@ -170,32 +130,30 @@ def create_environment_details(
                     ]
                 }
                 
-                clarification_data = json.dumps(clarification_payload).encode('utf-8')
-                
-                clarification_req = urllib.request.Request(
-                    clarification_url,
-                    data=clarification_data,
-                    headers={'Content-Type': 'application/json'},
-                    method='PUT'
-                )
-                
-                with urllib.request.urlopen(clarification_req, timeout=10) as clarification_resp:
-                    clarification_response = json.load(clarification_resp)
-                    print(f"Updated environment clarifications for {governance_id}")
+                clarification_response = await put_json_async(clarification_url, clarification_payload)
+                print(f"Updated environment clarifications for {governance_id}")
             
-            except urllib.error.HTTPError as clarification_error:
+            except BackendHTTPError as clarification_error:
                 # Log clarification update error but don't fail the entire operation
                 print(f"Warning: Failed to update environment clarifications: {clarification_error}")
             except Exception as clarification_error:
                 # Log clarification update error but don't fail the entire operation
                 print(f"Warning: Error updating environment clarifications: {str(clarification_error)}")
         
+        # Patch the cached sections from the write responses so the broadcast
+        # below does not refetch them
+        patch_governance_section(governance_id, 'environment_details', env_response, append=True)
+        written_sections = ['environment_details']
+        if clarification_response:
+            patch_governance_section(governance_id, 'environment_clarifications', clarification_response)
+            written_sections.append('environment_clarifications')
+        
         # Step 5: Broadcast updated governance data to WebSocket clients
         try:
-            broadcast_governance_data(governance_id, section='environment_details', sub_section='none')
-            print(f"Broadcasted environment details for {governance_id}")
+            queue_governance_broadcast(governance_id, section='environment_details', sub_section='none', sections=written_sections)
+            print(f"Queued broadcast of environment details for {governance_id}")
         except Exception as broadcast_error:
-            print(f"Failed to broadcast environment details: {broadcast_error}")
+            print(f"Failed to queue broadcast of environment details: {broadcast_error}")
         
         # Return combined response
         response = {
@@ -206,21 +164,10 @@ def create_environment_details(
         
         return response
     
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode('utf-8')
-        try:
-            error_data = json.loads(error_body)
-            return {
-                "error": f"HTTP {e.code}: {error_data.get('message', 'Unknown error')}",
-                "status_code": e.code
-            }
-        except json.JSONDecodeError:
-            return {
-                "error": f"HTTP {e.code}: {error_body}",
-                "status_code": e.code
-            }
+    except BackendHTTPError as e:
+        return e.to_error_dict()
     
-    except urllib.error.URLError as e:
+    except BackendConnectionError as e:
         from config import LOCAL_IP
         return {
             "error": f"Connection error: {str(e.reason)}. Make sure the API server is running on http://{LOCAL_IP}:8353"
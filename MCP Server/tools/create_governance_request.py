@@ -1,4 +1,4 @@
-def create_governance_request(
+async def create_governance_request(
     session_id: str,
     user_name: str,
     use_case_title: str,
@@ -18,10 +18,10 @@ def create_governance_request(
             - message: Success message
             - governance_id: Generated governance ID (e.g., "GOV0004")
     """
-    import urllib.request
-    import json
     from config import GOVERNANCE_API_URL, CHAT_HISTORY_API_URL
-    from utilities.api_helpers import broadcast_governance_data
+    from utilities.api_helpers import queue_governance_broadcast, invalidate_governance_sections
+    from utilities.backend_client import post_json_async, BackendHTTPError, BackendConnectionError
+    from utilities.session_resolver import remember_session_governance
 
     try:
         # API endpoint
@@ -36,66 +36,37 @@ def create_governance_request(
             "relevant_documents": []
         }
         
-        # Convert payload to JSON bytes
-        data = json.dumps(payload).encode('utf-8')
+        # Make the API call
+        response_data = await post_json_async(url, payload)
         
-        # Create request with headers
-        req = urllib.request.Request(
-            url,
-            data=data,
-            headers={'Content-Type': 'application/json'},
-            method='POST'
-        )
+        # Extract message and governance_id
+        message = response_data.get("message", "")
+        governance_id = response_data.get("data", {}).get("governance_id", "")
         
-        # Make the API call
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            response_data = json.load(resp)
-            
-            # Extract message and governance_id
-            message = response_data.get("message", "")
-            governance_id = response_data.get("data", {}).get("governance_id", "")
+        # Save chat history if governance was created successfully
+        if governance_id:
+            remember_session_governance(session_id, governance_id)
             
-            # Save chat history if governance was created successfully
-            if governance_id:
-                chat_history_payload = {
-                    "governance_id": governance_id,
-                    "user_chat_session_id": session_id,
-                    "user_name": user_name
-                }
-                
-                chat_data = json.dumps(chat_history_payload).encode('utf-8')
-                chat_req = urllib.request.Request(
-                    CHAT_HISTORY_API_URL,
-                    data=chat_data,
-                    headers={'Content-Type': 'application/json'},
-                    method='POST'
-                )
-                
-                # Make the chat history API call
-                with urllib.request.urlopen(chat_req, timeout=10) as chat_resp:
-                    broadcast_governance_data(governance_id, section='none')
-                    json.load(chat_resp)  # Read response but don't need to process it
-            
-            return {
-                "message": message,
-                "governance_id": governance_id
+            chat_history_payload = {
+                "governance_id": governance_id,
+                "user_chat_session_id": session_id,
+                "user_name": user_name
             }
+            
+            # Make the chat history API call
+            await post_json_async(CHAT_HISTORY_API_URL, chat_history_payload)
+            invalidate_governance_sections(governance_id)
+            queue_governance_broadcast(governance_id, section='none')
+        
+        return {
+            "message": message,
+            "governance_id": governance_id
+        }
     
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode('utf-8')
-        try:
-            error_data = json.loads(error_body)
-            return {
-                "error": f"HTTP {e.code}: {error_data.get('message', 'Unknown error')}",
-                "status_code": e.code
-            }
-        except json.JSONDecodeError:
-            return {
-                "error": f"HTTP {e.code}: {error_body}",
-                "status_code": e.code
-            }
+    except BackendHTTPError as e:
+        return e.to_error_dict()
     
-    except urllib.error.URLError as e:
+    except BackendConnectionError as e:
         from config import LOCAL_IP
         return {
             "error": f"Connection error: {str(e.reason)}. Make sure the API server is running on http://{LOCAL_IP}:8353"
@@ -1,4 +1,4 @@
-def create_report(
+async def create_report(
     session_id: str,
     user_name: str,
     report_content: str
@@ -17,32 +17,20 @@ def create_report(
     Returns:
         dict: Dictionary containing success message and created report data, or error information.
     """
-    import urllib.request
-    import json
-    from config import GOVERNANCE_API_URL, API_BASE_URL, COST_CLARIFICATIONS_API_URL, ENVIRONMENT_CLARIFICATIONS_API_URL
-    from utilities.api_helpers import broadcast_governance_data
+    from config import API_BASE_URL, COST_CLARIFICATIONS_API_URL, ENVIRONMENT_CLARIFICATIONS_API_URL
+    from utilities.api_helpers import queue_governance_broadcast, invalidate_governance_sections, run_write_steps
+    from utilities.backend_client import post_json_async, BackendHTTPError, BackendConnectionError
+    from utilities.session_resolver import resolve_governance_id_async, SessionNotFoundError
     
     try:
         # Step 1: Get governance_id from session_id
-        session_url = f"{GOVERNANCE_API_URL}/session/{session_id}"
-        session_req = urllib.request.Request(session_url, method='GET')
-        
-        with urllib.request.urlopen(session_req, timeout=10) as session_resp:
-            session_data = json.load(session_resp)
-            
-            if not session_data.get('data') or len(session_data['data']) == 0:
-                return {
-                    "error": "No governance found for the provided session ID",
-                    "session_id": session_id
-                }
-            
-            governance_id = session_data['data'][0].get('governance_id')
-            
-            if not governance_id:
-                return {
-                    "error": "Governance ID not found in session data",
-                    "session_id": session_id
-                }
+        try:
+            governance_id = await resolve_governance_id_async(session_id)
+        except SessionNotFoundError as session_error:
+            return {
+                "error": str(session_error),
+                "session_id": session_id
+            }
         
         # Step 2: Create the report
         report_url = f"{API_BASE_URL}/generate-report"
@@ -53,99 +41,43 @@ def create_report(
             "report_content": report_content
         }
         
-        data = json.dumps(payload).encode('utf-8')
+        clarifications_payload = {
+            "governance_id": governance_id,
+            "user_name": user_name,
+            "clarifications": []
+        }
         
-        report_req = urllib.request.Request(
-            report_url,
-            data=data,
-            headers={'Content-Type': 'application/json'},
-            method='POST'
-        )
+        report_response = await post_json_async(report_url, payload)
         
-        report_response = None
-        with urllib.request.urlopen(report_req, timeout=10) as report_resp:
-            report_response = json.load(report_resp)
+        # Step 3: Create the cost and environment clarifications of the created
+        # report; they are independent of each other and sent concurrently
+        results = await run_write_steps({
+            "cost_clarifications": post_json_async(COST_CLARIFICATIONS_API_URL, clarifications_payload),
+            "environment_clarifications": post_json_async(ENVIRONMENT_CLARIFICATIONS_API_URL, clarifications_payload)
+        })
         
-        # Step 3: Create cost clarifications
-        try:
-            cost_payload = {
-                "governance_id": governance_id,
-                "user_name": user_name,
-                "clarifications": []
-            }
-            
-            cost_data = json.dumps(cost_payload).encode('utf-8')
-            cost_req = urllib.request.Request(
-                COST_CLARIFICATIONS_API_URL,
-                data=cost_data,
-                headers={'Content-Type': 'application/json'},
-                method='POST'
-            )
-            
-            with urllib.request.urlopen(cost_req, timeout=10) as cost_resp:
-                cost_response = json.load(cost_resp)
-                print(f"Cost clarifications created for governance_id: {governance_id}")
+        # Log clarification errors without failing the entire operation
+        for section, label in (("cost_clarifications", "cost"), ("environment_clarifications", "environment")):
+            result = results[section]
+            if isinstance(result, BackendHTTPError):
+                print(f"Warning: Failed to create {label} clarifications: {result}")
+            elif isinstance(result, Exception):
+                print(f"Warning: Error creating {label} clarifications: {str(result)}")
+            else:
+                print(f"{label.capitalize()} clarifications created for governance_id: {governance_id}")
         
-        except urllib.error.HTTPError as cost_error:
-            # Log cost clarification error but don't fail the entire operation
-            print(f"Warning: Failed to create cost clarifications: {cost_error}")
-        except Exception as cost_error:
-            # Log cost clarification error but don't fail the entire operation
-            print(f"Warning: Error creating cost clarifications: {str(cost_error)}")
+        written_sections = ['governance_report'] + [section for section, result in results.items() if not isinstance(result, Exception)]
         
-        # Step 4: Create environment clarifications
-        try:
-            env_payload = {
-                "governance_id": governance_id,
-                "user_name": user_name,
-                "clarifications": []
-            }
-            
-            env_data = json.dumps(env_payload).encode('utf-8')
-            env_req = urllib.request.Request(
-                ENVIRONMENT_CLARIFICATIONS_API_URL,
-                data=env_data,
-                headers={'Content-Type': 'application/json'},
-                method='POST'
-            )
-            
-            with urllib.request.urlopen(env_req, timeout=10) as env_resp:
-                env_response = json.load(env_resp)
-                
-                print(f"Environment clarifications created for governance_id: {governance_id}")
-        
-        except urllib.error.HTTPError as env_error:
-            # Log environment clarification error but don't fail the entire operation
-            print(f"Warning: Failed to create environment clarifications: {env_error}")
-        except Exception as env_error:
-            # Log environment clarification error but don't fail the entire operation
-            print(f"Warning: Error creating environment clarifications: {str(env_error)}")
+        # Step 4: Broadcast the sections that were written
+        invalidate_governance_sections(governance_id, written_sections)
+        queue_governance_broadcast(governance_id, section='governance_report', sections=written_sections)
         
-        # Step 5: Broadcast governance data
-        try:
-            print(f"Governance details broadcasted for governance_id: {governance_id}")
-        except Exception as broadcast_error:
-            print(f"Warning: Failed to broadcast governance details: {broadcast_error}")
-
-        
-        broadcast_governance_data(governance_id, section='governance_report')
         return report_response
     
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode('utf-8')
-        try:
-            error_data = json.loads(error_body)
-            return {
-                "error": f"HTTP {e.code}: {error_data.get('message', 'Unknown error')}",
-                "status_code": e.code
-            }
-        except json.JSONDecodeError:
-            return {
-                "error": f"HTTP {e.code}: {error_body}",
-                "status_code": e.code
-            }
+    except BackendHTTPError as e:
+        return e.to_error_dict()
     
-    except urllib.error.URLError as e:
+    except BackendConnectionError as e:
         from config import LOCAL_IP
         return {
             "error": f"Connection error: {str(e.reason)}. Make sure the API server is running on http://{LOCAL_IP}:8353"
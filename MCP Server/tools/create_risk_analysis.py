@@ -29,7 +29,7 @@ class RiskAnalysisPayload(BaseModel):
         return v.strip()
 
 
-def create_risk_analysis(
+async def create_risk_analysis(
     session_id: str,
     user_name: str,
     risk_level: str,
@@ -51,32 +51,20 @@ def create_risk_analysis(
     Returns:
         dict: Dictionary containing success message and created risk analysis data, or error information.
     """
-    import urllib.request
-    import json
-    from config import GOVERNANCE_API_URL, API_BASE_URL
-    from utilities.api_helpers import broadcast_governance_data
+    from config import API_BASE_URL
+    from utilities.api_helpers import queue_governance_broadcast, invalidate_governance_sections
+    from utilities.backend_client import post_json_async, BackendHTTPError, BackendConnectionError
+    from utilities.session_resolver import resolve_governance_id_async, SessionNotFoundError
     
     try:
         # Step 1: Get governance_id from session_id
-        session_url = f"{GOVERNANCE_API_URL}/session/{session_id}"
-        session_req = urllib.request.Request(session_url, method='GET')
-        
-        with urllib.request.urlopen(session_req, timeout=10) as session_resp:
-            session_data = json.load(session_resp)
-            
-            if not session_data.get('data') or len(session_data['data']) == 0:
-                return {
-                    "error": "No governance found for the provided session ID",
-                    "session_id": session_id
-                }
-            
-            governance_id = session_data['data'][0].get('governance_id')
-            
-            if not governance_id:
-                return {
-                    "error": "Governance ID not found in session data",
-                    "session_id": session_id
-                }
+        try:
+            governance_id = await resolve_governance_id_async(session_id)
+        except SessionNotFoundError as session_error:
+            return {
+                "error": str(session_error),
+                "session_id": session_id
+            }
         
         # Step 2: Validate the payload using Pydantic
         try:
@@ -97,21 +85,11 @@ def create_risk_analysis(
         
         # Convert Pydantic model to dict for JSON serialization
         payload = validated_payload.model_dump()
-        data = json.dumps(payload).encode('utf-8')
-        
-        risk_req = urllib.request.Request(
-            risk_url,
-            data=data,
-            headers={'Content-Type': 'application/json'},
-            method='POST'
-        )
+        risk_response = await post_json_async(risk_url, payload)
+        written_sections = ['risk_details']
         
-        risk_response = None
-        with urllib.request.urlopen(risk_req, timeout=10) as risk_resp:
-            risk_response = json.load(risk_resp)
-            broadcast_governance_data(governance_id, section='risk_details')
-        
-        # Step 4: Create committee clarifications for the governance
+        # Step 4: Create committee clarifications for the stored risk level; the
+        # backend accepts them only once, so they must not outlive a failed risk POST
         try:
             committee_url = f"{API_BASE_URL}/committee-clarifications"
             
@@ -122,18 +100,10 @@ def create_risk_analysis(
                 "clarifications": []
             }
             
-            committee_data = json.dumps(committee_payload).encode('utf-8')
-            committee_req = urllib.request.Request(
-                committee_url,
-                data=committee_data,
-                headers={'Content-Type': 'application/json'},
-                method='POST'
-            )
-            
-            with urllib.request.urlopen(committee_req, timeout=10) as committee_resp:
-                committee_response = json.load(committee_resp)
+            await post_json_async(committee_url, committee_payload)
+            written_sections.append('committee_clarifications')
         
-        except urllib.error.HTTPError as committee_error:
+        except BackendHTTPError as committee_error:
             # Log committee creation error but don't fail the entire operation
             print(f"Warning: Failed to create committee clarifications: {committee_error}")
         except Exception as committee_error:
@@ -141,29 +111,19 @@ def create_risk_analysis(
             print(f"Warning: Error creating committee clarifications: {str(committee_error)}")
         
         # Step 5: Broadcast governance data with risk_details section
+        invalidate_governance_sections(governance_id, written_sections)
         try:
-            broadcast_governance_data(governance_id, section='risk_details')
-            print(f"Governance details broadcasted for governance_id: {governance_id}")
+            queue_governance_broadcast(governance_id, section='risk_details', sections=written_sections)
+            print(f"Queued governance details broadcast for governance_id: {governance_id}")
         except Exception as broadcast_error:
-            print(f"Warning: Failed to broadcast governance details: {broadcast_error}")
+            print(f"Warning: Failed to queue governance details broadcast: {broadcast_error}")
         
         return risk_response
     
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode('utf-8')
-        try:
-            error_data = json.loads(error_body)
-            return {
-                "error": f"HTTP {e.code}: {error_data.get('message', 'Unknown error')}",
-                "status_code": e.code
-            }
-        except json.JSONDecodeError:
-            return {
-                "error": f"HTTP {e.code}: {error_body}",
-                "status_code": e.code
-            }
+    except BackendHTTPError as e:
+        return e.to_error_dict()
     
-    except urllib.error.URLError as e:
+    except BackendConnectionError as e:
         from config import LOCAL_IP
         return {
             "error": f"Connection error: {str(e.reason)}. Make sure the API server is running on http://{LOCAL_IP}:8353"
@@ -1,4 +1,4 @@
-def get_committee_clarifications(governance_id: str, committee: str = "committee_1") -> dict:
+async def get_committee_clarifications(governance_id: str, committee: str = "committee_1") -> dict:
     """
     Retrieve committee clarifications for a specific governance ID and committee.
     
@@ -16,31 +16,11 @@ def get_committee_clarifications(governance_id: str, committee: str = "committee
             - data: Clarifications data with nested structure for each committee
                     Each committee contains array of: clarification, unique_code, user_answer, status
     """
-    import urllib.request
-    import json
     from config import API_BASE_URL
-    from utilities.api_helpers import broadcast_governance_data
-    from pydantic import BaseModel, field_validator, ValidationError
-    
-    # Pydantic validation model
-    class CommitteeRequest(BaseModel):
-        governance_id: str
-        committee: str
-        
-        @field_validator('governance_id')
-        @classmethod
-        def governance_id_must_not_be_empty(cls, v: str) -> str:
-            if not v or not v.strip():
-                raise ValueError('governance_id must not be empty')
-            return v
-        
-        @field_validator('committee')
-        @classmethod
-        def validate_committee(cls, v: str) -> str:
-            valid_committees = ['committee_1', 'committee_2', 'committee_3']
-            if v not in valid_committees:
-                raise ValueError(f'committee must be one of {valid_committees}')
-            return v
+    from utilities.api_helpers import queue_governance_broadcast
+    from utilities.backend_client import get_json_async, BackendHTTPError
+    from pydantic import ValidationError
+    from utilities.validators import CommitteeRequest
     
     try:
         # Validate input
@@ -50,19 +30,16 @@ def get_committee_clarifications(governance_id: str, committee: str = "committee
         )
         
         url = f"{API_BASE_URL}/committee-clarifications/governance/{validated.governance_id}"
-        req = urllib.request.Request(url, method='GET')
+        response = await get_json_async(url)
         
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            response = json.load(resp)
-            
-            # Broadcast updated governance data to WebSocket clients
-            try:
-                broadcast_governance_data(validated.governance_id, section='commitee_approval', sub_section=validated.committee)
-                print(f"Broadcasted committee clarifications for {validated.governance_id}, committee: {validated.committee}")
-            except Exception as broadcast_error:
-                print(f"Failed to broadcast committee clarifications: {broadcast_error}")
-            
-            return response
+        # Broadcast updated governance data to WebSocket clients
+        try:
+            queue_governance_broadcast(validated.governance_id, section='commitee_approval', sub_section=validated.committee, sections=['committee_clarifications'])
+            print(f"Queued broadcast of committee clarifications for {validated.governance_id}, committee: {validated.committee}")
+        except Exception as broadcast_error:
+            print(f"Failed to queue broadcast of committee clarifications: {broadcast_error}")
+        
+        return response
     
     except ValidationError as e:
         return {
@@ -70,19 +47,8 @@ def get_committee_clarifications(governance_id: str, committee: str = "committee
             "details": e.errors()
         }
             
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode('utf-8')
-        try:
-            error_data = json.loads(error_body)
-            return {
-                "error": f"HTTP {e.code}: {error_data.get('message', 'Unknown error')}",
-                "status_code": e.code
-            }
-        except json.JSONDecodeError:
-            return {
-                "error": f"HTTP {e.code}: {error_body}",
-                "status_code": e.code
-            }
+    except BackendHTTPError as e:
+        return e.to_error_dict()
     except Exception as e:
         return {
             "error": f"Error fetching committee clarifications: {str(e)}"
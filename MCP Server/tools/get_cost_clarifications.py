@@ -1,4 +1,4 @@
-def get_cost_clarifications(governance_id: str) -> dict:
+async def get_cost_clarifications(governance_id: str) -> dict:
     """
     Retrieve cost clarifications for a specific governance ID.
     
@@ -14,40 +14,25 @@ def get_cost_clarifications(governance_id: str) -> dict:
             - governanceId: The governance ID
             - data: Clarifications data with array of clarification entries (clarification, unique_code, user_answer, status)
     """
-    import urllib.request
-    import json
     from config import COST_CLARIFICATIONS_API_URL
-    from utilities.api_helpers import broadcast_governance_data
+    from utilities.api_helpers import queue_governance_broadcast
+    from utilities.backend_client import get_json_async, BackendHTTPError
     
     try:
         url = f"{COST_CLARIFICATIONS_API_URL}/governance/{governance_id}"
-        req = urllib.request.Request(url, method='GET')
+        response = await get_json_async(url)
         
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            response = json.load(resp)
-            
-            # Broadcast updated governance data to WebSocket clients
-            try:
-                broadcast_governance_data(governance_id, section='cost_details', sub_section='none')
-                print(f"Broadcasted cost clarifications for {governance_id}")
-            except Exception as broadcast_error:
-                print(f"Failed to broadcast cost clarifications: {broadcast_error}")
-            
-            return response
-            
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode('utf-8')
+        # Broadcast updated governance data to WebSocket clients
         try:
-            error_data = json.loads(error_body)
-            return {
-                "error": f"HTTP {e.code}: {error_data.get('message', 'Unknown error')}",
-                "status_code": e.code
-            }
-        except json.JSONDecodeError:
-            return {
-                "error": f"HTTP {e.code}: {error_body}",
-                "status_code": e.code
-            }
+            queue_governance_broadcast(governance_id, section='cost_details', sub_section='none', sections=['cost_clarifications'])
+            print(f"Queued broadcast of cost clarifications for {governance_id}")
+        except Exception as broadcast_error:
+            print(f"Failed to queue broadcast of cost clarifications: {broadcast_error}")
+        
+        return response
+        
+    except BackendHTTPError as e:
+        return e.to_error_dict()
     except Exception as e:
         return {
             "error": f"Error fetching cost clarifications: {str(e)}"
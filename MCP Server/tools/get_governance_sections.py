@@ -0,0 +1,61 @@
+from typing import List
+
+
+async def get_governance_sections(governance_id: str, sections: List[str]) -> dict:
+    """
+    Retrieve several governance sections in a single call.
+    
+    The sections are served from the snapshot cache when possible and the
+    remaining ones are fetched from the backend concurrently. Unlike
+    get_user_details_history, nothing is broadcast to the frontend.
+    
+    Args:
+        governance_id (str): The governance ID to retrieve data for (e.g., "GOV0001").
+        sections (List[str]): Sections to retrieve, any of: chat_history, governance_report,
+            risk_details, cost_details, environment_details, cost_clarifications,
+            environment_clarifications, committee_clarifications.
+    
+    Returns:
+        dict: Dictionary with governance_id and one entry per section that has data,
+              "not_found" listing requested sections without data and "errors"
+              mapping sections whose fetch failed to the error message.
+    """
+    from utilities.api_helpers import fetch_governance_sections_async
+    from utilities.projection import project_governance_data, SECTION_FIELD_MASK
+    from utilities.validators import GovernanceSectionsRequest
+
+    try:
+        validated = GovernanceSectionsRequest(governance_id=governance_id, sections=sections)
+    except Exception as validation_error:
+        return {
+            "error": f"Invalid parameters. sections must be a non-empty list of: chat_history, governance_report, risk_details, cost_details, environment_details, cost_clarifications, environment_clarifications, committee_clarifications. Error: {str(validation_error)}",
+            "governance_id": governance_id
+        }
+
+    try:
+        section_data = await fetch_governance_sections_async(validated.governance_id, validated.sections)
+
+        errors = {
+            section: data["error"]
+            for section, data in section_data.items()
+            if isinstance(data, dict) and "error" in data
+        }
+        field_mask = {section: SECTION_FIELD_MASK[section] for section in validated.sections}
+        projected = project_governance_data(
+            {"governance_id": validated.governance_id, **section_data},
+            field_mask=field_mask
+        )
+
+        result = {key: value for key, value in projected.items() if key not in ("section", "sub_section")}
+        result["not_found"] = [
+            section for section in validated.sections
+            if section not in projected and section not in errors
+        ]
+        result["errors"] = errors
+        return result
+
+    except Exception as e:
+        return {
+            "error": f"Unexpected error: {str(e)}",
+            "governance_id": governance_id
+        }
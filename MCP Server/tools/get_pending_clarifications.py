@@ -0,0 +1,75 @@
+async def get_pending_clarifications(governance_id: str, section: str = 'none', sub_section: str = 'none') -> dict:
+    """
+    Retrieve the ordered queue of pending clarifications for a governance ID.
+    
+    Collects the clarifications with status 'pending' across committee_1,
+    committee_2, committee_3, environment and cost clarifications, in the order
+    they are worked through, so the next question to ask is the first queue item.
+    
+    Args:
+        governance_id (str): The governance ID to retrieve pending clarifications for (e.g., "GOV0001").
+        section (str): Section the frontend navigates to while the clarifications are asked
+                       (cost_details, environment_details or commitee_approval). Defaults to 'none' (no navigation).
+        sub_section (str): Sub-section to navigate to (committee_1, committee_2, committee_3). Defaults to 'none'.
+    
+    Returns:
+        dict: Dictionary with governance_id, pending_count, queue (items with position,
+              type (committee, environment or cost), committee (committee items only),
+              unique_code and clarification), not_created listing clarification types
+              not created yet and errors mapping sections whose fetch failed to the error message.
+    """
+    from utilities.api_helpers import fetch_governance_sections_async, queue_governance_broadcast
+    from utilities.clarification_index import clarification_index, CLARIFICATION_SECTIONS
+    from utilities.validators import SectionValidator, SubSectionValidator
+
+    if not governance_id or not governance_id.strip():
+        return {
+            "error": "governance_id cannot be empty",
+            "governance_id": governance_id
+        }
+
+    try:
+        navigation_section = SectionValidator(section=section).section
+        navigation_sub_section = SubSectionValidator(sub_section=sub_section).sub_section
+    except Exception as validation_error:
+        return {
+            "error": f"Invalid section or sub_section parameter: {str(validation_error)}",
+            "governance_id": governance_id
+        }
+
+    try:
+        section_data = await fetch_governance_sections_async(governance_id, CLARIFICATION_SECTIONS)
+
+        payloads = {}
+        not_created = []
+        errors = {}
+        for section, data in section_data.items():
+            if isinstance(data, dict) and data.get("status_code") == 404:
+                not_created.append(section)
+            elif isinstance(data, dict) and "error" in data:
+                errors[section] = data["error"]
+            else:
+                payloads[section] = data
+
+        queue = clarification_index.pending_queue(governance_id, payloads)
+
+        if navigation_section != 'none' or navigation_sub_section != 'none':
+            # Show the clarifications' section in the frontend while they are asked
+            try:
+                queue_governance_broadcast(governance_id, section=navigation_section, sub_section=navigation_sub_section, sections=list(CLARIFICATION_SECTIONS))
+            except Exception as broadcast_error:
+                print(f"Failed to queue broadcast of pending clarifications: {broadcast_error}")
+
+        return {
+            "governance_id": governance_id,
+            "pending_count": len(queue),
+            "queue": queue,
+            "not_created": not_created,
+            "errors": errors
+        }
+
+    except Exception as e:
+        return {
+            "error": f"Unexpected error: {str(e)}",
+            "governance_id": governance_id
+        }
@@ -1,4 +1,4 @@
-def get_risk_details(governance_id: str) -> dict:
+async def get_risk_details(governance_id: str) -> dict:
     """
     Retrieve risk analysis details for a specific governance ID.
     
@@ -12,31 +12,16 @@ def get_risk_details(governance_id: str) -> dict:
         dict: Dictionary containing risk data with committee_1, committee_2, committee_3,
               created_at, governance_id, reason, risk_analysis_id, risk_level, user_name, and id fields.
     """
-    import urllib.request
-    import json
     from config import RISK_DETAILS_API_URL
+    from utilities.backend_client import get_json_async, BackendHTTPError
     
     try:
         url = f"{RISK_DETAILS_API_URL}/{governance_id}"
-        req = urllib.request.Request(url, method='GET')
-        
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            response = json.load(resp)
-            return response.get('data', [])[0] if response.get('data') else {}
+        response = await get_json_async(url)
+        return response.get('data', [])[0] if response.get('data') else {}
             
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode('utf-8')
-        try:
-            error_data = json.loads(error_body)
-            return {
-                "error": f"HTTP {e.code}: {error_data.get('message', 'Unknown error')}",
-                "status_code": e.code
-            }
-        except json.JSONDecodeError:
-            return {
-                "error": f"HTTP {e.code}: {error_body}",
-                "status_code": e.code
-            }
+    except BackendHTTPError as e:
+        return e.to_error_dict()
     except Exception as e:
         return {
             "error": f"Error fetching risk details: {str(e)}"
@@ -1,4 +1,4 @@
-def get_user_details_history(governance_id: str, section: str = 'none', sub_section: str = 'none') -> dict:
+async def get_user_details_history(governance_id: str, section: str = 'none', sub_section: str = 'none') -> dict:
     """
     Retrieve comprehensive governance details including chat history, report, risk, cost, and environment data.
     
@@ -10,23 +10,10 @@ def get_user_details_history(governance_id: str, section: str = 'none', sub_sect
     Returns:
         Dictionary containing all governance-related data aggregated from multiple API endpoints.
     """
-    from pydantic import BaseModel, Field
-    from typing import Literal
-    from utilities.api_helpers import broadcast_governance_data
+    from utilities.api_helpers import broadcast_governance_data_async
+    from utilities.projection import project_governance_data
+    from utilities.validators import SectionValidator, SubSectionValidator
 
-    # Pydantic models for validation
-    class SectionValidator(BaseModel):
-        section: Literal['governance_report', 'risk_details', 'commitee_approval', 'cost_details', 'environment_details', 'none'] = Field(
-            default='none',
-            description="Section to filter governance details"
-        )
-    
-    class SubSectionValidator(BaseModel):
-        sub_section: Literal['committee_1', 'committee_2', 'committee_3', 'none'] = Field(
-            default='none',
-            description="Sub-section to filter governance details (committee approvals)"
-        )
-    
     # Validate section parameter
     try:
         validated = SectionValidator(section=section)
@@ -47,72 +34,12 @@ def get_user_details_history(governance_id: str, section: str = 'none', sub_sect
             "governance_id": governance_id
         }
 
-    def clean_response_data(data: dict) -> dict:
-        """Clean response data by removing unnecessary metadata and keeping only essential information"""
-        cleaned = {
-            "governance_id": data.get("governance_id"),
-            "section": data.get("section"),
-            "sub_section": data.get("sub_section")
-        }
-        
-        # Clean governance_report - keep only report_content and documents
-        if data.get("governance_report", {}).get("data") and len(data["governance_report"]["data"]) > 0:
-            report = data["governance_report"]["data"][0]
-            cleaned["governance_report"] = {
-                "report_content": report.get("report_content"),
-                "documents": report.get("documents", [])
-            }
-        
-        # Clean risk_details - keep only essential risk info
-        if data.get("risk_details", {}).get("data") and len(data["risk_details"]["data"]) > 0:
-            risk = data["risk_details"]["data"][0]
-            cleaned["risk_details"] = {
-                "risk_level": risk.get("risk_level"),
-                "reason": risk.get("reason"),
-                "committee_1": risk.get("committee_1"),
-                "committee_2": risk.get("committee_2"),
-                "committee_3": risk.get("committee_3")
-            }
-        
-        # Clean cost_details - keep only cost_breakdown and total
-        if data.get("cost_details", {}).get("data") and len(data["cost_details"]["data"]) > 0:
-            cost = data["cost_details"]["data"][0]
-            cleaned["cost_details"] = {
-                "total_estimated_cost": cost.get("total_estimated_cost"),
-                "cost_breakdown": cost.get("cost_breakdown", [])
-            }
-        
-        # Clean environment_details - keep only environment info
-        if data.get("environment_details", {}).get("data") and len(data["environment_details"]["data"]) > 0:
-            env = data["environment_details"]["data"][0]
-            cleaned["environment_details"] = {
-                "environment": env.get("environment"),
-                "region": env.get("region"),
-                "environment_breakdown": env.get("environment_breakdown", [])
-            }
-        
-        # Clean cost_clarifications - keep only clarifications array
-        if data.get("cost_clarifications", {}).get("data", {}).get("clarifications"):
-            cleaned["cost_clarifications"] = data["cost_clarifications"]["data"]["clarifications"]
-        
-        # Clean environment_clarifications - keep only clarifications array
-        if data.get("environment_clarifications", {}).get("data", {}).get("clarifications"):
-            cleaned["environment_clarifications"] = data["environment_clarifications"]["data"]["clarifications"]
-        
-        # Clean committee_clarifications - keep only clarifications object with nested committees
-        if data.get("committee_clarifications", {}).get("data", {}).get("clarifications"):
-            cleaned["committee_clarifications"] = data["committee_clarifications"]["data"]["clarifications"]
-        
-        return cleaned
-
     try:
         # Fetch and broadcast governance data using helper function (full data with metadata)
-        response_data = broadcast_governance_data(governance_id, validated_section, validated_sub_section)
-        
-        # Clean the response data for tool return (remove metadata, keep only essential info)
-        cleaned_data = clean_response_data(response_data)
+        response_data = await broadcast_governance_data_async(governance_id, validated_section, validated_sub_section)
         
-        return cleaned_data
+        # Project the response data for tool return (essential fields, within the token budget)
+        return project_governance_data(response_data)
     
     except Exception as e:
         return {
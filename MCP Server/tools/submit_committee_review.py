@@ -0,0 +1,119 @@
+async def submit_committee_review(governance_id: str, committees: list, clarifications: dict = None) -> dict:
+    """
+    Submit committee clarification answers and committee statuses in a single operation.
+
+    Combines update_committee_clarification and update_committee_status: all
+    input is validated before anything is written, the clarification answers
+    are stored first, the committee statuses are only updated once every
+    answer was stored, and one broadcast covers both changes.
+
+    Supported committees and section codes:
+    - committee_1: core_business_impact, internal_users_only, tech_approved_org
+    - committee_2: sensitive_data, system_integration, block_other_teams
+    - committee_3: regulatory_compliance, reputation_impact, multi_business_scale
+
+    Args:
+        governance_id: The governance ID (e.g., "GOV0001")
+        committees: List of committee objects, each containing:
+            - committee: The committee type - "committee_1", "committee_2", or "committee_3"
+            - status: The status to set - "Approved", "Rejected", or "Pending"
+        clarifications: Optional mapping of committee type to its list of clarification objects, each containing:
+            - unique_code: The clarification code (e.g., "core_business_impact")
+            - user_answer: The user's answer to the clarification
+            - status: Status of the clarification - "pending" or "completed"
+
+    Example:
+        submit_committee_review(
+            governance_id="GOV0002",
+            committees=[
+                {"committee": "committee_1", "status": "Approved"},
+                {"committee": "committee_2", "status": "Approved"}
+            ],
+            clarifications={
+                "committee_2": [
+                    {"unique_code": "system_integration", "user_answer": "No", "status": "completed"}
+                ]
+            }
+        )
+
+    Returns:
+        Dictionary containing:
+            - message: Success/error message
+            - clarifications: Updated clarifications data per committee
+            - committee_status: Updated committee statuses, or None if not updated
+            - error: Present if a write failed
+    """
+    from config import API_BASE_URL
+    from utilities.api_helpers import queue_governance_broadcast, patch_governance_section, invalidate_governance_sections
+    from utilities.backend_client import put_json_async, BackendHTTPError
+    from utilities.validators import SubmitCommitteeReviewRequest
+
+    # Step 1: Validate clarifications and statuses together, before any write
+    try:
+        validated = SubmitCommitteeReviewRequest(
+            governance_id=governance_id,
+            committees=committees,
+            clarifications=clarifications or {}
+        )
+    except ValueError as e:
+        return {
+            "error": f"Validation error: {str(e)}"
+        }
+
+    governance_id = validated.governance_id
+    result = {"message": "", "clarifications": {}, "committee_status": None}
+    written_sections = []
+
+    try:
+        # Step 2: Store the clarification answers one committee at a time; the
+        # backend rewrites the whole clarifications record on every update
+        for committee, items in validated.clarifications.items():
+            if not items:
+                continue
+            url = f"{API_BASE_URL}/committee-clarifications/{governance_id}/{committee}"
+            payload = {
+                "clarifications": [
+                    {
+                        "unique_code": item.unique_code,
+                        "user_answer": item.user_answer,
+                        "status": item.status
+                    }
+                    for item in items
+                ]
+            }
+            response = await put_json_async(url, payload)
+            patch_governance_section(governance_id, 'committee_clarifications', response)
+            if 'committee_clarifications' not in written_sections:
+                written_sections.append('committee_clarifications')
+            result["clarifications"][committee] = response
+
+        # Step 3: Update all committee statuses once the answers are stored
+        status_payload = {"governance_id": governance_id}
+        for committee_item in validated.committees:
+            status_payload[committee_item.committee] = committee_item.status
+
+        result["committee_status"] = await put_json_async(f"{API_BASE_URL}/risk-analyse/update-committee", status_payload)
+        invalidate_governance_sections(governance_id, ['risk_details'])
+        written_sections.append('risk_details')
+        result["message"] = "Committee review submitted successfully"
+
+    except BackendHTTPError as e:
+        result.update(e.to_error_dict())
+        result["message"] = "Committee review partially submitted" if written_sections else "Committee review not submitted"
+    except Exception as e:
+        result["error"] = f"Error submitting committee review: {str(e)}"
+        result["message"] = "Committee review partially submitted" if written_sections else "Committee review not submitted"
+
+    # Step 4: One broadcast for everything that was written
+    if written_sections:
+        try:
+            queue_governance_broadcast(
+                governance_id,
+                section='commitee_approval',
+                sub_section=validated.committees[0].committee,
+                sections=written_sections
+            )
+        except Exception as broadcast_error:
+            print(f"Warning: Failed to queue governance details broadcast: {broadcast_error}")
+
+    return result
@@ -1,4 +1,4 @@
-def update_committee_clarification(
+async def update_committee_clarification(
     governance_id: str,
     committee: str,
     clarifications: list
@@ -26,63 +26,10 @@ def update_committee_clarification(
             - message: Success/error message
             - data: Updated clarifications data with all committee entries
     """
-    import urllib.request
-    import json
     from config import API_BASE_URL
-    from pydantic import BaseModel, field_validator
-    from typing import List
-    from utilities.api_helpers import broadcast_governance_data
-    
-    # Define valid codes per committee
-    COMMITTEE_1_CODES = ['core_business_impact', 'internal_users_only', 'tech_approved_org']
-    COMMITTEE_2_CODES = ['sensitive_data', 'system_integration', 'block_other_teams']
-    COMMITTEE_3_CODES = ['regulatory_compliance', 'reputation_impact', 'multi_business_scale']
-    
-    ALL_SECTION_CODES = COMMITTEE_1_CODES + COMMITTEE_2_CODES + COMMITTEE_3_CODES
-    
-    # Pydantic validation models
-    class CommitteeClarificationItem(BaseModel):
-        unique_code: str
-        user_answer: str
-        status: str
-        
-        @field_validator('unique_code')
-        @classmethod
-        def validate_unique_code(cls, v: str) -> str:
-            if v not in ALL_SECTION_CODES:
-                raise ValueError(
-                    f'unique_code must be one of:\n'
-                    f'  Committee 1: {COMMITTEE_1_CODES}\n'
-                    f'  Committee 2: {COMMITTEE_2_CODES}\n'
-                    f'  Committee 3: {COMMITTEE_3_CODES}'
-                )
-            return v
-        
-        @field_validator('user_answer')
-        @classmethod
-        def validate_user_answer(cls, v: str) -> str:
-            if not v or not v.strip():
-                raise ValueError('user_answer cannot be empty')
-            return v.strip()
-        
-        @field_validator('status')
-        @classmethod
-        def validate_status(cls, v: str) -> str:
-            if v not in ['pending', 'completed']:
-                raise ValueError('status must be either "pending" or "completed"')
-            return v
-    
-    class UpdateCommitteeClarificationsRequest(BaseModel):
-        committee: str
-        clarifications: List[CommitteeClarificationItem]
-        
-        @field_validator('committee')
-        @classmethod
-        def validate_committee(cls, v: str) -> str:
-            valid_committees = ['committee_1', 'committee_2', 'committee_3']
-            if v not in valid_committees:
-                raise ValueError(f'committee must be one of {valid_committees}')
-            return v
+    from utilities.api_helpers import queue_governance_broadcast, patch_governance_section
+    from utilities.backend_client import put_json_async, BackendHTTPError
+    from utilities.validators import UpdateCommitteeClarificationsRequest, COMMITTEE_CLARIFICATION_CODES
     
     try:
         # Validate input
@@ -92,12 +39,7 @@ def update_committee_clarification(
         )
         
         # Validate that all section codes belong to the specified committee
-        committee_codes_map = {
-            'committee_1': COMMITTEE_1_CODES,
-            'committee_2': COMMITTEE_2_CODES,
-            'committee_3': COMMITTEE_3_CODES
-        }
-        valid_codes_for_committee = committee_codes_map[validated.committee]
+        valid_codes_for_committee = COMMITTEE_CLARIFICATION_CODES[validated.committee]
         
         for item in validated.clarifications:
             if item.unique_code not in valid_codes_for_committee:
@@ -119,39 +61,20 @@ def update_committee_clarification(
             ]
         }
         
-        data = json.dumps(payload).encode('utf-8')
-        req = urllib.request.Request(
-            url,
-            data=data,
-            headers={'Content-Type': 'application/json'},
-            method='PUT'
-        )
+        response = await put_json_async(url, payload)
+        patch_governance_section(governance_id, 'committee_clarifications', response)
         
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            response = json.load(resp)
-            
-            # Broadcast the updated governance data
-            broadcast_governance_data(governance_id, section='commitee_approval', sub_section=validated.committee)
-            
-            return response
+        # Broadcast the updated governance data
+        queue_governance_broadcast(governance_id, section='commitee_approval', sub_section=validated.committee, sections=['committee_clarifications'])
+        
+        return response
             
     except ValueError as e:
         return {
             "error": f"Validation error: {str(e)}"
         }
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode('utf-8')
-        try:
-            error_data = json.loads(error_body)
-            return {
-                "error": f"HTTP {e.code}: {error_data.get('message', 'Unknown error')}",
-                "status_code": e.code
-            }
-        except json.JSONDecodeError:
-            return {
-                "error": f"HTTP {e.code}: {error_body}",
-                "status_code": e.code
-            }
+    except BackendHTTPError as e:
+        return e.to_error_dict()
     except Exception as e:
         return {
             "error": f"Error updating committee clarifications: {str(e)}"
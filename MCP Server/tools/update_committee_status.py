@@ -1,14 +1,10 @@
 from pydantic import BaseModel, field_validator, ValidationError
-from typing import Literal, Optional, List
-import urllib.request
-import urllib.error
+from typing import List
 import json
 from config import API_BASE_URL
-from utilities.api_helpers import broadcast_governance_data
-
-class CommitteeStatusItem(BaseModel):
-    committee: Literal['committee_1', 'committee_2', 'committee_3']
-    status: Literal['Approved', 'Rejected', 'Pending']
+from utilities.api_helpers import queue_governance_broadcast, invalidate_governance_sections
+from utilities.backend_client import put_json_async, BackendHTTPError, BackendConnectionError
+from utilities.validators import CommitteeStatusItem
 
 class CommitteeUpdateModel(BaseModel):
     governance_id: str
@@ -27,7 +23,7 @@ class CommitteeUpdateModel(BaseModel):
         return v
 
 
-def update_committee_status(governance_id: str, committees: list) -> dict:
+async def update_committee_status(governance_id: str, committees: list) -> dict:
     """
     Update the status of multiple committees for a governance record in a single operation.
     
@@ -72,45 +68,32 @@ def update_committee_status(governance_id: str, committees: list) -> dict:
     url = f"{API_BASE_URL}/risk-analyse/update-committee"
     
     try:
-        # Convert payload to JSON bytes
-        data = json.dumps(payload).encode('utf-8')
-        
-        # Create request with headers
-        req = urllib.request.Request(
-            url,
-            data=data,
-            headers={'Content-Type': 'application/json'},
-            method='PUT'
-        )
+        # Make the API call
+        resp_data = await put_json_async(url, payload)
+        invalidate_governance_sections(governance_id, ['risk_details'])
         
-        # Make the API call with timeout
-        with urllib.request.urlopen(req, timeout=10) as response:
-            resp_data = json.load(response)
-            
-            # Broadcast for each committee that was updated
-            for committee_item in validated.committees:
-                try:
-                    broadcast_governance_data(
-                        governance_id, 
-                        section='commitee_approval', 
-                        sub_section=committee_item.committee
-                    )
-                    print(f"Broadcasted update for {committee_item.committee}")
-                except Exception as broadcast_error:
-                    print(f"Failed to broadcast for {committee_item.committee}: {broadcast_error}")
-            
-            return {"message": "Committee statuses updated successfully", "data": resp_data}
-    except urllib.error.HTTPError as http_err:
-        error_body = http_err.read().decode('utf-8')
+        # One broadcast for all updated committees, navigating to the first one
+        first_committee = validated.committees[0].committee
         try:
-            error_data = json.loads(error_body)
+            queue_governance_broadcast(
+                governance_id,
+                section='commitee_approval',
+                sub_section=first_committee,
+                sections=['risk_details']
+            )
+            print(f"Queued broadcast of committee status update for governance_id: {governance_id}")
+        except Exception as broadcast_error:
+            print(f"Failed to queue broadcast for {first_committee}: {broadcast_error}")
+        
+        return {"message": "Committee statuses updated successfully", "data": resp_data}
+    except BackendHTTPError as http_err:
+        if isinstance(http_err.data, dict):
             return {
-                "message": f"HTTP Error {http_err.code}: {error_data.get('message', http_err.reason)}",
-                "status_code": http_err.code
+                "message": f"HTTP Error {http_err.status_code}: {http_err.data.get('message', http_err.reason)}",
+                "status_code": http_err.status_code
             }
-        except json.JSONDecodeError:
-            return {"message": f"HTTP Error {http_err.code}: {http_err.reason}"}
-    except urllib.error.URLError as url_err:
+        return {"message": f"HTTP Error {http_err.status_code}: {http_err.reason}"}
+    except BackendConnectionError as url_err:
         return {"message": f"Connection error: {url_err.reason}"}
     except json.JSONDecodeError as json_err:
         return {"message": f"Failed to parse response: {json_err}"}
@@ -1,9 +1,198 @@
 """
 API Helper utilities for fetching and broadcasting governance data.
 """
-import urllib.request
-import json
-from typing import Dict
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Dict, Hashable, Iterable, Optional
+from config import GOVERNANCE_FETCH_MAX_WORKERS, BROADCAST_COALESCE_WINDOW_SECONDS, BROADCAST_MAX_PENDING, BROADCAST_MAX_WORKERS
+from utilities.backend_client import get_json, get_json_async, BackendHTTPError
+from utilities.broadcast_dispatcher import BroadcastDispatcher
+from utilities.snapshot_cache import snapshot_cache
+
+
+# Sections of the governance aggregate, in the order they appear in the response
+GOVERNANCE_SECTIONS = (
+    "chat_history",
+    "governance_report",
+    "risk_details",
+    "cost_details",
+    "environment_details",
+    "cost_clarifications",
+    "environment_clarifications",
+    "committee_clarifications"
+)
+
+# Fields the section GETs add to each listed record (the backend's record
+# key); the create endpoints return the record without them
+LISTED_RECORD_KEYS = ("id",)
+
+# Bounded pool shared by all governance refreshes so concurrent refreshes
+# cannot open an unbounded number of backend requests
+_fetch_executor = ThreadPoolExecutor(
+    max_workers=GOVERNANCE_FETCH_MAX_WORKERS,
+    thread_name_prefix="governance-fetch"
+)
+
+# Background revalidation of sections served from the persistent snapshot
+# store; separate from _fetch_executor because a revalidation waits on fetches
+_revalidate_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="governance-revalidate")
+_revalidating = set()
+_revalidating_lock = threading.Lock()
+_revalidation_stats = {"scheduled": 0, "changed": 0, "failed": 0}
+
+
+class _SingleFlight:
+    """
+    Coalesce concurrent calls that share a key into a single execution.
+    
+    The first caller for a key runs the function; callers arriving while it
+    is in flight wait for it and receive the same result (or exception).
+    Threads (do) and event-loop callers (do_async) share one registry, so a
+    sync and an async refresh of the same sections share one fetch. An async
+    execution runs as a task on its caller's loop: callers on that loop
+    await the task, shielded so that a cancelled caller does not cancel the
+    shared fetch; threads and other loops wait for its completion instead.
+    """
+
+    class _Call:
+        def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+            # Loop running the execution as a task; None when a thread runs it
+            self.loop = loop
+            self.task: Optional[asyncio.Task] = None
+            self.done = threading.Event()
+            self.result = None
+            self.error: Optional[BaseException] = None
+            self._callbacks = []
+            self._lock = threading.Lock()
+
+        def finish(self, result, error: Optional[BaseException]):
+            self.result = result
+            self.error = error
+            with self._lock:
+                self.done.set()
+                callbacks, self._callbacks = self._callbacks, []
+            for callback in callbacks:
+                callback()
+
+        def on_done(self, callback: Callable[[], None]):
+            """Call callback (from any thread) once the execution has finished."""
+            with self._lock:
+                if not self.done.is_set():
+                    self._callbacks.append(callback)
+                    return
+            callback()
+
+        def outcome(self):
+            if self.error is not None:
+                raise self.error
+            return self.result
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, "_SingleFlight._Call"] = {}
+        self.executions = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable):
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None and call.loop is not None and call.loop is running_loop:
+                # Blocking would stall the loop that runs the execution
+                call = None
+                is_leader = False
+            elif call is not None:
+                self.coalesced += 1
+                is_leader = False
+            else:
+                call = self._Call()
+                self._calls[key] = call
+                self.executions += 1
+                is_leader = True
+
+        if call is None:
+            return fn()
+        if not is_leader:
+            call.done.wait()
+            return call.outcome()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self._finish(key, call, None, e)
+            raise
+        self._finish(key, call, result, None)
+        return result
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable]):
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.coalesced += 1
+            else:
+                call = self._Call(loop)
+                self._calls[key] = call
+                self.executions += 1
+                call.task = loop.create_task(fn())
+                call.task.add_done_callback(lambda task: self._finish_task(key, call, task))
+
+        if call.loop is loop:
+            return await asyncio.shield(call.task)
+        
+        # Run by a thread or on another loop: wait for its completion on this loop
+        waiter = loop.create_future()
+        call.on_done(lambda: _call_soon_threadsafe(loop, _settle, waiter, call))
+        return await waiter
+
+    def _finish_task(self, key: Hashable, call: "_SingleFlight._Call", task: asyncio.Task):
+        if task.cancelled():
+            self._finish(key, call, None, asyncio.CancelledError())
+            return
+        error = task.exception()
+        self._finish(key, call, None if error is not None else task.result(), error)
+
+    def _finish(self, key: Hashable, call: "_SingleFlight._Call", result, error: Optional[BaseException]):
+        with self._lock:
+            if self._calls.get(key) is call:
+                del self._calls[key]
+        call.finish(result, error)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "in_flight": len(self._calls),
+                "executions": self.executions,
+                "coalesced": self.coalesced
+            }
+
+
+def _call_soon_threadsafe(loop: asyncio.AbstractEventLoop, callback: Callable, *args):
+    try:
+        loop.call_soon_threadsafe(callback, *args)
+    except RuntimeError:
+        # The waiting loop was closed; nobody awaits the result any more
+        pass
+
+
+def _settle(waiter: asyncio.Future, call: "_SingleFlight._Call"):
+    if waiter.done():
+        return
+    if isinstance(call.error, asyncio.CancelledError):
+        waiter.cancel()
+    elif call.error is not None:
+        waiter.set_exception(call.error)
+    else:
+        waiter.set_result(call.result)
+
+
+# Shares in-flight backend fetches between concurrent refreshes of the same sections
+_fetch_flight = _SingleFlight()
 
 
 def fetch_api_data(url: str, endpoint_name: str) -> dict:
@@ -18,24 +207,9 @@ def fetch_api_data(url: str, endpoint_name: str) -> dict:
         Dictionary containing the API response data or error information
     """
     try:
-        req = urllib.request.Request(url, method='GET')
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            return json.load(resp)
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode('utf-8')
-        try:
-            error_data = json.loads(error_body)
-            return {
-                "error": f"HTTP {e.code}: {error_data.get('message', 'Unknown error')}",
-                "status_code": e.code,
-                "endpoint": endpoint_name
-            }
-        except json.JSONDecodeError:
-            return {
-                "error": f"HTTP {e.code}: {error_body}",
-                "status_code": e.code,
-                "endpoint": endpoint_name
-            }
+        return get_json(url)
+    except BackendHTTPError as e:
+        return e.to_error_dict(endpoint=endpoint_name)
     except Exception as e:
         return {
             "error": f"Error fetching {endpoint_name}: {str(e)}",
@@ -43,16 +217,43 @@ def fetch_api_data(url: str, endpoint_name: str) -> dict:
         }
 
 
-def fetch_all_governance_data(governance_id: str, section: str = 'none', sub_section: str = 'none') -> Dict:
+async def fetch_api_data_async(url: str, endpoint_name: str) -> dict:
+    """Async variant of fetch_api_data."""
+    try:
+        return await get_json_async(url)
+    except BackendHTTPError as e:
+        return e.to_error_dict(endpoint=endpoint_name)
+    except Exception as e:
+        return {
+            "error": f"Error fetching {endpoint_name}: {str(e)}",
+            "endpoint": endpoint_name
+        }
+
+
+async def run_write_steps(steps: Dict[str, Awaitable]) -> Dict[str, object]:
     """
-    Fetch all governance-related data from multiple API endpoints.
+    Run independent backend writes concurrently, capturing errors per step.
     
     Args:
-        governance_id: The governance ID to fetch data for
-        section: Section filter for the response
+        steps: Dictionary mapping a step name to the awaitable performing it
     
     Returns:
-        Dictionary containing all governance data aggregated from multiple endpoints
+        Dictionary mapping each step name to its result, or to the exception
+        it raised; one failing step does not cancel the others
+    """
+    results = await asyncio.gather(*steps.values(), return_exceptions=True)
+    return dict(zip(steps.keys(), results))
+
+
+def get_section_urls(governance_id: str) -> Dict[str, str]:
+    """
+    Build the backend URL for every governance data section.
+    
+    Args:
+        governance_id: The governance ID to build URLs for
+    
+    Returns:
+        Dictionary mapping section name to its API URL
     """
     from config import (
         CHAT_HISTORY_API_URL,
@@ -65,61 +266,355 @@ def fetch_all_governance_data(governance_id: str, section: str = 'none', sub_sec
         COMMITTEE_CLARIFICATIONS_API_URL
     )
     
-    # Construct API URLs
-    chat_history_url = f"{CHAT_HISTORY_API_URL}/{governance_id}"
-    governance_report_url = f"{GOVERNANCE_REPORT_API_URL}/{governance_id}"
-    risk_details_url = f"{RISK_DETAILS_API_URL}/{governance_id}"
-    cost_details_url = f"{COST_DETAILS_API_URL}/{governance_id}"
-    environment_details_url = f"{ENVIRONMENT_DETAILS_API_URL}/{governance_id}"
-    cost_clarifications_url = f"{COST_CLARIFICATIONS_API_URL}/governance/{governance_id}"
-    environment_clarifications_url = f"{ENVIRONMENT_CLARIFICATIONS_API_URL}/governance/{governance_id}"
-    committee_clarifications_url = f"{COMMITTEE_CLARIFICATIONS_API_URL}/governance/{governance_id}"
+    return {
+        "chat_history": f"{CHAT_HISTORY_API_URL}/{governance_id}",
+        "governance_report": f"{GOVERNANCE_REPORT_API_URL}/{governance_id}",
+        "risk_details": f"{RISK_DETAILS_API_URL}/{governance_id}",
+        "cost_details": f"{COST_DETAILS_API_URL}/{governance_id}",
+        "environment_details": f"{ENVIRONMENT_DETAILS_API_URL}/{governance_id}",
+        "cost_clarifications": f"{COST_CLARIFICATIONS_API_URL}/governance/{governance_id}",
+        "environment_clarifications": f"{ENVIRONMENT_CLARIFICATIONS_API_URL}/governance/{governance_id}",
+        "committee_clarifications": f"{COMMITTEE_CLARIFICATIONS_API_URL}/governance/{governance_id}"
+    }
+
+
+def fetch_governance_sections(governance_id: str, sections: Iterable[str] = GOVERNANCE_SECTIONS, use_cache: bool = True) -> Dict[str, dict]:
+    """
+    Fetch the given governance sections concurrently.
+    
+    Sections found in the snapshot cache are served from it, then sections
+    found in the persistent snapshot store (revalidated in the background);
+    the remaining sections are fetched on the shared bounded thread pool and
+    stored in the cache. Failures are isolated per section: a failing endpoint yields its
+    error dictionary while the other sections are returned normally.
+    
+    Args:
+        governance_id: The governance ID to fetch data for
+        sections: Names of the sections to fetch (see GOVERNANCE_SECTIONS)
+        use_cache: Whether to serve sections from the snapshot cache
+    
+    Returns:
+        Dictionary mapping section name to the API response or error information
+    """
+    sections = list(sections)
+    section_data = _cached_sections(governance_id, sections) if use_cache else {}
+
+    missing = [section for section in sections if section not in section_data]
+    if missing and use_cache:
+        section_data.update(_persisted_sections(governance_id, missing))
+        missing = [section for section in missing if section not in section_data]
+    if missing:
+        # Concurrent callers for the same governance ID, sections and cache
+        # version share one backend fetch instead of each issuing their own
+        version = snapshot_cache.version(governance_id)
+        flight_key = (governance_id, frozenset(missing), version)
+        section_data.update(_fetch_flight.do(
+            flight_key,
+            lambda: _fetch_sections_from_backend(governance_id, missing, version)
+        ))
+
+    return {section: section_data[section] for section in sections}
+
+
+async def fetch_governance_sections_async(governance_id: str, sections: Iterable[str] = GOVERNANCE_SECTIONS, use_cache: bool = True) -> Dict[str, dict]:
+    """
+    Async variant of fetch_governance_sections.
+    
+    The missing sections are fetched concurrently on the event loop with the
+    async backend client instead of the thread pool.
+    """
+    sections = list(sections)
+    section_data = _cached_sections(governance_id, sections) if use_cache else {}
+
+    missing = [section for section in sections if section not in section_data]
+    if missing and use_cache:
+        section_data.update(_persisted_sections(governance_id, missing))
+        missing = [section for section in missing if section not in section_data]
+    if missing:
+        version = snapshot_cache.version(governance_id)
+        flight_key = (governance_id, frozenset(missing), version)
+        section_data.update(await _fetch_flight.do_async(
+            flight_key,
+            lambda: _fetch_sections_from_backend_async(governance_id, missing, version)
+        ))
+
+    return {section: section_data[section] for section in sections}
+
+
+def _cached_sections(governance_id: str, sections: Iterable[str]) -> Dict[str, dict]:
+    section_data = {}
+    for section in sections:
+        cached = snapshot_cache.get(governance_id, section)
+        if cached is not None:
+            section_data[section] = cached
+    return section_data
+
+
+def _persisted_sections(governance_id: str, sections: Iterable[str]) -> Dict[str, dict]:
+    """
+    Serve sections from the persistent snapshot store and revalidate them in the background.
+    
+    Returns:
+        Dictionary of the sections found in the store
+    """
+    persisted = {}
+    for section in sections:
+        data = snapshot_cache.get_persisted(governance_id, section)
+        if data is not None:
+            persisted[section] = data
+    if persisted:
+        _schedule_revalidation(governance_id, persisted)
+    return persisted
+
+
+def _schedule_revalidation(governance_id: str, stale: Dict[str, dict]):
+    key = (governance_id, frozenset(stale))
+    with _revalidating_lock:
+        if key in _revalidating:
+            return
+        _revalidating.add(key)
+        _revalidation_stats["scheduled"] += 1
+    _revalidate_executor.submit(_revalidate_sections, key, governance_id, stale)
+
+
+def _revalidate_sections(key, governance_id: str, stale: Dict[str, dict]):
+    """Refetch sections served from the persistent store and broadcast those that changed."""
+    from utilities.json_patch import content_hash
+    
+    try:
+        fresh = fetch_governance_sections(governance_id, stale.keys(), use_cache=False)
+        changed = [
+            section for section, data in fresh.items()
+            if "error" not in data and content_hash(data) != content_hash(stale[section])
+        ]
+        if changed:
+            with _revalidating_lock:
+                _revalidation_stats["changed"] += 1
+            queue_governance_broadcast(governance_id, sections=changed)
+    except Exception as e:
+        with _revalidating_lock:
+            _revalidation_stats["failed"] += 1
+        print(f"Failed to revalidate persisted sections of {governance_id}: {e}")
+    finally:
+        with _revalidating_lock:
+            _revalidating.discard(key)
+
+
+def _fetch_sections_from_backend(governance_id: str, sections: Iterable[str], version: int) -> Dict[str, dict]:
+    """Fetch sections on the bounded thread pool and store them in the snapshot cache."""
+    section_urls = get_section_urls(governance_id)
+    futures = {
+        section: _fetch_executor.submit(fetch_api_data, section_urls[section], section)
+        for section in sections
+    }
+    fetched = {}
+    for section, future in futures.items():
+        fetched[section] = future.result()
+        snapshot_cache.put(governance_id, section, fetched[section], version)
+    return fetched
+
+
+async def _fetch_sections_from_backend_async(governance_id: str, sections: Iterable[str], version: int) -> Dict[str, dict]:
+    """Fetch sections concurrently on the event loop and store them in the snapshot cache."""
+    section_urls = get_section_urls(governance_id)
+    sections = list(sections)
+    results = await asyncio.gather(*(
+        fetch_api_data_async(section_urls[section], section) for section in sections
+    ))
+    fetched = dict(zip(sections, results))
+    for section, data in fetched.items():
+        snapshot_cache.put(governance_id, section, data, version)
+    return fetched
+
+
+def get_fetch_stats() -> dict:
+    """Return counters of backend fetches and of fetches coalesced into an in-flight one."""
+    with _revalidating_lock:
+        revalidation = {**_revalidation_stats, "in_flight": len(_revalidating)}
+    return {
+        **_fetch_flight.stats(),
+        "revalidation": revalidation
+    }
+
+
+def invalidate_governance_sections(governance_id: str, sections: Optional[Iterable[str]] = None):
+    """
+    Drop cached governance sections after a write to the backend.
+    
+    The invalidation is also published to the other workers, whose caches
+    hold the same sections.
+    
+    Args:
+        governance_id: The governance ID that was written
+        sections: Sections changed by the write; all sections if not provided
+    """
+    from websocket_manager import publish_invalidation_sync
+    
+    sections = list(sections) if sections is not None else None
+    snapshot_cache.invalidate(governance_id, sections)
+    publish_invalidation_sync(governance_id, sections)
+
+
+def patch_governance_section(governance_id: str, section: str, write_response: dict, append: bool = False) -> bool:
+    """
+    Update a cached governance section from the response of a backend write.
+    
+    Write endpoints return the stored record, so the section a subsequent
+    broadcast sends can be built locally instead of being refetched.
+    
+    Args:
+        governance_id: The governance ID that was written
+        section: The section changed by the write
+        write_response: The decoded response of the write ({"message", "data"})
+        append: Whether the record is added to the section's list of records
+                (e.g. a new cost analysis) rather than replacing the section's
+                record (e.g. updated clarifications)
+    
+    Returns:
+        True if the cached section was updated; False if the response does
+        not cover the section (including an appended record lacking the
+        LISTED_RECORD_KEYS the section GET adds), in which case it is
+        invalidated and refetched on the next read. Either way the other
+        workers drop the section.
+    """
+    from websocket_manager import publish_invalidation_sync
+    
+    record = write_response.get('data') if isinstance(write_response, dict) else None
+    
+    def patch(cached: Optional[dict]) -> Optional[dict]:
+        if isinstance(record, dict) and append:
+            # Appending needs the records already stored for the governance ID,
+            # and a record in the shape the section GET lists it
+            if any(key not in record for key in LISTED_RECORD_KEYS):
+                return None
+            if cached is not None and isinstance(cached.get('data'), list):
+                records = cached['data'] + [record]
+                patched = {**cached, "data": records}
+                if "count" in cached:
+                    patched["count"] = len(records)
+                return patched
+        elif isinstance(record, dict) and record.get('governance_id') == governance_id:
+            # The record is the whole section; keep the envelope of the GET response
+            envelope = cached if cached is not None else {
+                "message": write_response.get("message", ""),
+                "governanceId": governance_id
+            }
+            return {**envelope, "data": record}
+        return None
+    
+    # Read, patch and store atomically so concurrent writes cannot lose an update
+    patched = snapshot_cache.patch(governance_id, section, patch)
+    publish_invalidation_sync(governance_id, [section])
+    return patched
+
 
+def fetch_all_governance_data(governance_id: str, section: str = 'none', sub_section: str = 'none') -> Dict:
+    """
+    Fetch all governance-related data from multiple API endpoints.
+    
+    Args:
+        governance_id: The governance ID to fetch data for
+        section: Section filter for the response
+    
+    Returns:
+        Dictionary containing all governance data aggregated from multiple endpoints
+    """
     print(f"Fetching governance details for: {governance_id}")
     
-    # Fetch all data
-    chat_history = fetch_api_data(chat_history_url, "chat_history")
-    governance_report = fetch_api_data(governance_report_url, "governance_report")
-    risk_details = fetch_api_data(risk_details_url, "risk_details")
-    cost_details = fetch_api_data(cost_details_url, "cost_details")
-    environment_details = fetch_api_data(environment_details_url, "environment_details")
-    cost_clarifications = fetch_api_data(cost_clarifications_url, "cost_clarifications")
-    environment_clarifications = fetch_api_data(environment_clarifications_url, "environment_clarifications")
-    committee_clarifications = fetch_api_data(committee_clarifications_url, "committee_clarifications")
+    # Fetch all sections concurrently
+    section_data = fetch_governance_sections(governance_id)
 
     # Aggregate all data into a single response object
     response_data = {
         "governance_id": governance_id,
         "section": section,
         "sub_section": sub_section,
-        "chat_history": chat_history,
-        "governance_report": governance_report,
-        "risk_details": risk_details,
-        "cost_details": cost_details,
-        "environment_details": environment_details,
-        "cost_clarifications": cost_clarifications,
-        "environment_clarifications": environment_clarifications,
-        "committee_clarifications": committee_clarifications
+        **section_data
     }
     
     return response_data
 
 
-def broadcast_governance_data(governance_id: str, section: str = 'none', sub_section: str = 'none') -> Dict:
+async def fetch_all_governance_data_async(governance_id: str, section: str = 'none', sub_section: str = 'none') -> Dict:
+    """Async variant of fetch_all_governance_data."""
+    print(f"Fetching governance details for: {governance_id}")
+    
+    section_data = await fetch_governance_sections_async(governance_id)
+
+    return {
+        "governance_id": governance_id,
+        "section": section,
+        "sub_section": sub_section,
+        **section_data
+    }
+
+
+def fetch_partial_governance_data(governance_id: str, sections: Iterable[str], section: str = 'none', sub_section: str = 'none') -> Dict:
+    """
+    Fetch only the given governance sections.
+    
+    Args:
+        governance_id: The governance ID to fetch data for
+        sections: Names of the sections to include (see GOVERNANCE_SECTIONS)
+        section: Section filter for the response
+        sub_section: Sub-section filter for the response
+    
+    Returns:
+        Dictionary with the same shape as fetch_all_governance_data, containing
+        only the requested sections and marked with "partial": True
+    """
+    print(f"Fetching governance sections {list(sections)} for: {governance_id}")
+    
+    section_data = fetch_governance_sections(governance_id, sections)
+
+    return {
+        "governance_id": governance_id,
+        "section": section,
+        "sub_section": sub_section,
+        "partial": True,
+        **section_data
+    }
+
+
+async def fetch_partial_governance_data_async(governance_id: str, sections: Iterable[str], section: str = 'none', sub_section: str = 'none') -> Dict:
+    """Async variant of fetch_partial_governance_data."""
+    sections = list(sections)
+    print(f"Fetching governance sections {sections} for: {governance_id}")
+    
+    section_data = await fetch_governance_sections_async(governance_id, sections)
+
+    return {
+        "governance_id": governance_id,
+        "section": section,
+        "sub_section": sub_section,
+        "partial": True,
+        **section_data
+    }
+
+
+def broadcast_governance_data(governance_id: str, section: str = 'none', sub_section: str = 'none', sections: Optional[Iterable[str]] = None) -> Dict:
     """
     Fetch and broadcast governance data to all connected WebSocket clients.
     
     Args:
         governance_id: The governance ID to fetch and broadcast
         section: Section filter for the response
+        sub_section: Sub-section filter for the response
+        sections: Data sections affected by the change. When provided (and
+                  partial broadcasts are enabled) only these sections are
+                  fetched and sent; otherwise the full snapshot is broadcast.
     
     Returns:
         Dictionary containing the response data that was broadcasted
     """
+    from config import PARTIAL_BROADCASTS_ENABLED
     from websocket_manager import broadcast_governance_details_sync
     
-    # Fetch all governance data
-    response_data = fetch_all_governance_data(governance_id, section, sub_section)
+    # Fetch the affected sections, or the full snapshot
+    if sections is not None and PARTIAL_BROADCASTS_ENABLED:
+        response_data = fetch_partial_governance_data(governance_id, sections, section, sub_section)
+    else:
+        response_data = fetch_all_governance_data(governance_id, section, sub_section)
     
     # Broadcast the governance details to all connected WebSocket clients
     try:
@@ -130,3 +625,75 @@ def broadcast_governance_data(governance_id: str, section: str = 'none', sub_sec
         # Continue execution even if broadcast fails
     
     return response_data
+
+
+async def broadcast_governance_data_async(governance_id: str, section: str = 'none', sub_section: str = 'none', sections: Optional[Iterable[str]] = None) -> Dict:
+    """
+    Async variant of broadcast_governance_data.
+    
+    The governance data is fetched on the event loop, and the broadcast is
+    awaited until it is queued for the clients (directly when the WebSocket
+    endpoint runs on the same loop, WS_MODE=asgi). A navigating broadcast
+    supersedes the navigation of the broadcast queued for the governance ID.
+    """
+    from config import PARTIAL_BROADCASTS_ENABLED
+    from websocket_manager import broadcast_governance_details_async
+    
+    if section != 'none':
+        _broadcast_dispatcher.drop_navigation(governance_id)
+    
+    if sections is not None and PARTIAL_BROADCASTS_ENABLED:
+        response_data = await fetch_partial_governance_data_async(governance_id, sections, section, sub_section)
+    else:
+        response_data = await fetch_all_governance_data_async(governance_id, section, sub_section)
+    
+    try:
+        await broadcast_governance_details_async(response_data)
+        print(f"Governance details broadcasted for governance_id: {governance_id}")
+    except Exception as broadcast_error:
+        print(f"Failed to broadcast governance details: {broadcast_error}")
+    
+    return response_data
+
+
+def _dispatch_broadcast(governance_id: str, section: str, sub_section: str, sections: Optional[list]):
+    broadcast_governance_data(governance_id, section, sub_section, sections)
+
+
+_broadcast_dispatcher = BroadcastDispatcher(
+    _dispatch_broadcast,
+    window_seconds=BROADCAST_COALESCE_WINDOW_SECONDS,
+    max_pending=BROADCAST_MAX_PENDING,
+    max_workers=BROADCAST_MAX_WORKERS
+)
+
+
+def queue_governance_broadcast(governance_id: str, section: str = 'none', sub_section: str = 'none', sections: Optional[Iterable[str]] = None):
+    """
+    Queue a governance broadcast without waiting for it.
+    
+    The broadcast is performed by the background dispatcher, which merges all
+    broadcasts queued for the same governance ID within a short window into a
+    single fetch and send. With the dispatcher disabled the broadcast still runs
+    on its worker pool, only without merging, so the caller (usually the MCP
+    event loop) is never blocked. Use broadcast_governance_data instead when the
+    caller needs the broadcast data.
+    
+    Args:
+        governance_id: The governance ID to fetch and broadcast
+        section: Section filter for the response
+        sub_section: Sub-section filter for the response
+        sections: Data sections affected by the change, or None for the full snapshot
+    """
+    from config import BROADCAST_DISPATCHER_ENABLED
+    
+    if not BROADCAST_DISPATCHER_ENABLED:
+        _broadcast_dispatcher.dispatch_now(governance_id, section, sub_section, sections)
+        return
+    
+    _broadcast_dispatcher.submit(governance_id, section, sub_section, sections)
+
+
+def get_broadcast_stats() -> dict:
+    """Return queue depth and merge counters of the broadcast dispatcher."""
+    return _broadcast_dispatcher.stats()
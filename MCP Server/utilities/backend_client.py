@@ -0,0 +1,350 @@
+"""
+Shared HTTP client for calls from the MCP tools to the Project Backend.
+
+A pooled client (one per event loop for async calls) keeps TCP connections
+to the backend alive between requests, so tool calls and governance data refreshes reuse connections
+instead of opening a new one for every request. Requests go through the
+retry and circuit breaker policies of utilities.resilience, and GET
+requests are made conditional with the ETags stored in utilities.etag_cache.
+"""
+import asyncio
+import json
+import threading
+import time
+import weakref
+from typing import Optional
+
+import httpx
+
+from config import (
+    BACKEND_POOL_SIZE,
+    BACKEND_POOL_KEEPALIVE,
+    BACKEND_KEEPALIVE_EXPIRY,
+    BACKEND_CONNECT_TIMEOUT,
+    BACKEND_READ_TIMEOUT,
+    BACKEND_POOL_TIMEOUT
+)
+from utilities.etag_cache import etag_cache
+from utilities.resilience import (
+    RETRYABLE_STATUS_CODES,
+    backoff_delay,
+    breaker_admits,
+    endpoint_key,
+    get_breaker,
+    max_attempts,
+    may_retry,
+    record_outcome,
+    release_probe,
+    retry_budget
+)
+
+# Headers of a GET repeated after a 304 that cannot be served from the validator cache
+_REFETCH_HEADERS = {"Cache-Control": "no-cache"}
+
+
+class BackendHTTPError(Exception):
+    """Raised when the backend responds with an HTTP error status."""
+
+    def __init__(self, status_code: int, body: str, reason: str = ''):
+        self.status_code = status_code
+        self.body = body
+        self.reason = reason
+        try:
+            self.data = json.loads(body)
+        except json.JSONDecodeError:
+            self.data = None
+        super().__init__(f"HTTP {status_code}: {self.message}")
+
+    @property
+    def message(self) -> str:
+        """Error message reported by the backend, or the raw body if it is not JSON."""
+        if not isinstance(self.data, dict):
+            return self.body
+        return self.data.get('message', 'Unknown error')
+
+    def to_error_dict(self, **extra) -> dict:
+        """
+        Build the error dictionary returned by tools for HTTP errors.
+        
+        Args:
+            **extra: Additional keys to include in the error dictionary
+        
+        Returns:
+            Dictionary with error message and status code
+        """
+        return {
+            "error": f"HTTP {self.status_code}: {self.message}",
+            "status_code": self.status_code,
+            **extra
+        }
+
+
+class BackendConnectionError(Exception):
+    """Raised when the backend cannot be reached or does not answer in time."""
+
+    def __init__(self, reason: str):
+        self.reason = reason
+        super().__init__(reason)
+
+
+class BackendCircuitOpenError(BackendConnectionError):
+    """Raised without calling the backend while the endpoint's circuit breaker is open."""
+
+    def __init__(self, endpoint: str, retry_after: float):
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+        super().__init__(
+            f"Circuit breaker open for backend endpoint '{endpoint}', retry in {retry_after:.0f}s"
+        )
+
+
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+# Async clients per event loop: the tools' loop and the WebSocket server loop
+# (WS_MODE=thread) each keep their own pool; entries go away with their loop
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def _client_settings() -> dict:
+    return {
+        "limits": httpx.Limits(
+            max_connections=BACKEND_POOL_SIZE,
+            max_keepalive_connections=BACKEND_POOL_KEEPALIVE,
+            keepalive_expiry=BACKEND_KEEPALIVE_EXPIRY
+        ),
+        "timeout": httpx.Timeout(
+            BACKEND_READ_TIMEOUT,
+            connect=BACKEND_CONNECT_TIMEOUT,
+            pool=BACKEND_POOL_TIMEOUT
+        )
+    }
+
+
+def get_client() -> httpx.Client:
+    """Return the process-wide pooled HTTP client, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(**_client_settings())
+    return _client
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Return the pooled async HTTP client of the running event loop.
+    
+    Async connections are bound to the loop they were opened on, so every
+    event loop gets its own client, created on first use.
+    """
+    loop = asyncio.get_running_loop()
+    with _client_lock:
+        client = _async_clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(**_client_settings())
+            _async_clients[loop] = client
+        return client
+
+
+def close_client():
+    """Close the pooled HTTP client and release its connections."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+async def close_async_client():
+    """Close the pooled async HTTP client of the running event loop and release its connections."""
+    with _client_lock:
+        client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def _conditional_headers(method: str, url: str, first_attempt: bool = True):
+    """
+    Return the If-None-Match header for a GET of the URL and the stored (etag, body), if any.
+    
+    Only the first attempt of a request is counted in the validator cache statistics.
+    """
+    if method.upper() != 'GET':
+        return None, None
+    cached = etag_cache.lookup(url, count=first_attempt)
+    if cached is None:
+        return None, None
+    return {"If-None-Match": cached[0]}, cached
+
+
+def _decode_response(method: str, url: str, resp: httpx.Response, cached=None):
+    if resp.status_code == 304:
+        if cached is None:
+            # Still not modified after the unconditional refetch: there is no body to decode
+            raise BackendHTTPError(resp.status_code, resp.text, resp.reason_phrase)
+        etag_cache.record_not_modified(url, cached[1])
+        return json.loads(cached[1])
+
+    if resp.is_error:
+        raise BackendHTTPError(resp.status_code, resp.text, resp.reason_phrase)
+
+    if method.upper() == 'GET':
+        etag_cache.store(url, resp.headers.get('etag'), resp.content)
+    return resp.json()
+
+
+def _unservable_not_modified(resp: Optional[httpx.Response], cached) -> bool:
+    """A 304 without a stored body to serve (e.g. sent by a proxy) must be fetched again in full."""
+    return resp is not None and resp.status_code == 304 and cached is None
+
+
+def _send(method: str, url: str, payload: Optional[dict], headers: Optional[dict], probe: bool):
+    """Send one attempt; returns (response, transport error)."""
+    try:
+        return get_client().request(method, url, json=payload, headers=headers), None
+    except httpx.TransportError as e:
+        return None, e
+    except BaseException:
+        # No outcome to record: let the next call probe a half-open endpoint
+        if probe:
+            release_probe(url)
+        raise
+
+
+async def _send_async(method: str, url: str, payload: Optional[dict], headers: Optional[dict], probe: bool):
+    """Async variant of _send; also releases the probe when the attempt is cancelled."""
+    try:
+        return await get_async_client().request(method, url, json=payload, headers=headers), None
+    except httpx.TransportError as e:
+        return None, e
+    except BaseException:
+        if probe:
+            release_probe(url)
+        raise
+
+
+def _check_breaker(url: str) -> bool:
+    """Raise if the endpoint's circuit breaker is open; returns whether this call holds its half-open probe."""
+    allowed, probe = breaker_admits(url)
+    if not allowed:
+        raise BackendCircuitOpenError(endpoint_key(url), get_breaker(url).retry_after())
+    return probe
+
+
+def _attempt_outcome(url: str, resp: Optional[httpx.Response], error: Optional[httpx.TransportError]):
+    """
+    Record the outcome of one attempt and return the error to retry on, if any.
+    
+    Transport errors and 5xx responses count as endpoint failures; only
+    transport errors and RETRYABLE_STATUS_CODES are worth retrying.
+    """
+    if error is not None:
+        record_outcome(url, success=False)
+        return BackendConnectionError(str(error) or error.__class__.__name__)
+
+    record_outcome(url, success=resp.status_code < 500)
+    if resp.status_code in RETRYABLE_STATUS_CODES:
+        return BackendHTTPError(resp.status_code, resp.text, resp.reason_phrase)
+    return None
+
+
+def request_json(method: str, url: str, payload: Optional[dict] = None):
+    """
+    Send a request to the backend and decode the JSON response.
+    
+    GET requests failing with a connection error or a 502/503/504 status are
+    retried with jittered backoff within the retry budgets. GET requests send
+    the stored ETag of the URL and a 304 response returns the stored body; a
+    304 without a stored body is fetched again without validator.
+    
+    Args:
+        method: HTTP method (GET, POST, PUT)
+        url: The full URL to call
+        payload: Optional JSON body
+    
+    Returns:
+        The decoded JSON response
+    
+    Raises:
+        BackendHTTPError: If the backend responds with an error status
+        BackendConnectionError: If the backend cannot be reached
+        BackendCircuitOpenError: If the endpoint's circuit breaker is open
+    """
+    started_at = time.monotonic()
+    attempts = max_attempts(method)
+    retry_budget.deposit()
+    
+    for attempt in range(1, attempts + 1):
+        probe = _check_breaker(url)
+        headers, cached = _conditional_headers(method, url, first_attempt=attempt == 1)
+        resp, transport_error = _send(method, url, payload, headers, probe)
+        if _unservable_not_modified(resp, cached):
+            resp, transport_error = _send(method, url, payload, _REFETCH_HEADERS, probe)
+        
+        retry_error = _attempt_outcome(url, resp, transport_error)
+        if retry_error is None:
+            return _decode_response(method, url, resp, cached)
+        
+        delay = backoff_delay(attempt)
+        if attempt == attempts or not may_retry(started_at, delay):
+            raise retry_error from transport_error
+        print(f"Retrying {method} {url} in {delay:.2f}s after: {retry_error}")
+        time.sleep(delay)
+
+
+async def request_json_async(method: str, url: str, payload: Optional[dict] = None):
+    """
+    Send a request to the backend without blocking the event loop.
+    
+    Same arguments, return value, retries and exceptions as request_json.
+    """
+    started_at = time.monotonic()
+    attempts = max_attempts(method)
+    retry_budget.deposit()
+    
+    for attempt in range(1, attempts + 1):
+        probe = _check_breaker(url)
+        headers, cached = _conditional_headers(method, url, first_attempt=attempt == 1)
+        resp, transport_error = await _send_async(method, url, payload, headers, probe)
+        if _unservable_not_modified(resp, cached):
+            resp, transport_error = await _send_async(method, url, payload, _REFETCH_HEADERS, probe)
+        
+        retry_error = _attempt_outcome(url, resp, transport_error)
+        if retry_error is None:
+            return _decode_response(method, url, resp, cached)
+        
+        delay = backoff_delay(attempt)
+        if attempt == attempts or not may_retry(started_at, delay):
+            raise retry_error from transport_error
+        print(f"Retrying {method} {url} in {delay:.2f}s after: {retry_error}")
+        await asyncio.sleep(delay)
+
+
+def get_json(url: str):
+    """Send a GET request to the backend and return the decoded JSON response."""
+    return request_json('GET', url)
+
+
+def post_json(url: str, payload: dict):
+    """Send a POST request with a JSON body and return the decoded JSON response."""
+    return request_json('POST', url, payload)
+
+
+def put_json(url: str, payload: dict):
+    """Send a PUT request with a JSON body and return the decoded JSON response."""
+    return request_json('PUT', url, payload)
+
+
+async def get_json_async(url: str):
+    """Async variant of get_json."""
+    return await request_json_async('GET', url)
+
+
+async def post_json_async(url: str, payload: dict):
+    """Async variant of post_json."""
+    return await request_json_async('POST', url, payload)
+
+
+async def put_json_async(url: str, payload: dict):
+    """Async variant of put_json."""
+    return await request_json_async('PUT', url, payload)
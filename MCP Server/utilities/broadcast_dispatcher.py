@@ -0,0 +1,186 @@
+"""
+Background dispatcher for governance broadcasts.
+
+Tools queue a broadcast intent and return immediately. A scheduler thread
+waits a short window, merges all intents queued for the same governance_id
+during that window, and hands a single fetch and send for them to a small
+worker pool. Different governance IDs are broadcast in parallel; broadcasts of
+the same governance ID never overlap, so they are sent in order.
+"""
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Optional, Set
+
+
+class BroadcastDispatcher:
+    """Queue broadcast intents and dispatch them coalesced per governance ID."""
+
+    def __init__(self, broadcast_fn: Callable, window_seconds: float, max_pending: int, max_workers: int):
+        """
+        Args:
+            broadcast_fn: Function performing the broadcast, called as
+                          broadcast_fn(governance_id, section, sub_section, sections)
+            window_seconds: How long intents for a governance ID are collected before dispatch
+            max_pending: Maximum number of governance IDs waiting for dispatch; intents
+                         for further governance IDs are shed (counted as overflow)
+            max_workers: Maximum number of broadcasts running at the same time
+        """
+        self._broadcast_fn = broadcast_fn
+        self.window_seconds = window_seconds
+        self.max_pending = max_pending
+        self.max_workers = max_workers
+        # governance_id -> merged intent, in order of first submission (and therefore due time)
+        self._pending: "OrderedDict[str, dict]" = OrderedDict()
+        # Governance IDs whose broadcast is running
+        self._in_flight: Set[str] = set()
+        # Broadcasts queued or running through dispatch_now
+        self._direct = 0
+        self._condition = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="broadcast")
+        self.submitted = 0
+        self.dispatched = 0
+        self.dispatched_intents = 0
+        self.failed = 0
+        self.overflow = 0
+
+    def submit(self, governance_id: str, section: str = 'none', sub_section: str = 'none', sections: Optional[Iterable[str]] = None):
+        """
+        Queue a broadcast for a governance ID.
+
+        Intents for the same governance ID are merged: the latest navigating
+        section and sub_section win (an intent with section 'none' keeps the
+        navigation of the earlier ones), and the data sections are unioned (a
+        full broadcast, sections=None, absorbs any partial one). Never blocks
+        on the broadcast; when max_pending governance IDs are already waiting,
+        the intent is shed.
+
+        Args:
+            governance_id: The governance ID to broadcast
+            section: Section filter for the response
+            sub_section: Sub-section filter for the response
+            sections: Data sections affected by the change, or None for the full snapshot
+        """
+        with self._condition:
+            self.submitted += 1
+            intent = self._pending.get(governance_id)
+            if intent is not None:
+                if section != 'none':
+                    intent["section"] = section
+                    intent["sub_section"] = sub_section
+                if intent["sections"] is None or sections is None:
+                    intent["sections"] = None
+                else:
+                    intent["sections"].update(dict.fromkeys(sections))
+                intent["intents"] += 1
+            elif len(self._pending) >= self.max_pending:
+                self.overflow += 1
+                print(f"Broadcast queue full, broadcast for {governance_id} shed")
+            else:
+                self._pending[governance_id] = self._new_intent(section, sub_section, sections)
+                self._ensure_worker()
+                self._condition.notify()
+
+    def drop_navigation(self, governance_id: str):
+        """
+        Keep the pending broadcast of a governance ID from navigating.
+
+        Called when a newer navigating broadcast for the governance ID was
+        sent directly; the pending broadcast then only refreshes the data and
+        no longer moves the frontend back to an older section.
+        """
+        with self._condition:
+            intent = self._pending.get(governance_id)
+            if intent is not None:
+                intent["section"] = 'none'
+                intent["sub_section"] = 'none'
+
+    def dispatch_now(self, governance_id: str, section: str = 'none', sub_section: str = 'none', sections: Optional[Iterable[str]] = None):
+        """Run a broadcast on the worker pool without merging or waiting for it; shed beyond max_pending."""
+        with self._condition:
+            self.submitted += 1
+            if self._direct >= self.max_pending:
+                self.overflow += 1
+                print(f"Broadcast queue full, broadcast for {governance_id} shed")
+                return
+            self._direct += 1
+        self._executor.submit(self._dispatch_direct, governance_id, self._new_intent(section, sub_section, sections))
+
+    def _dispatch_direct(self, governance_id: str, intent: dict):
+        try:
+            self._dispatch(governance_id, intent)
+        finally:
+            with self._condition:
+                self._direct -= 1
+
+    def _new_intent(self, section: str, sub_section: str, sections: Optional[Iterable[str]]) -> dict:
+        return {
+            "due": time.monotonic() + self.window_seconds,
+            "section": section,
+            "sub_section": sub_section,
+            "sections": dict.fromkeys(sections) if sections is not None else None,
+            "intents": 1
+        }
+
+    def _ensure_worker(self):
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name="broadcast-dispatcher", daemon=True)
+            self._worker.start()
+
+    def _next_ready(self):
+        """Return the oldest pending (governance_id, intent) not being broadcast, or None."""
+        if len(self._in_flight) >= self.max_workers:
+            return None
+        return next(((gid, intent) for gid, intent in self._pending.items() if gid not in self._in_flight), None)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                ready = self._next_ready()
+                if ready is None:
+                    self._condition.wait()
+                    continue
+                governance_id, intent = ready
+                delay = intent["due"] - time.monotonic()
+                if delay > 0:
+                    self._condition.wait(delay)
+                    continue
+                del self._pending[governance_id]
+                self._in_flight.add(governance_id)
+            self._executor.submit(self._dispatch_in_flight, governance_id, intent)
+
+    def _dispatch_in_flight(self, governance_id: str, intent: dict):
+        try:
+            self._dispatch(governance_id, intent)
+        finally:
+            with self._condition:
+                self._in_flight.discard(governance_id)
+                self._condition.notify()
+
+    def _dispatch(self, governance_id: str, intent: dict):
+        sections = list(intent["sections"]) if intent["sections"] is not None else None
+        try:
+            self._broadcast_fn(governance_id, intent["section"], intent["sub_section"], sections)
+        except Exception as e:
+            with self._condition:
+                self.failed += 1
+            print(f"Failed to dispatch broadcast for {governance_id}: {e}")
+        with self._condition:
+            self.dispatched += 1
+            self.dispatched_intents += intent["intents"]
+
+    def stats(self) -> dict:
+        """Return queue depth, dispatch counters and the average number of intents merged per dispatch."""
+        with self._condition:
+            return {
+                "queue_depth": len(self._pending),
+                "in_flight": len(self._in_flight) + self._direct,
+                "queued_intents": sum(intent["intents"] for intent in self._pending.values()),
+                "submitted": self.submitted,
+                "dispatched": self.dispatched,
+                "failed": self.failed,
+                "overflow": self.overflow,
+                "merge_ratio": round(self.dispatched_intents / self.dispatched, 4) if self.dispatched else 0.0
+            }
@@ -0,0 +1,148 @@
+"""
+Per-governance index of pending clarifications.
+
+The committee, environment and cost clarification sections are indexed into
+one ordered queue of pending items, in the order the agents work through
+them (committee_1..3, then environment, then cost). The index listens to the
+snapshot cache, so writes that patch or invalidate a clarification section
+update it immediately; reads check that each indexed section is still the
+payload being served and re-index the sections that changed.
+"""
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from config import SNAPSHOT_CACHE_MAX_GOVERNANCES
+from utilities.snapshot_cache import snapshot_cache
+from utilities.validators import COMMITTEES
+
+# Clarification sections in queue order
+CLARIFICATION_SECTIONS = (
+    "committee_clarifications",
+    "environment_clarifications",
+    "cost_clarifications"
+)
+
+_SECTION_TYPES = {
+    "committee_clarifications": "committee",
+    "environment_clarifications": "environment",
+    "cost_clarifications": "cost"
+}
+
+
+def _pending_items(section: str, payload: dict) -> List[dict]:
+    """Extract the pending clarifications of a section payload, in backend order."""
+    record = payload.get("data") if isinstance(payload, dict) else None
+    clarifications = record.get("clarifications") if isinstance(record, dict) else None
+    if not clarifications:
+        return []
+
+    if section == "committee_clarifications":
+        groups = [(committee, clarifications.get(committee) or []) for committee in COMMITTEES] if isinstance(clarifications, dict) else []
+    else:
+        groups = [(None, clarifications)] if isinstance(clarifications, list) else []
+
+    items = []
+    for committee, group in groups:
+        for clarification in group:
+            if not isinstance(clarification, dict) or clarification.get("status") != "pending":
+                continue
+            item = {"type": _SECTION_TYPES[section]}
+            if committee is not None:
+                item["committee"] = committee
+            item["unique_code"] = clarification.get("unique_code")
+            item["clarification"] = clarification.get("clarification")
+            items.append(item)
+    return items
+
+
+class PendingClarificationIndex:
+    """Thread-safe LRU index of the pending clarifications of each governance ID."""
+
+    def __init__(self, max_governances: int):
+        """
+        Args:
+            max_governances: Maximum number of governance IDs kept in the index
+        """
+        self.max_governances = max_governances
+        # governance_id -> {section: (payload, pending items)}
+        self._entries: "OrderedDict[str, Dict[str, tuple]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.rebuilds = 0
+
+    def index_section(self, governance_id: str, section: str, payload: dict) -> List[dict]:
+        """
+        Index the pending clarifications of a section payload.
+
+        Returns:
+            The pending items of the section
+        """
+        items = _pending_items(section, payload)
+        with self._lock:
+            sections = self._entries.setdefault(governance_id, {})
+            sections[section] = (payload, items)
+            self._entries.move_to_end(governance_id)
+            while len(self._entries) > self.max_governances:
+                self._entries.popitem(last=False)
+            self.rebuilds += 1
+        return items
+
+    def on_snapshot_change(self, governance_id: Optional[str], section: Optional[str], data: Optional[dict]):
+        """Snapshot cache listener: re-index stored clarification sections, drop removed ones."""
+        if governance_id is None:
+            with self._lock:
+                self._entries.clear()
+        elif section is None:
+            with self._lock:
+                self._entries.pop(governance_id, None)
+        elif section in CLARIFICATION_SECTIONS:
+            if data is not None:
+                self.index_section(governance_id, section, data)
+            else:
+                with self._lock:
+                    self._entries.get(governance_id, {}).pop(section, None)
+
+    def pending_queue(self, governance_id: str, payloads: Dict[str, dict]) -> List[dict]:
+        """
+        Return the ordered queue of pending clarifications.
+
+        Args:
+            governance_id: The governance ID
+            payloads: Current payload of each clarification section; sections
+                      whose indexed payload differs are re-indexed
+
+        Returns:
+            Pending items of all sections in queue order, numbered by "position"
+        """
+        queue = []
+        for section in CLARIFICATION_SECTIONS:
+            payload = payloads.get(section)
+            if payload is None:
+                continue
+            with self._lock:
+                indexed = self._entries.get(governance_id, {}).get(section)
+                if indexed is not None and indexed[0] is payload:
+                    self._entries.move_to_end(governance_id)
+                    self.hits += 1
+                    items = indexed[1]
+                else:
+                    items = None
+            if items is None:
+                items = self.index_section(governance_id, section, payload)
+            queue.extend(items)
+        return [{"position": position, **item} for position, item in enumerate(queue, start=1)]
+
+    def stats(self) -> dict:
+        """Return the size of the index and its hit/rebuild counters."""
+        with self._lock:
+            return {
+                "governances": len(self._entries),
+                "hits": self.hits,
+                "rebuilds": self.rebuilds
+            }
+
+
+# Global index, kept up to date by the snapshot cache
+clarification_index = PendingClarificationIndex(max_governances=SNAPSHOT_CACHE_MAX_GOVERNANCES)
+snapshot_cache.add_listener(clarification_index.on_snapshot_change)
@@ -0,0 +1,109 @@
+"""
+Validator cache for conditional GET requests to the Project Backend.
+
+The backend sends an ETag with every GET response. The last body and ETag of
+each URL are kept here so the next GET can send If-None-Match; when the
+backend answers 304 Not Modified the stored body is served instead of
+downloading it again. Bodies are kept as raw bytes and decoded per request,
+so callers never share a mutable response object.
+"""
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from config import BACKEND_ETAG_CACHE_ENABLED, BACKEND_ETAG_CACHE_MAX_ENTRIES
+from utilities.resilience import endpoint_key
+
+
+class ETagCache:
+    """Thread-safe LRU store of (ETag, body) per URL with per-endpoint 304 counters."""
+
+    def __init__(self, max_entries: int, enabled: bool = True):
+        self.max_entries = max_entries
+        self.enabled = enabled
+        # url -> (etag, body)
+        self._entries: "OrderedDict[str, Tuple[str, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # endpoint -> {"requests", "conditional", "not_modified", "bytes_saved"}
+        self._endpoint_stats: Dict[str, Dict[str, int]] = {}
+
+    def _stats_for(self, url: str) -> Dict[str, int]:
+        return self._endpoint_stats.setdefault(
+            endpoint_key(url),
+            {"requests": 0, "conditional": 0, "not_modified": 0, "bytes_saved": 0}
+        )
+
+    def lookup(self, url: str, count: bool = True) -> Optional[Tuple[str, bytes]]:
+        """
+        Return the stored ETag and body of a URL before a GET is sent.
+
+        The body is returned together with the ETag so that a 304 response
+        can be served even if the entry is evicted while the request runs.
+
+        Args:
+            url: The full URL about to be requested
+            count: Whether to count the request in the statistics; False for
+                   the retries of a request already counted
+
+        Returns:
+            Tuple of (etag, body), or None if the URL has no stored response
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            stats = self._stats_for(url)
+            if count:
+                stats["requests"] += 1
+            cached = self._entries.get(url)
+            if cached is None:
+                return None
+            self._entries.move_to_end(url)
+            if count:
+                stats["conditional"] += 1
+            return cached
+
+    def store(self, url: str, etag: Optional[str], body: bytes):
+        """
+        Remember the body of a successful GET response.
+
+        Args:
+            url: The requested URL
+            etag: The ETag header of the response; without one the stored entry is dropped
+            body: The raw response body
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            if not etag:
+                self._entries.pop(url, None)
+                return
+            self._entries[url] = (etag, body)
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def record_not_modified(self, url: str, body: bytes):
+        """Count a 304 Not Modified response served from the stored body."""
+        with self._lock:
+            stats = self._stats_for(url)
+            stats["not_modified"] += 1
+            stats["bytes_saved"] += len(body)
+
+    def stats(self) -> dict:
+        """Return the number of stored responses and the 304 ratio per endpoint."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "endpoints": {
+                    endpoint: {
+                        **stats,
+                        "not_modified_ratio": round(stats["not_modified"] / stats["requests"], 4) if stats["requests"] else 0.0
+                    }
+                    for endpoint, stats in self._endpoint_stats.items()
+                }
+            }
+
+
+# Global validator cache used by the backend client
+etag_cache = ETagCache(BACKEND_ETAG_CACHE_MAX_ENTRIES, enabled=BACKEND_ETAG_CACHE_ENABLED)
@@ -0,0 +1,50 @@
+"""
+Helpers for content hashing and JSON-patch (RFC 6902) diffs of JSON payloads.
+"""
+import hashlib
+import json
+from typing import Any, List
+
+
+def content_hash(value: Any) -> str:
+    """Return a stable SHA-256 hash of a JSON-serializable value."""
+    encoded = json.dumps(value, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def _escape(key: str) -> str:
+    return str(key).replace('~', '~0').replace('/', '~1')
+
+
+def make_patch(old: Any, new: Any, path: str = '') -> List[dict]:
+    """
+    Build a JSON patch that turns `old` into `new`.
+    
+    Objects are diffed key by key; lists and scalar values that differ are
+    replaced as a whole.
+    
+    Args:
+        old: The previous JSON value
+        new: The new JSON value
+        path: JSON pointer of the values being compared
+    
+    Returns:
+        List of JSON patch operations (add, remove, replace)
+    """
+    if old == new:
+        return []
+
+    if not isinstance(old, dict) or not isinstance(new, dict):
+        return [{"op": "replace", "path": path, "value": new}]
+
+    operations = []
+    for key in old:
+        if key not in new:
+            operations.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+    for key, value in new.items():
+        child_path = f"{path}/{_escape(key)}"
+        if key not in old:
+            operations.append({"op": "add", "path": child_path, "value": value})
+        else:
+            operations.extend(make_patch(old[key], value, child_path))
+    return operations
@@ -0,0 +1,299 @@
+"""
+Token-budgeted projection of governance data for LLM-facing tools.
+
+Tools return governance data to the agents, where every byte becomes prompt
+tokens. A projection keeps only the fields selected by a field mask and, if
+the result exceeds a token budget, trims it deterministically: the longest
+strings are shortened first, then the longest lists. The same input always
+yields the same output, and projections are cached per snapshot content:
+keyed by the snapshot cache's section versions when the data comes from the
+cache, otherwise by a hash of the masked view.
+"""
+import copy
+import json
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from config import PROJECTION_MAX_TOKENS, PROJECTION_CACHE_MAX_ENTRIES
+from utilities.json_patch import content_hash
+from utilities.snapshot_cache import snapshot_cache
+
+# Rough size of a token in bytes of JSON, used to convert token budgets
+BYTES_PER_TOKEN = 4
+
+# Shortest length a string is trimmed to
+MIN_STRING_LENGTH = 64
+
+# Strings are only trimmed if that saves more than the truncation marker adds
+MARKER_LENGTH = 40
+
+# Field mask: section -> (path to the value inside the section payload,
+# fields to keep with their defaults, or None to keep the whole value)
+FieldMask = Dict[str, Tuple[tuple, Optional[Dict[str, Any]]]]
+
+DEFAULT_FIELD_MASK: FieldMask = {
+    # governance_report - keep only report_content and documents
+    "governance_report": (("data", 0), {"report_content": None, "documents": []}),
+    # risk_details - keep only essential risk info
+    "risk_details": (("data", 0), {
+        "risk_level": None,
+        "reason": None,
+        "committee_1": None,
+        "committee_2": None,
+        "committee_3": None
+    }),
+    # cost_details - keep only cost_breakdown and total
+    "cost_details": (("data", 0), {"total_estimated_cost": None, "cost_breakdown": []}),
+    # environment_details - keep only environment info
+    "environment_details": (("data", 0), {"environment": None, "region": None, "environment_breakdown": []}),
+    # clarifications - keep only the clarifications (array, or object with nested committees)
+    "cost_clarifications": (("data", "clarifications"), None),
+    "environment_clarifications": (("data", "clarifications"), None),
+    "committee_clarifications": (("data", "clarifications"), None)
+}
+
+# Field mask of the batched section reads: the default mask plus the chat history
+SECTION_FIELD_MASK: FieldMask = {
+    "chat_history": (("data",), None),
+    **DEFAULT_FIELD_MASK
+}
+
+_cache: "OrderedDict[tuple, dict]" = OrderedDict()
+_cache_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "trimmed": 0}
+
+
+def _resolve(value: Any, path: tuple) -> Any:
+    for key in path:
+        if isinstance(key, int):
+            if not isinstance(value, list) or len(value) <= key:
+                return None
+        elif not isinstance(value, dict):
+            return None
+        value = value[key] if isinstance(key, int) else value.get(key)
+    return value
+
+
+def apply_field_mask(data: dict, field_mask: FieldMask = DEFAULT_FIELD_MASK) -> dict:
+    """
+    Keep only the masked fields of a governance data response.
+
+    Args:
+        data: Governance data as returned by fetch_all_governance_data
+        field_mask: Sections to keep and the fields to keep in each
+
+    Returns:
+        Dictionary with governance_id, section and sub_section and one entry
+        per masked section that has data
+    """
+    masked = {
+        "governance_id": data.get("governance_id"),
+        "section": data.get("section"),
+        "sub_section": data.get("sub_section")
+    }
+    for section, (path, fields) in field_mask.items():
+        value = _resolve(data.get(section), path)
+        if not value:
+            continue
+        if fields is None:
+            masked[section] = value
+        elif isinstance(value, dict):
+            masked[section] = {field: value.get(field, default) for field, default in fields.items()}
+    return masked
+
+
+def _size(value: Any) -> int:
+    return len(json.dumps(value, ensure_ascii=False, separators=(',', ':'), default=str).encode('utf-8'))
+
+
+def _leaves(value: Any, path: str, kind: type, found: List[Tuple[str, Any]]):
+    """Collect (path, value) of all values of the given type, depth first in key order."""
+    if isinstance(value, kind):
+        found.append((path, value))
+    if isinstance(value, dict):
+        for key, item in value.items():
+            _leaves(item, f"{path}.{key}" if path else str(key), kind, found)
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            _leaves(item, f"{path}[{index}]", kind, found)
+
+
+def _replace(value: Any, path: str, transform) -> Any:
+    """Return a copy of value with the element at a _leaves path transformed."""
+    def walk(node: Any, current: str) -> Any:
+        if current == path:
+            return transform(node)
+        if isinstance(node, dict):
+            return {key: walk(item, f"{current}.{key}" if current else str(key)) for key, item in node.items()}
+        if isinstance(node, list):
+            return [walk(item, f"{current}[{index}]") for index, item in enumerate(node)]
+        return node
+    return walk(value, "")
+
+
+def _truncate_string(text: str, length: int) -> str:
+    return f"{text[:length]}... [truncated {len(text) - length} chars]"
+
+
+def _trim_strings(view: dict, excess: int, trimmed: List[str]) -> dict:
+    """Shorten the longest strings to a common length so that at least `excess` characters are removed."""
+    strings: List[Tuple[str, Any]] = []
+    _leaves(view, "", str, strings)
+
+    def removed(cap: int) -> int:
+        return sum(len(text) - cap - MARKER_LENGTH for _, text in strings if len(text) > cap + MARKER_LENGTH)
+
+    # Largest common length that removes enough (water filling), by binary search
+    low, high = MIN_STRING_LENGTH, max((len(text) for _, text in strings), default=MIN_STRING_LENGTH)
+    while low < high:
+        cap = (low + high + 1) // 2
+        if removed(cap) >= excess:
+            low = cap
+        else:
+            high = cap - 1
+    cap = low
+
+    for path, text in strings:
+        if len(text) > cap + MARKER_LENGTH:
+            view = _replace(view, path, lambda node: _truncate_string(node, cap))
+            trimmed.append(path)
+    return view
+
+
+def _trim_lists(view: dict, budget: int, trimmed: List[str]) -> dict:
+    """Halve the longest lists, dropping trailing items, until the view fits the budget."""
+    dropped: Dict[str, int] = {}
+    while _size(view) > budget:
+        lists: List[Tuple[str, Any]] = []
+        _leaves(view, "", list, lists)
+        # Lists already trimmed end with a marker item that is not counted
+        candidates = [
+            (len(items) - (1 if path in dropped else 0), path, items)
+            for path, items in lists
+        ]
+        candidates = [entry for entry in candidates if entry[0] > 1]
+        if not candidates:
+            break
+        count, path, items = max(candidates, key=lambda entry: (entry[0], entry[1]))
+        keep = count // 2
+        dropped[path] = dropped.get(path, 0) + count - keep
+        marker = f"... [{dropped[path]} more items]"
+        view = _replace(view, path, lambda node: node[:keep] + [marker])
+        if path not in trimmed:
+            trimmed.append(path)
+    return view
+
+
+def _trim(masked: dict, budget: int) -> dict:
+    trimmed: List[str] = []
+    view = _trim_strings(masked, _size(masked) - budget, trimmed)
+    view = _trim_lists(view, budget, trimmed)
+    # Report trimmed paths once per list position, e.g. cost_clarifications[*].question
+    paths = []
+    for path in trimmed:
+        path = re.sub(r"\[\d+\]", "[*]", path)
+        if path not in paths:
+            paths.append(path)
+    view["truncated_fields"] = paths
+    return view
+
+
+def _cache_key(data: dict, field_mask: FieldMask, budget: int) -> Optional[tuple]:
+    """
+    Key a projection by the snapshot cache versions of the masked sections.
+
+    Returns:
+        The key, or None if a masked section is not the payload cached for it
+    """
+    governance_id = data.get("governance_id")
+    payloads = {section: data.get(section) for section in field_mask if data.get(section) is not None}
+    versions = snapshot_cache.section_versions(governance_id, payloads) if payloads else {}
+    if any(version is None for version in versions.values()):
+        return None
+    return (
+        governance_id,
+        budget,
+        data.get("section"),
+        data.get("sub_section"),
+        # The mask decides the output, including the order of its sections
+        repr(field_mask),
+        tuple(sorted(versions.items()))
+    )
+
+
+def project_governance_data(data: dict, field_mask: FieldMask = DEFAULT_FIELD_MASK, max_tokens: Optional[int] = None, max_bytes: Optional[int] = None) -> dict:
+    """
+    Project governance data to the masked fields within a size budget.
+
+    Args:
+        data: Governance data as returned by fetch_all_governance_data
+        field_mask: Sections and fields to keep (DEFAULT_FIELD_MASK by default)
+        max_tokens: Token budget of the result (PROJECTION_MAX_TOKENS by default)
+        max_bytes: Byte budget of the result; takes precedence over max_tokens
+
+    Returns:
+        The projected data. If trimming was needed, "truncated_fields" lists
+        the paths of the shortened strings and lists. Strings are not cut below
+        MIN_STRING_LENGTH characters nor lists below one item, so a very small
+        budget can be exceeded. Every call returns its own copy, which shares
+        nothing with the input or the projection cache.
+    """
+    budget = max_bytes if max_bytes is not None else (max_tokens or PROJECTION_MAX_TOKENS) * BYTES_PER_TOKEN
+    key = _cache_key(data, field_mask, budget)
+    masked = None
+    if key is None:
+        # Not served from the snapshot cache: the masked view identifies the content
+        masked = apply_field_mask(data, field_mask)
+        key = (data.get("governance_id"), budget, content_hash(masked))
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is not None:
+            _cache.move_to_end(key)
+            _stats["hits"] += 1
+            return copy.deepcopy(cached)
+        _stats["misses"] += 1
+
+    if masked is None:
+        masked = apply_field_mask(data, field_mask)
+
+    projected = masked
+    if _size(masked) > budget:
+        # Trim once to learn which fields are cut, then again with room for that note
+        projected = _trim(masked, budget)
+        overhead = _size(projected) - _size({key: value for key, value in projected.items() if key != "truncated_fields"})
+        projected = _trim(masked, budget - overhead)
+        with _cache_lock:
+            _stats["trimmed"] += 1
+
+    # The masked view still references the input (e.g. snapshot cache payloads)
+    projected = copy.deepcopy(projected)
+    with _cache_lock:
+        _cache[key] = projected
+        while len(_cache) > PROJECTION_CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+    return copy.deepcopy(projected)
+
+
+def invalidate_projections(governance_id: Optional[str] = None):
+    """Drop the cached projections of a governance ID, or all of them."""
+    with _cache_lock:
+        for key in [key for key in _cache if governance_id is None or key[0] == governance_id]:
+            del _cache[key]
+
+
+def _on_snapshot_change(governance_id: Optional[str], section: Optional[str], data: Optional[dict]):
+    # Projections are keyed by content and stay valid, but those of dropped
+    # sections would only be served again for outdated data
+    if data is None:
+        invalidate_projections(governance_id)
+
+
+def get_projection_stats() -> dict:
+    """Return hit/miss counters of the projection cache and the number of trimmed projections."""
+    with _cache_lock:
+        return {"entries": len(_cache), **_stats}
+
+
+snapshot_cache.add_listener(_on_snapshot_change)
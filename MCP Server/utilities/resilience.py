@@ -0,0 +1,262 @@
+"""
+Retry and circuit breaker policies for calls to the Project Backend.
+
+Idempotent GET requests are retried with exponential backoff and full jitter,
+limited by a retry budget (retries may only be a fraction of the traffic) and
+by a per-call time budget. Each backend endpoint has its own circuit breaker:
+after repeated failures it opens and calls fail fast until a probe request
+succeeds again.
+"""
+import random
+import threading
+import time
+from typing import Dict, Tuple
+from urllib.parse import urlsplit
+
+from config import (
+    BACKEND_RETRY_ATTEMPTS,
+    BACKEND_RETRY_BASE_DELAY,
+    BACKEND_RETRY_MAX_DELAY,
+    BACKEND_RETRY_DEADLINE_SECONDS,
+    BACKEND_RETRY_BUDGET_RATIO,
+    BACKEND_RETRY_BUDGET_RESERVE,
+    CIRCUIT_BREAKER_ENABLED,
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_RESET_SECONDS
+)
+
+# HTTP statuses worth retrying: the backend or a proxy in front of it is temporarily unavailable
+RETRYABLE_STATUS_CODES = frozenset({502, 503, 504})
+
+
+def endpoint_key(url: str) -> str:
+    """
+    Return the endpoint a URL belongs to, used to group calls per circuit breaker.
+
+    The endpoint is the backend resource, i.e. the first path segment after
+    /api (e.g. "cost-clarifications" for /api/cost-clarifications/governance/GOV0001).
+    """
+    segments = [segment for segment in urlsplit(url).path.split('/') if segment]
+    if segments and segments[0] == 'api':
+        segments = segments[1:]
+    return segments[0] if segments else '/'
+
+
+class CircuitBreaker:
+    """Closed / open / half-open circuit breaker for one backend endpoint."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int, reset_seconds: float):
+        """
+        Args:
+            name: Endpoint the breaker protects
+            failure_threshold: Consecutive failures after which the breaker opens
+            reset_seconds: How long the breaker stays open before a probe is let through
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+        self.successes = 0
+        self.failures = 0
+        self.rejected = 0
+        self.times_opened = 0
+
+    def allow(self) -> bool:
+        """
+        Return whether a call may be sent to the endpoint.
+
+        While open, calls are rejected until reset_seconds have passed; then a
+        single probe call is allowed (half-open) and its outcome decides
+        whether the breaker closes or opens again.
+        """
+        return self.admit()[0]
+
+    def admit(self) -> Tuple[bool, bool]:
+        """
+        Like allow, and also tell whether the admitted call is the half-open probe.
+
+        Returns:
+            Tuple of (allowed, probe); only the probe call may release the probe
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True, False
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_seconds:
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+            if self.state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True, True
+            self.rejected += 1
+            return False, False
+
+    def retry_after(self) -> float:
+        """Return the number of seconds until the breaker lets a probe through."""
+        with self._lock:
+            if self.state != self.OPEN:
+                return 0.0
+            return max(0.0, self.reset_seconds - (time.monotonic() - self.opened_at))
+
+    def record_success(self):
+        with self._lock:
+            self.successes += 1
+            self.consecutive_failures = 0
+            self.state = self.CLOSED
+            self._probe_in_flight = False
+
+    def release_probe(self):
+        """Let another call probe the endpoint after a probe ended without an outcome (e.g. cancelled)."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self.consecutive_failures += 1
+            if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    self.times_opened += 1
+                    print(f"Circuit breaker opened for backend endpoint: {self.name}")
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                self._probe_in_flight = False
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "successes": self.successes,
+                "failures": self.failures,
+                "rejected": self.rejected,
+                "times_opened": self.times_opened
+            }
+
+
+class RetryBudget:
+    """
+    Token bucket limiting retries to a fraction of the requests sent.
+
+    Every first attempt deposits `ratio` tokens and every retry withdraws one,
+    so during an outage retries cannot multiply the load on the backend. The
+    bucket starts with, and is capped at, `reserve` tokens so that retries
+    remain possible under low traffic.
+    """
+
+    def __init__(self, ratio: float, reserve: float):
+        self.ratio = ratio
+        self.reserve = reserve
+        self._tokens = reserve
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.exhausted = 0
+
+    def deposit(self):
+        with self._lock:
+            self._tokens = min(self.reserve, self._tokens + self.ratio)
+
+    def try_withdraw(self) -> bool:
+        with self._lock:
+            if self._tokens >= 1:
+                self._tokens -= 1
+                self.retries += 1
+                return True
+            self.exhausted += 1
+            return False
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "tokens": round(self._tokens, 2),
+                "retries": self.retries,
+                "exhausted": self.exhausted
+            }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+retry_budget = RetryBudget(BACKEND_RETRY_BUDGET_RATIO, BACKEND_RETRY_BUDGET_RESERVE)
+
+
+def get_breaker(url: str) -> CircuitBreaker:
+    """Return the circuit breaker of the endpoint a URL belongs to."""
+    key = endpoint_key(url)
+    with _breakers_lock:
+        breaker = _breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(key, CIRCUIT_BREAKER_FAILURE_THRESHOLD, CIRCUIT_BREAKER_RESET_SECONDS)
+            _breakers[key] = breaker
+        return breaker
+
+
+def breaker_admits(url: str) -> Tuple[bool, bool]:
+    """
+    Return whether the circuit breaker of the URL's endpoint lets a call
+    through, and whether that call holds the endpoint's half-open probe.
+    """
+    if not CIRCUIT_BREAKER_ENABLED:
+        return True, False
+    return get_breaker(url).admit()
+
+
+def record_outcome(url: str, success: bool):
+    """Report the outcome of a call to the circuit breaker of the URL's endpoint."""
+    if not CIRCUIT_BREAKER_ENABLED:
+        return
+    breaker = get_breaker(url)
+    if success:
+        breaker.record_success()
+    else:
+        breaker.record_failure()
+
+
+def release_probe(url: str):
+    """Release the half-open probe of the URL's endpoint when the call ended without an outcome."""
+    if CIRCUIT_BREAKER_ENABLED:
+        get_breaker(url).release_probe()
+
+
+def max_attempts(method: str) -> int:
+    """Return how many times a request may be attempted; only GET requests are retried."""
+    return max(1, BACKEND_RETRY_ATTEMPTS) if method.upper() == 'GET' else 1
+
+
+def backoff_delay(attempt: int) -> float:
+    """
+    Return the delay before the given retry (1 for the first retry).
+
+    Exponential backoff capped at BACKEND_RETRY_MAX_DELAY, with full jitter so
+    that concurrent callers do not retry in lockstep.
+    """
+    return random.uniform(0, min(BACKEND_RETRY_MAX_DELAY, BACKEND_RETRY_BASE_DELAY * (2 ** (attempt - 1))))
+
+
+def may_retry(started_at: float, delay: float) -> bool:
+    """
+    Return whether another attempt fits within the time and retry budgets.
+
+    Args:
+        started_at: time.monotonic() of the first attempt
+        delay: Backoff delay that would precede the retry
+    """
+    if time.monotonic() - started_at + delay > BACKEND_RETRY_DEADLINE_SECONDS:
+        return False
+    return retry_budget.try_withdraw()
+
+
+def get_resilience_stats() -> dict:
+    """Return circuit breaker state per endpoint and retry budget counters."""
+    with _breakers_lock:
+        breakers = dict(_breakers)
+    return {
+        "circuit_breakers": {key: breaker.stats() for key, breaker in breakers.items()},
+        "retry_budget": retry_budget.stats()
+    }
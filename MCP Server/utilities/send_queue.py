@@ -0,0 +1,142 @@
+"""
+Bounded outbound queue of a WebSocket client.
+
+Each connected client gets its own queue and writer task, so broadcasts only
+enqueue and one slow browser cannot delay the others. When a queue is full,
+the slow-consumer policy decides what happens:
+  - drop_oldest: the oldest queued message is dropped
+  - latest_per_topic: an older message of the same topic is dropped (the
+    oldest message if the topic has none queued)
+  - disconnect: the client is disconnected
+
+A topic whose message was dropped is marked as having a gap; instead of its
+next message, or once the queue is drained, the writer sends the current full
+snapshot of the topic (which also replaces the topic's other queued messages),
+so the client never applies changes on top of a message it did not receive.
+"""
+import asyncio
+from collections import deque
+from typing import Awaitable, Callable, Optional
+
+SLOW_CONSUMER_POLICIES = ("drop_oldest", "latest_per_topic", "disconnect")
+
+
+class ClientSendQueue:
+    """Bounded FIFO of outbound messages of one client, drained by its own writer task."""
+
+    def __init__(self, client_id: int, send: Callable[[str], Awaitable], max_size: int, policy: str,
+                 snapshot: Callable[[str], Optional[str]], on_overflow_disconnect: Callable[[], Awaitable]):
+        """
+        Args:
+            client_id: Identifier of the client in metrics
+            send: Coroutine function sending one message to the client
+            max_size: Maximum number of queued messages
+            policy: Slow-consumer policy, one of SLOW_CONSUMER_POLICIES
+            snapshot: Returns the current full snapshot message of a topic, or None
+            on_overflow_disconnect: Coroutine function disconnecting the client (disconnect policy)
+        """
+        if policy not in SLOW_CONSUMER_POLICIES:
+            raise ValueError(f"policy must be one of {SLOW_CONSUMER_POLICIES}")
+        self.client_id = client_id
+        self.max_size = max_size
+        self.policy = policy
+        self._send = send
+        self._snapshot = snapshot
+        self._on_overflow_disconnect = on_overflow_disconnect
+        # (topic, message) pairs; topic is None for messages that are never replaced
+        self._items: "deque[tuple]" = deque()
+        self._gaps: "dict[str, None]" = {}
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.closed = False
+        self.sent = 0
+        self.dropped = 0
+        self.max_depth = 0
+
+    def start(self, on_closed: Callable[[], Awaitable]):
+        """Start the writer task; on_closed is awaited when sending fails."""
+        self._task = asyncio.get_running_loop().create_task(self._writer(on_closed))
+
+    def put(self, message: str, topic: Optional[str] = None) -> bool:
+        """
+        Queue a message without waiting for it to be sent.
+
+        Args:
+            message: Serialized message
+            topic: Governance ID the message belongs to, if any
+
+        Returns:
+            False if the queue is closed or the client is disconnected by the policy
+        """
+        if self.closed:
+            return False
+        if len(self._items) >= self.max_size:
+            if self.policy == "disconnect":
+                self.close()
+                asyncio.get_running_loop().create_task(self._on_overflow_disconnect())
+                return False
+            self._drop(topic if self.policy == "latest_per_topic" else None)
+        self._items.append((topic, message))
+        self.max_depth = max(self.max_depth, len(self._items))
+        self._wakeup.set()
+        return True
+
+    def _drop(self, topic: Optional[str]):
+        index = 0
+        if topic is not None:
+            index = next((i for i, item in enumerate(self._items) if item[0] == topic), 0)
+        dropped_topic, _ = self._items[index]
+        del self._items[index]
+        self.dropped += 1
+        if dropped_topic is not None:
+            self._gaps[dropped_topic] = None
+
+    def _gap_snapshot(self, topic: str) -> Optional[str]:
+        """Return the full snapshot closing the gap of a topic; queued messages of the topic are contained in it."""
+        del self._gaps[topic]
+        self._items = deque(item for item in self._items if item[0] != topic)
+        return self._snapshot(topic)
+
+    async def _writer(self, on_closed: Callable[[], Awaitable]):
+        try:
+            while not self.closed:
+                await self._wakeup.wait()
+                self._wakeup.clear()
+                while (self._items or self._gaps) and not self.closed:
+                    if self._items:
+                        topic, message = self._items.popleft()
+                        if topic in self._gaps:
+                            message = self._gap_snapshot(topic) or message
+                    else:
+                        message = self._gap_snapshot(next(iter(self._gaps)))
+                        if message is None:
+                            continue
+                    await self._send(message)
+                    self.sent += 1
+        except Exception as e:
+            print(f"WebSocket client {self.client_id} send failed: {e}")
+            self.close()
+            await on_closed()
+
+    def close(self):
+        """Stop accepting messages and let the writer task finish."""
+        self.closed = True
+        self._items.clear()
+        self._gaps.clear()
+        self._wakeup.set()
+
+    def cancel(self):
+        """Close the queue and cancel the writer task."""
+        self.close()
+        if self._task is not None and self._task is not asyncio.current_task():
+            self._task.cancel()
+
+    def stats(self) -> dict:
+        """Return the queue depth and send/drop counters."""
+        return {
+            "client": self.client_id,
+            "depth": len(self._items),
+            "max_depth": self.max_depth,
+            "sent": self.sent,
+            "dropped": self.dropped
+        }
@@ -0,0 +1,117 @@
+"""
+Resolution of chat session IDs to governance IDs.
+
+A governance request is bound to its chat session once by
+create_governance_request and that mapping never changes afterwards, so
+resolved mappings are remembered and later tools skip the
+GET /governance/session/{session_id} round-trip.
+"""
+import threading
+from collections import OrderedDict
+
+from config import GOVERNANCE_API_URL, SESSION_CACHE_MAX_ENTRIES
+from utilities.backend_client import get_json, get_json_async
+
+
+class SessionNotFoundError(Exception):
+    """Raised when no governance ID can be resolved for a session ID."""
+
+
+_session_governance: "OrderedDict[str, str]" = OrderedDict()
+_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0}
+
+
+def remember_session_governance(session_id: str, governance_id: str):
+    """
+    Record the governance ID created for a chat session.
+    
+    Args:
+        session_id: User chat session ID
+        governance_id: Governance ID bound to the session
+    """
+    if not session_id or not governance_id:
+        return
+    with _lock:
+        _session_governance[session_id] = governance_id
+        _session_governance.move_to_end(session_id)
+        while len(_session_governance) > SESSION_CACHE_MAX_ENTRIES:
+            _session_governance.popitem(last=False)
+
+
+def _cached_governance_id(session_id: str):
+    with _lock:
+        governance_id = _session_governance.get(session_id)
+        if governance_id:
+            _session_governance.move_to_end(session_id)
+            _stats["hits"] += 1
+            return governance_id
+        _stats["misses"] += 1
+        return None
+
+
+def lookup_governance_id(session_id: str):
+    """
+    Return the remembered governance ID of a chat session without contacting the backend.
+    
+    Returns:
+        The governance ID, or None if the session has not been resolved yet
+    """
+    with _lock:
+        return _session_governance.get(session_id)
+
+
+def _governance_id_from_session_data(session_id: str, session_data: dict) -> str:
+    if not session_data.get('data') or len(session_data['data']) == 0:
+        raise SessionNotFoundError("No governance found for the provided session ID")
+    
+    governance_id = session_data['data'][0].get('governance_id')
+    
+    if not governance_id:
+        raise SessionNotFoundError("Governance ID not found in session data")
+    
+    remember_session_governance(session_id, governance_id)
+    return governance_id
+
+
+def resolve_governance_id(session_id: str) -> str:
+    """
+    Resolve the governance ID of a chat session.
+    
+    Args:
+        session_id: User chat session ID
+    
+    Returns:
+        The governance ID bound to the session
+    
+    Raises:
+        SessionNotFoundError: If the backend has no governance for the session
+        BackendHTTPError: If the backend responds with an error status
+        BackendConnectionError: If the backend cannot be reached
+    """
+    governance_id = _cached_governance_id(session_id)
+    if governance_id:
+        return governance_id
+
+    session_data = get_json(f"{GOVERNANCE_API_URL}/session/{session_id}")
+    return _governance_id_from_session_data(session_id, session_data)
+
+
+async def resolve_governance_id_async(session_id: str) -> str:
+    """Async variant of resolve_governance_id."""
+    governance_id = _cached_governance_id(session_id)
+    if governance_id:
+        return governance_id
+
+    session_data = await get_json_async(f"{GOVERNANCE_API_URL}/session/{session_id}")
+    return _governance_id_from_session_data(session_id, session_data)
+
+
+def get_session_cache_stats() -> dict:
+    """Return hit/miss counters and the size of the session mapping cache."""
+    with _lock:
+        return {
+            "entries": len(_session_governance),
+            "max_entries": SESSION_CACHE_MAX_ENTRIES,
+            **_stats
+        }
@@ -0,0 +1,411 @@
+"""
+In-process cache of governance snapshots.
+
+Entries are keyed by governance_id and hold one cached payload per section
+(chat_history, governance_report, risk_details, ...). Each section expires
+independently after its TTL and the cache keeps at most a fixed number of
+governance IDs, evicting the least recently used one when full. Tools that
+write to the backend update the sections they changed from the write
+response, or invalidate them when the response does not cover the section.
+
+An optional on-disk store (see snapshot_store) acts as a second tier: every
+cached payload is written behind to it by a background thread, and after a
+restart its payloads can be served while the sections are revalidated.
+"""
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+from config import (
+    SNAPSHOT_L2_ENABLED,
+    SNAPSHOT_L2_PATH,
+    SNAPSHOT_L2_MAX_BYTES,
+    SNAPSHOT_L2_MAX_AGE_SECONDS,
+    SNAPSHOT_L2_WRITE_QUEUE_MAX,
+    SNAPSHOT_CACHE_ENABLED,
+    SNAPSHOT_CACHE_TTL_SECONDS,
+    SNAPSHOT_CACHE_MAX_GOVERNANCES,
+    CHAT_HISTORY_CACHE_TTL_SECONDS
+)
+
+
+class GovernanceSnapshotCache:
+    """Thread-safe LRU cache of per-section governance data with TTL expiry."""
+
+    def __init__(self, max_governances: int, ttl_seconds: float, section_ttls: Optional[Dict[str, float]] = None, store=None, write_queue_max: int = 10000):
+        """
+        Args:
+            max_governances: Maximum number of governance IDs kept in memory
+            ttl_seconds: Default TTL of a cached section
+            section_ttls: TTL overrides per section
+            store: Optional persistent store (e.g. SQLiteSnapshotStore) used as second tier
+            write_queue_max: Maximum number of store writes waiting for the writer thread
+        """
+        self.store = store
+        self.write_queue_max = write_queue_max
+        # Store writes (action, args) in the order of the cache changes, applied by
+        # the writer thread so no disk I/O happens while the cache lock is held
+        self._write_queue: Deque[Tuple[str, tuple]] = deque()
+        # governance_id (None for clear) -> number of queued or running store writes
+        self._unwritten: Dict[Optional[str], int] = {}
+        self._write_condition = threading.Condition()
+        self._writer: Optional[threading.Thread] = None
+        self.write_queue_overflows = 0
+        self.max_governances = max_governances
+        self.ttl_seconds = ttl_seconds
+        self.section_ttls = section_ttls or {}
+        # governance_id -> {section: (stored_at, data, section_version)}
+        self._entries: "OrderedDict[str, Dict[str, tuple]]" = OrderedDict()
+        # governance_id -> write version, bumped on every invalidation. Versions
+        # come from one increasing clock and governance IDs without an entry
+        # report the highest version dropped from the map, so a version is
+        # never handed out twice for the same governance ID (no ABA after eviction)
+        self._versions: Dict[str, int] = {}
+        self._version_clock = 0
+        self._version_floor = 0
+        # Stamped on every stored payload, so it identifies the payload's content
+        self._section_clock = 0
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[Optional[str], Optional[str], Optional[dict]], None]] = []
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.updates = 0
+        self.section_hits: Dict[str, int] = {}
+        self.section_misses: Dict[str, int] = {}
+
+    def add_listener(self, listener: Callable[[Optional[str], Optional[str], Optional[dict]], None]):
+        """
+        Register a callback notified of every change to the cached sections.
+
+        The listener is called as listener(governance_id, section, data) after a
+        payload is stored, with data None after a section is dropped, with
+        section None when all sections of a governance ID are dropped and with
+        governance_id None when the cache is cleared.
+        """
+        self._listeners.append(listener)
+
+    def _notify(self, governance_id: Optional[str], section: Optional[str], data: Optional[dict]):
+        for listener in self._listeners:
+            try:
+                listener(governance_id, section, data)
+            except Exception as e:
+                print(f"Snapshot cache listener failed for {governance_id}/{section}: {e}")
+
+    def _ttl_for(self, section: str) -> float:
+        return self.section_ttls.get(section, self.ttl_seconds)
+
+    def get(self, governance_id: str, section: str) -> Optional[dict]:
+        """
+        Return the cached payload of a section, or None if it is missing or expired.
+
+        Args:
+            governance_id: The governance ID
+            section: The section name
+
+        Returns:
+            The cached section payload, or None on a miss
+        """
+        with self._lock:
+            sections = self._entries.get(governance_id)
+            cached = sections.get(section) if sections else None
+            if cached is not None and time.monotonic() - cached[0] < self._ttl_for(section):
+                self._entries.move_to_end(governance_id)
+                self.hits += 1
+                self.section_hits[section] = self.section_hits.get(section, 0) + 1
+                return cached[1]
+
+            if cached is not None:
+                del sections[section]
+            self.misses += 1
+            self.section_misses[section] = self.section_misses.get(section, 0) + 1
+            return None
+
+    def get_persisted(self, governance_id: str, section: str) -> Optional[dict]:
+        """
+        Return the payload of a section from the persistent store.
+
+        Persisted payloads may be outdated; callers serving them should
+        revalidate the section against the backend.
+
+        Returns:
+            The persisted section payload, or None if there is no store or no payload
+        """
+        if self.store is None:
+            return None
+        with self._write_condition:
+            # A queued write or delete would make the persisted payload outdated
+            if self._unwritten.get(governance_id) or self._unwritten.get(None):
+                return None
+        try:
+            persisted = self.store.get(governance_id, section)
+        except Exception as e:
+            print(f"Failed to read persisted snapshot of {governance_id}/{section}: {e}")
+            return None
+        return persisted[0] if persisted is not None else None
+
+    def _persist(self, action: str, *args):
+        """Queue a store write; called with the cache lock held so writes keep the order of the changes."""
+        if self.store is None:
+            return
+        with self._write_condition:
+            if len(self._write_queue) >= self.write_queue_max:
+                # The store cannot keep up: drop the queued writes and clear it instead
+                self.write_queue_overflows += 1
+                print("Persistent snapshot write queue full, clearing the persistent store")
+                while self._write_queue:
+                    self._count_written(self._write_queue.popleft())
+                action, args = "clear", ()
+            write = (action, args)
+            key = self._write_key(write)
+            self._unwritten[key] = self._unwritten.get(key, 0) + 1
+            self._write_queue.append(write)
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(target=self._write_behind, name="snapshot-store-writer", daemon=True)
+                self._writer.start()
+            self._write_condition.notify_all()
+
+    @staticmethod
+    def _write_key(write: Tuple[str, tuple]) -> Optional[str]:
+        action, args = write
+        return args[0] if action != "clear" else None
+
+    def _count_written(self, write: Tuple[str, tuple]):
+        key = self._write_key(write)
+        remaining = self._unwritten.get(key, 0) - 1
+        if remaining > 0:
+            self._unwritten[key] = remaining
+        else:
+            self._unwritten.pop(key, None)
+
+    def _write_behind(self):
+        while True:
+            with self._write_condition:
+                while not self._write_queue:
+                    self._write_condition.wait()
+                write = self._write_queue.popleft()
+            action, args = write
+            try:
+                getattr(self.store, action)(*args)
+            except Exception as e:
+                print(f"Failed to {action} persisted snapshot sections: {e}")
+            with self._write_condition:
+                self._count_written(write)
+                self._write_condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until all queued writes have been applied to the persistent store.
+
+        Returns:
+            True if the store is up to date, False if the timeout expired first
+        """
+        with self._write_condition:
+            return self._write_condition.wait_for(lambda: not self._unwritten, timeout)
+
+    def version(self, governance_id: str) -> int:
+        """Return the write version of a governance ID, bumped on every invalidation."""
+        with self._lock:
+            return self._versions.get(governance_id, self._version_floor)
+
+    def section_versions(self, governance_id: str, payloads: Dict[str, Optional[dict]]) -> Dict[str, Optional[int]]:
+        """
+        Return the version stamped on each section payload when it was stored.
+
+        A payload has a version only while it is the very object cached for
+        its section. Cached payloads are replaced, never modified in place, so
+        the version identifies the payload's content.
+
+        Args:
+            governance_id: The governance ID
+            payloads: Section name -> payload, e.g. as returned by get()
+
+        Returns:
+            Section name -> version, or None for payloads that are not cached
+        """
+        with self._lock:
+            sections = self._entries.get(governance_id) or {}
+            versions = {}
+            for section, payload in payloads.items():
+                cached = sections.get(section)
+                versions[section] = cached[2] if cached is not None and cached[1] is payload else None
+            return versions
+
+    def _bump_version(self, governance_id: str):
+        self._version_clock += 1
+        self._versions[governance_id] = self._version_clock
+
+    def _forget_version(self, governance_id: str):
+        self._version_floor = max(self._version_floor, self._versions.pop(governance_id, 0))
+
+    def _store(self, governance_id: str, section: str, data: dict, version: Optional[int]) -> bool:
+        """Store a payload with the lock held; returns False if the version is outdated."""
+        if version is not None and version != self._versions.get(governance_id, self._version_floor):
+            return False
+        sections = self._entries.setdefault(governance_id, {})
+        self._section_clock += 1
+        sections[section] = (time.monotonic(), data, self._section_clock)
+        self._entries.move_to_end(governance_id)
+        while len(self._entries) > self.max_governances:
+            evicted_id, _ = self._entries.popitem(last=False)
+            self._forget_version(evicted_id)
+            self.evictions += 1
+        # Queued under the lock so a concurrent invalidation cannot be overtaken
+        self._persist("put", governance_id, section, data)
+        return True
+
+    def put(self, governance_id: str, section: str, data: dict, version: Optional[int] = None):
+        """
+        Store the payload of a section.
+
+        Error responses and sections with a non-positive TTL are not cached.
+        When a version is given, the payload is only stored if the governance
+        ID has not been invalidated since that version was read, so a fetch
+        that raced with a write cannot cache stale data.
+
+        Args:
+            governance_id: The governance ID
+            section: The section name
+            data: The section payload as returned by the backend
+            version: Version returned by version() before the payload was fetched
+        """
+        if not isinstance(data, dict) or "error" in data or self._ttl_for(section) <= 0:
+            return
+
+        with self._lock:
+            if not self._store(governance_id, section, data, version):
+                return
+        self._notify(governance_id, section, data)
+
+    def update(self, governance_id: str, section: str, data: dict):
+        """
+        Replace the payload of a section with data derived from a write.
+
+        Like invalidate(), this bumps the write version, so fetches that
+        started before the write cannot overwrite the new payload.
+
+        Args:
+            governance_id: The governance ID
+            section: The section name
+            data: The new section payload
+        """
+        self.patch(governance_id, section, lambda cached: data)
+
+    def patch(self, governance_id: str, section: str, patch_fn: Callable[[Optional[dict]], Optional[dict]]) -> bool:
+        """
+        Replace the payload of a section with one derived from the cached payload.
+
+        The read, the call of patch_fn, the version bump and the store happen
+        under one lock, so concurrent writes cannot interleave and lose an
+        update. patch_fn must be quick and must not call into the cache.
+
+        Args:
+            governance_id: The governance ID
+            section: The section name
+            patch_fn: Called with the cached payload (None if missing or expired);
+                      returns the new payload, or None to drop the section
+
+        Returns:
+            True if the new payload was stored; False if the section was dropped
+        """
+        with self._lock:
+            sections = self._entries.get(governance_id)
+            cached = sections.get(section) if sections else None
+            fresh = cached is not None and time.monotonic() - cached[0] < self._ttl_for(section)
+            data = patch_fn(cached[1] if fresh else None)
+            if not isinstance(data, dict) or "error" in data:
+                self._drop(governance_id, [section])
+                stored = False
+            else:
+                self._bump_version(governance_id)
+                self.updates += 1
+                stored = self._ttl_for(section) > 0 and self._store(governance_id, section, data, None)
+        self._notify(governance_id, section, data if stored else None)
+        return stored
+
+    def invalidate(self, governance_id: str, sections: Optional[Iterable[str]] = None):
+        """
+        Drop cached sections of a governance ID.
+
+        Args:
+            governance_id: The governance ID
+            sections: Sections to drop; all sections are dropped if not provided
+        """
+        sections = list(sections) if sections is not None else None
+        with self._lock:
+            self._drop(governance_id, sections)
+        for section in sections if sections is not None else [None]:
+            self._notify(governance_id, section, None)
+
+    def _drop(self, governance_id: str, sections: Optional[List[str]]):
+        """Drop sections with the lock held, bumping the write version."""
+        self._bump_version(governance_id)
+        self.invalidations += 1
+        self._persist("delete", governance_id, sections)
+        cached_sections = self._entries.get(governance_id)
+        if cached_sections is not None:
+            if sections is None:
+                del self._entries[governance_id]
+            else:
+                for section in sections:
+                    cached_sections.pop(section, None)
+
+    def clear(self):
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+            self._version_floor = self._version_clock
+            self._persist("clear")
+        self._notify(None, None, None)
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and the current size of the cache."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            stats = {
+                "governances": len(self._entries),
+                "sections": sum(len(sections) for sections in self._entries.values()),
+                "max_governances": self.max_governances,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "updates": self.updates,
+                "section_hits": dict(self.section_hits),
+                "section_misses": dict(self.section_misses)
+            }
+        if self.store is not None:
+            with self._write_condition:
+                persistent = {
+                    "write_queue_depth": len(self._write_queue),
+                    "write_queue_overflows": self.write_queue_overflows
+                }
+            stats["persistent"] = {**self.store.stats(), **persistent}
+        else:
+            stats["persistent"] = None
+        return stats
+
+
+def _open_store():
+    if not (SNAPSHOT_CACHE_ENABLED and SNAPSHOT_L2_ENABLED):
+        return None
+    from utilities.snapshot_store import SQLiteSnapshotStore
+    try:
+        return SQLiteSnapshotStore(SNAPSHOT_L2_PATH, SNAPSHOT_L2_MAX_BYTES, SNAPSHOT_L2_MAX_AGE_SECONDS)
+    except Exception as e:
+        print(f"Warning: Persistent snapshot cache disabled, cannot open {SNAPSHOT_L2_PATH}: {e}")
+        return None
+
+
+# Global snapshot cache instance (a TTL of 0 disables caching entirely)
+snapshot_cache = GovernanceSnapshotCache(
+    max_governances=SNAPSHOT_CACHE_MAX_GOVERNANCES,
+    ttl_seconds=SNAPSHOT_CACHE_TTL_SECONDS if SNAPSHOT_CACHE_ENABLED else 0,
+    section_ttls={"chat_history": CHAT_HISTORY_CACHE_TTL_SECONDS if SNAPSHOT_CACHE_ENABLED else 0},
+    store=_open_store(),
+    write_queue_max=SNAPSHOT_L2_WRITE_QUEUE_MAX
+)
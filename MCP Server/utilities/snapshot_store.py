@@ -0,0 +1,166 @@
+"""
+On-disk second tier of the governance snapshot cache.
+
+Section payloads are persisted in a SQLite file together with a version
+stamp (the content hash of the payload), so that after a restart the MCP
+server can serve the last known data while it revalidates the sections
+against the backend. The file is bounded in size; the least recently used
+sections are evicted first.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Iterable, Optional, Tuple
+
+from utilities.json_patch import content_hash
+
+
+class SQLiteSnapshotStore:
+    """Thread-safe, size-capped SQLite store of per-section governance payloads."""
+
+    def __init__(self, path: str, max_bytes: int, max_age_seconds: float):
+        """
+        Args:
+            path: Path of the SQLite file; the directory is created if needed
+            max_bytes: Maximum total size of the stored payloads
+            max_age_seconds: Payloads older than this are not served
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS sections ("
+            " governance_id TEXT NOT NULL,"
+            " section TEXT NOT NULL,"
+            " version TEXT NOT NULL,"
+            " stored_at REAL NOT NULL,"
+            " last_access REAL NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " payload TEXT NOT NULL,"
+            " PRIMARY KEY (governance_id, section))"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS sections_last_access ON sections (last_access)")
+        self._lock = threading.Lock()
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM sections").fetchone()[0]
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+    def get(self, governance_id: str, section: str) -> Optional[Tuple[dict, str]]:
+        """
+        Return the persisted payload of a section and its version stamp.
+
+        Args:
+            governance_id: The governance ID
+            section: The section name
+
+        Returns:
+            Tuple of (payload, version), or None if the section is not stored or too old
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, version, stored_at FROM sections WHERE governance_id = ? AND section = ?",
+                (governance_id, section)
+            ).fetchone()
+            if row is None or time.time() - row[2] > self.max_age_seconds:
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE sections SET last_access = ? WHERE governance_id = ? AND section = ?",
+                (time.time(), governance_id, section)
+            )
+            self.hits += 1
+        return json.loads(row[0]), row[1]
+
+    def put(self, governance_id: str, section: str, data: dict):
+        """
+        Persist the payload of a section, evicting least recently used sections if over the size cap.
+
+        A payload whose version stamp matches the stored one only refreshes its timestamps.
+        """
+        version = content_hash(data)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT version, size FROM sections WHERE governance_id = ? AND section = ?",
+                (governance_id, section)
+            ).fetchone()
+            if row is not None and row[0] == version:
+                self._conn.execute(
+                    "UPDATE sections SET stored_at = ?, last_access = ? WHERE governance_id = ? AND section = ?",
+                    (now, now, governance_id, section)
+                )
+                return
+
+            payload = json.dumps(data, default=str)
+            size = len(payload.encode('utf-8'))
+            if size > self.max_bytes:
+                return
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sections VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (governance_id, section, version, now, now, size, payload)
+            )
+            self._total_bytes += size - (row[1] if row is not None else 0)
+            self.writes += 1
+            self._evict()
+
+    def _evict(self):
+        while self._total_bytes > self.max_bytes:
+            row = self._conn.execute(
+                "SELECT governance_id, section, size FROM sections ORDER BY last_access LIMIT 1"
+            ).fetchone()
+            if row is None:
+                self._total_bytes = 0
+                return
+            self._conn.execute(
+                "DELETE FROM sections WHERE governance_id = ? AND section = ?",
+                (row[0], row[1])
+            )
+            self._total_bytes -= row[2]
+            self.evictions += 1
+
+    def delete(self, governance_id: str, sections: Optional[Iterable[str]] = None):
+        """
+        Remove persisted sections of a governance ID.
+
+        Args:
+            governance_id: The governance ID
+            sections: Sections to remove; all sections are removed if not provided
+        """
+        with self._lock:
+            if sections is None:
+                self._conn.execute("DELETE FROM sections WHERE governance_id = ?", (governance_id,))
+            else:
+                self._conn.executemany(
+                    "DELETE FROM sections WHERE governance_id = ? AND section = ?",
+                    [(governance_id, section) for section in sections]
+                )
+            self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM sections").fetchone()[0]
+
+    def clear(self):
+        """Remove all persisted sections."""
+        with self._lock:
+            self._conn.execute("DELETE FROM sections")
+            self._total_bytes = 0
+
+    def stats(self) -> dict:
+        """Return the size of the store and its hit/miss counters."""
+        with self._lock:
+            sections = self._conn.execute("SELECT COUNT(*) FROM sections").fetchone()[0]
+            return {
+                "path": self.path,
+                "sections": sections,
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "evictions": self.evictions
+            }
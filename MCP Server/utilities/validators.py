@@ -0,0 +1,221 @@
+"""
+Shared validation models for tool payloads.
+
+The models are defined once at import time, so their validation schemas are
+compiled once and reused by every tool call instead of being rebuilt inside
+the tool functions. The clarification code lists used by the cost,
+environment and committee tools live here as well.
+"""
+from typing import Dict, List, Literal
+
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+
+# Clarification codes accepted by the backend, per clarification type
+COST_CLARIFICATION_CODES = ['resource_count', 'cost_per_resource', 'project_duration', 'licensed_software']
+ENVIRONMENT_CLARIFICATION_CODES = ['prefer_environment', 'pii_data', 'technologies', 'expected_user_count', 'architecture_type']
+
+COMMITTEE_1_CODES = ['core_business_impact', 'internal_users_only', 'tech_approved_org']
+COMMITTEE_2_CODES = ['sensitive_data', 'system_integration', 'block_other_teams']
+COMMITTEE_3_CODES = ['regulatory_compliance', 'reputation_impact', 'multi_business_scale']
+COMMITTEE_CLARIFICATION_CODES = {
+    'committee_1': COMMITTEE_1_CODES,
+    'committee_2': COMMITTEE_2_CODES,
+    'committee_3': COMMITTEE_3_CODES
+}
+ALL_COMMITTEE_CLARIFICATION_CODES = COMMITTEE_1_CODES + COMMITTEE_2_CODES + COMMITTEE_3_CODES
+
+COMMITTEES = ['committee_1', 'committee_2', 'committee_3']
+# Sections of the governance aggregate that can be read in one batched call
+READABLE_SECTIONS = Literal[
+    'chat_history', 'governance_report', 'risk_details', 'cost_details', 'environment_details',
+    'cost_clarifications', 'environment_clarifications', 'committee_clarifications'
+]
+CLARIFICATION_STATUSES = ['pending', 'completed']
+
+
+class SectionValidator(BaseModel):
+    section: Literal['governance_report', 'risk_details', 'commitee_approval', 'cost_details', 'environment_details', 'none'] = Field(
+        default='none',
+        description="Section to filter governance details"
+    )
+
+
+class SubSectionValidator(BaseModel):
+    sub_section: Literal['committee_1', 'committee_2', 'committee_3', 'none'] = Field(
+        default='none',
+        description="Sub-section to filter governance details (committee approvals)"
+    )
+
+
+class GovernanceSectionsRequest(BaseModel):
+    governance_id: str
+    sections: List[READABLE_SECTIONS] = Field(..., min_length=1)
+
+    @field_validator('governance_id')
+    @classmethod
+    def validate_governance_id(cls, v: str) -> str:
+        if not v or not v.strip():
+            raise ValueError('governance_id cannot be empty')
+        return v.strip()
+
+    @field_validator('sections')
+    @classmethod
+    def remove_duplicate_sections(cls, v: List[str]) -> List[str]:
+        return list(dict.fromkeys(v))
+
+
+class _ClarificationItem(BaseModel):
+    """Answer to a clarification question; subclasses restrict unique_code."""
+    unique_code: str = Field(..., description="The clarification code")
+    user_answer: str = Field(..., description="The user's answer to the clarification")
+    status: str = Field(..., description="Status of the clarification")
+
+    @field_validator('user_answer')
+    @classmethod
+    def validate_user_answer(cls, v: str) -> str:
+        if not v or not v.strip():
+            raise ValueError('user_answer cannot be empty')
+        return v.strip()
+
+    @field_validator('status')
+    @classmethod
+    def validate_status(cls, v: str) -> str:
+        if v not in CLARIFICATION_STATUSES:
+            raise ValueError('status must be either "pending" or "completed"')
+        return v
+
+
+class CostClarificationItem(_ClarificationItem):
+    """Individual cost clarification item for updating."""
+
+    @field_validator('unique_code')
+    @classmethod
+    def validate_unique_code(cls, v: str) -> str:
+        if v not in COST_CLARIFICATION_CODES:
+            raise ValueError(f'unique_code must be one of {COST_CLARIFICATION_CODES}')
+        return v
+
+
+class EnvironmentClarificationItem(_ClarificationItem):
+    """Individual environment clarification item for updating."""
+
+    @field_validator('unique_code')
+    @classmethod
+    def validate_unique_code(cls, v: str) -> str:
+        if v not in ENVIRONMENT_CLARIFICATION_CODES:
+            raise ValueError(f'unique_code must be one of {ENVIRONMENT_CLARIFICATION_CODES}')
+        return v
+
+
+class CommitteeClarificationItem(_ClarificationItem):
+    """Individual committee clarification item for updating."""
+
+    @field_validator('unique_code')
+    @classmethod
+    def validate_unique_code(cls, v: str) -> str:
+        if v not in ALL_COMMITTEE_CLARIFICATION_CODES:
+            raise ValueError(
+                f'unique_code must be one of:\n'
+                f'  Committee 1: {COMMITTEE_1_CODES}\n'
+                f'  Committee 2: {COMMITTEE_2_CODES}\n'
+                f'  Committee 3: {COMMITTEE_3_CODES}'
+            )
+        return v
+
+
+class UpdateCostClarificationsRequest(BaseModel):
+    clarifications: List[CostClarificationItem]
+
+
+class UpdateEnvironmentClarificationsRequest(BaseModel):
+    clarifications: List[EnvironmentClarificationItem]
+
+
+class UpdateCommitteeClarificationsRequest(BaseModel):
+    committee: str
+    clarifications: List[CommitteeClarificationItem]
+
+    @field_validator('committee')
+    @classmethod
+    def validate_committee(cls, v: str) -> str:
+        if v not in COMMITTEES:
+            raise ValueError(f'committee must be one of {COMMITTEES}')
+        return v
+
+
+class CommitteeRequest(BaseModel):
+    governance_id: str
+    committee: str
+
+    @field_validator('governance_id')
+    @classmethod
+    def governance_id_must_not_be_empty(cls, v: str) -> str:
+        if not v or not v.strip():
+            raise ValueError('governance_id must not be empty')
+        return v
+
+    @field_validator('committee')
+    @classmethod
+    def validate_committee(cls, v: str) -> str:
+        if v not in COMMITTEES:
+            raise ValueError(f'committee must be one of {COMMITTEES}')
+        return v
+
+
+class CreateCommitteeClarificationRequest(BaseModel):
+    governance_id: str
+    user_name: str
+    risk_level: str
+
+    @field_validator('risk_level')
+    @classmethod
+    def validate_risk_level(cls, v: str) -> str:
+        if v not in ['low', 'medium', 'high']:
+            raise ValueError('risk_level must be one of: "low", "medium", or "high"')
+        return v
+
+    @field_validator('governance_id')
+    @classmethod
+    def validate_governance_id(cls, v: str) -> str:
+        if not v or not v.strip():
+            raise ValueError('governance_id cannot be empty')
+        return v.strip()
+
+    @field_validator('user_name')
+    @classmethod
+    def validate_user_name(cls, v: str) -> str:
+        if not v or not v.strip():
+            raise ValueError('user_name cannot be empty')
+        return v.strip()
+
+
+class CommitteeStatusItem(BaseModel):
+    committee: Literal['committee_1', 'committee_2', 'committee_3']
+    status: Literal['Approved', 'Rejected', 'Pending']
+
+
+class SubmitCommitteeReviewRequest(BaseModel):
+    """Clarification answers and committee statuses submitted together."""
+    governance_id: str
+    clarifications: Dict[Literal['committee_1', 'committee_2', 'committee_3'], List[CommitteeClarificationItem]] = Field(default_factory=dict)
+    committees: List[CommitteeStatusItem] = Field(..., min_length=1)
+
+    @field_validator('governance_id')
+    @classmethod
+    def validate_governance_id(cls, v: str) -> str:
+        if not v or not v.strip():
+            raise ValueError('governance_id cannot be empty')
+        return v.strip()
+
+    @model_validator(mode='after')
+    def validate_codes_per_committee(self):
+        for committee, items in self.clarifications.items():
+            valid_codes = COMMITTEE_CLARIFICATION_CODES[committee]
+            for item in items:
+                if item.unique_code not in valid_codes:
+                    raise ValueError(f"unique_code '{item.unique_code}' is not valid for {committee}. Valid codes: {valid_codes}")
+        statuses = [item.committee for item in self.committees]
+        if len(set(statuses)) != len(statuses):
+            raise ValueError('each committee can only be given one status')
+        return self
@@ -1,27 +1,328 @@
 """WebSocket manager for broadcasting chat history updates to frontend clients"""
 
 import asyncio
+import copy
 import json
+import time
+import uuid
 import websockets
-from typing import Set
+from collections import OrderedDict, deque
+from typing import Dict, Iterable, Optional, Set
 from websockets.server import WebSocketServerProtocol
+from config import WS_STATE_MAX_GOVERNANCES, WS_REQUIRE_SUBSCRIPTION, WS_SEND_QUEUE_MAX_MESSAGES, WS_SLOW_CONSUMER_POLICY, WS_REPLAY_BUFFER_SIZE, WS_PENDING_SESSION_RETRY_SECONDS
+from utilities.json_patch import content_hash, make_patch
+from utilities.send_queue import ClientSendQueue
+from utilities.backplane import create_backplane
+
+# Keys of a governance payload that describe navigation rather than content
+NAVIGATION_KEYS = ("governance_id", "section", "sub_section", "partial")
+
+
+def _chat_events(chat_history: Optional[dict]) -> Optional[list]:
+    """Return the ADK event list of a chat_history section, if present"""
+    events = ((chat_history or {}).get("data") or {}).get("chat_history", {}).get("events")
+    return events if isinstance(events, list) else None
+
+
+def _without_chat_events(chat_history: dict) -> dict:
+    """Return a copy of a chat_history section with its event list emptied"""
+    stripped = copy.deepcopy(chat_history)
+    stripped["data"]["chat_history"]["events"] = []
+    return stripped
+
+
+class StarletteClient:
+    """Adapter giving a Starlette WebSocket the interface of a websockets connection"""
+    
+    def __init__(self, websocket):
+        self.websocket = websocket
+    
+    async def send(self, message: str):
+        await self.websocket.send_text(message)
+    
+    async def close(self, code: int = 1000, reason: str = ""):
+        await self.websocket.close(code=code, reason=reason)
+    
+    def __aiter__(self):
+        # Ends when the client disconnects
+        return self.websocket.iter_text()
+
 
 class WebSocketManager:
     def __init__(self):
         self.clients: Set[WebSocketServerProtocol] = set()
         self.server = None
         self.loop = None
+        # Last known governance snapshot per governance_id:
+        # {"sections": {...}, "hashes": {...}, "hash": str, "section": str, "sub_section": str}
+        self.governance_state: "OrderedDict[str, dict]" = OrderedDict()
+        # Capabilities announced by each client (e.g. "delta")
+        self.client_capabilities: Dict[WebSocketServerProtocol, Set[str]] = {}
+        # Governance IDs for which each client holds the current snapshot
+        self.client_synced: Dict[WebSocketServerProtocol, Set[str]] = {}
+        # Topic index: governance_id -> subscribed clients, and the reverse
+        self.topics: Dict[str, Set[WebSocketServerProtocol]] = {}
+        self.client_topics: Dict[WebSocketServerProtocol, Set[str]] = {}
+        # Session subscriptions whose governance ID is not known yet: session_id -> clients
+        self.pending_sessions: Dict[str, Set[WebSocketServerProtocol]] = {}
+        # When the backend was last asked for the governance ID of each pending session
+        self.pending_resolved_at: Dict[str, float] = {}
+        # Clients that never subscribed and therefore receive every broadcast
+        self.unsubscribed_clients: Set[WebSocketServerProtocol] = set()
+        # Outbound queue and writer task of each client
+        self.send_queues: Dict[WebSocketServerProtocol, ClientSendQueue] = {}
+        self._next_client_id = 0
+        # Broadcasts are published on the backplane and delivered by every worker
+        self.backplane = create_backplane()
+        self.backplane_fallbacks = 0
+        # Identifies this worker's own messages on the backplane
+        self.worker_id = uuid.uuid4().hex[:12]
+        self.remote_invalidations = 0
+        # Sequence numbers are only comparable within one epoch; they are drawn
+        # from one counter for all governance IDs, so a governance ID evicted
+        # from governance_state and seen again never reuses a sequence number
+        self.epoch = uuid.uuid4().hex[:12]
+        self.seq = 0
+        self.catch_up_counts = {"current": 0, "replayed": 0, "snapshot": 0, "cache_seeded": 0}
         
     async def register(self, websocket: WebSocketServerProtocol):
         """Register a new WebSocket client"""
         self.clients.add(websocket)
+        self.client_capabilities[websocket] = set()
+        self.client_synced[websocket] = set()
+        self.client_topics[websocket] = set()
+        if not WS_REQUIRE_SUBSCRIPTION:
+            self.unsubscribed_clients.add(websocket)
+        self._next_client_id += 1
+        send_queue = ClientSendQueue(
+            self._next_client_id,
+            websocket.send,
+            max_size=WS_SEND_QUEUE_MAX_MESSAGES,
+            policy=WS_SLOW_CONSUMER_POLICY,
+            snapshot=self._snapshot_message,
+            on_overflow_disconnect=lambda: websocket.close(code=1013, reason="slow consumer")
+        )
+        self.send_queues[websocket] = send_queue
+        send_queue.start(on_closed=lambda: self.unregister(websocket))
         print(f"Client connected. Total clients: {len(self.clients)}")
         
     async def unregister(self, websocket: WebSocketServerProtocol):
         """Unregister a WebSocket client"""
         self.clients.discard(websocket)
+        self.client_capabilities.pop(websocket, None)
+        self.client_synced.pop(websocket, None)
+        self.unsubscribed_clients.discard(websocket)
+        send_queue = self.send_queues.pop(websocket, None)
+        if send_queue is not None:
+            send_queue.cancel()
+        for governance_id in self.client_topics.pop(websocket, set()):
+            self._remove_subscriber(self.topics, governance_id, websocket)
+        for session_id in list(self.pending_sessions):
+            self._remove_subscriber(self.pending_sessions, session_id, websocket)
+            if session_id not in self.pending_sessions:
+                self.pending_resolved_at.pop(session_id, None)
         print(f"Client disconnected. Total clients: {len(self.clients)}")
+    
+    @staticmethod
+    def _remove_subscriber(index: Dict[str, Set[WebSocketServerProtocol]], key: str, websocket: WebSocketServerProtocol):
+        subscribers = index.get(key)
+        if subscribers is not None:
+            subscribers.discard(websocket)
+            if not subscribers:
+                del index[key]
+    
+    def _enqueue(self, websocket: WebSocketServerProtocol, message: str, topic: Optional[str] = None) -> bool:
+        """Queue a message for a client without waiting; False if the client is gone"""
+        send_queue = self.send_queues.get(websocket)
+        return send_queue is not None and send_queue.put(message, topic)
+    
+    def _snapshot_message(self, governance_id: str) -> Optional[str]:
+        return self._full_message(governance_id) if governance_id in self.governance_state else None
+    
+    def _add_topic(self, websocket: WebSocketServerProtocol, governance_id: str):
+        self.topics.setdefault(governance_id, set()).add(websocket)
+        self.client_topics.setdefault(websocket, set()).add(governance_id)
+    
+    async def subscribe(self, websocket: WebSocketServerProtocol, governance_ids: Iterable[str] = (), session_ids: Iterable[str] = ()) -> dict:
+        """
+        Subscribe a client to the broadcasts of governance IDs and chat sessions.
+        
+        Session IDs are resolved to their governance ID; sessions without a
+        governance request yet are kept pending and bound as soon as the
+        governance ID of the session becomes known.
+        
+        Returns:
+            The subscribed governance IDs and the still pending session IDs
+        """
+        from utilities.session_resolver import resolve_governance_id_async
         
+        self.unsubscribed_clients.discard(websocket)
+        for governance_id in governance_ids:
+            self._add_topic(websocket, governance_id)
+        pending = []
+        for session_id in session_ids:
+            try:
+                self._add_topic(websocket, await resolve_governance_id_async(session_id))
+            except Exception:
+                self.pending_sessions.setdefault(session_id, set()).add(websocket)
+                self.pending_resolved_at[session_id] = time.monotonic()
+                pending.append(session_id)
+        return {
+            "governance_ids": sorted(self.client_topics.get(websocket, set())),
+            "pending_session_ids": pending
+        }
+    
+    def unsubscribe(self, websocket: WebSocketServerProtocol, governance_ids: Iterable[str] = (), session_ids: Iterable[str] = ()):
+        """Remove subscriptions of a client; a session's governance ID is unsubscribed if it is known"""
+        from utilities.session_resolver import lookup_governance_id
+        
+        for session_id in session_ids:
+            self._remove_subscriber(self.pending_sessions, session_id, websocket)
+            if session_id not in self.pending_sessions:
+                self.pending_resolved_at.pop(session_id, None)
+            governance_id = lookup_governance_id(session_id)
+            if governance_id:
+                governance_ids = [*governance_ids, governance_id]
+        for governance_id in governance_ids:
+            self._remove_subscriber(self.topics, governance_id, websocket)
+            self.client_topics.get(websocket, set()).discard(governance_id)
+    
+    async def _bind_pending_sessions(self):
+        """
+        Move pending session subscriptions whose governance ID is now known to its topic.
+        
+        Sessions are looked up in the local session map first. The governance
+        request may have been created through another worker, so sessions not
+        known locally are resolved against the backend, at most once every
+        WS_PENDING_SESSION_RETRY_SECONDS per session.
+        """
+        if not self.pending_sessions:
+            return
+        from utilities.session_resolver import lookup_governance_id, resolve_governance_id_async
+        
+        now = time.monotonic()
+        resolved = {}
+        unknown = []
+        for session_id in list(self.pending_sessions):
+            governance_id = lookup_governance_id(session_id)
+            if governance_id:
+                resolved[session_id] = governance_id
+            elif now - self.pending_resolved_at.get(session_id, 0) >= WS_PENDING_SESSION_RETRY_SECONDS:
+                self.pending_resolved_at[session_id] = now
+                unknown.append(session_id)
+        if unknown:
+            results = await asyncio.gather(*(resolve_governance_id_async(session_id) for session_id in unknown), return_exceptions=True)
+            for session_id, governance_id in zip(unknown, results):
+                if isinstance(governance_id, str) and governance_id:
+                    resolved[session_id] = governance_id
+        
+        for session_id, governance_id in resolved.items():
+            # The session may have been unsubscribed while it was being resolved
+            for websocket in self.pending_sessions.pop(session_id, set()):
+                self._add_topic(websocket, governance_id)
+            self.pending_resolved_at.pop(session_id, None)
+    
+    def subscribers(self, governance_id: str) -> Set[WebSocketServerProtocol]:
+        """Return the clients that receive the broadcasts of a governance ID"""
+        return self.topics.get(governance_id, set()) | self.unsubscribed_clients
+        
+    async def publish(self, message_type: str, data: dict):
+        """
+        Publish a broadcast on the backplane, so that the clients of all workers receive it.
+        
+        If the backplane is unavailable, the broadcast is delivered to the clients
+        of this worker only.
+        
+        Args:
+            message_type: "governance_details" or "chat_history"
+            data: Broadcast payload
+        """
+        message = {"type": message_type, "data": data}
+        try:
+            await self.backplane.publish(message)
+        except Exception as e:
+            self.backplane_fallbacks += 1
+            print(f"Backplane publish failed, delivering locally: {e}")
+            await self.deliver(message)
+    
+    async def publish_invalidation(self, governance_id: str, sections: Optional[Iterable[str]] = None):
+        """
+        Tell the other workers to drop cached sections of a governance ID after a write.
+        
+        The writing worker has already updated its own caches; the others drop
+        the sections from their snapshot cache, which in turn updates their
+        clarification index and projection cache.
+        """
+        message = {
+            "type": "invalidate",
+            "origin": self.worker_id,
+            "data": {"governance_id": governance_id, "sections": list(sections) if sections is not None else None}
+        }
+        try:
+            await self.backplane.publish(message)
+        except Exception as e:
+            self.backplane_fallbacks += 1
+            print(f"Backplane publish of invalidation for {governance_id} failed: {e}")
+    
+    def _apply_remote_invalidation(self, message: dict):
+        from utilities.snapshot_cache import snapshot_cache
+        
+        if message.get("origin") == self.worker_id:
+            return
+        data = message.get("data") or {}
+        if data.get("governance_id"):
+            snapshot_cache.invalidate(data["governance_id"], data.get("sections"))
+            self.remote_invalidations += 1
+    
+    async def deliver(self, message: dict):
+        """Deliver a broadcast received from the backplane to the clients of this worker"""
+        message_type = message.get("type")
+        if message_type == "governance_details":
+            await self.broadcast_governance_details(message["data"])
+        elif message_type == "chat_history":
+            await self.broadcast_chat_history(message["data"])
+        elif message_type == "invalidate":
+            self._apply_remote_invalidation(message)
+        else:
+            print(f"Ignoring backplane message of type {message_type}")
+    
+    async def resync_after_gap(self):
+        """
+        Recover from backplane messages that may have been missed (e.g. during a reconnect).
+        
+        Broadcasts and invalidations published meanwhile are lost, so the cached
+        sections and stored snapshots of this worker cannot be trusted: they are
+        dropped, a new epoch is started so clients cannot catch up from sequence
+        numbers of the old one, and a fresh broadcast is queued for every
+        governance ID this worker's clients receive.
+        """
+        from utilities.api_helpers import queue_governance_broadcast
+        from utilities.snapshot_cache import snapshot_cache
+        
+        if self.unsubscribed_clients:
+            governance_ids = set(self.governance_state) | set(self.topics)
+        else:
+            governance_ids = set(self.topics)
+        snapshot_cache.clear()
+        self.governance_state.clear()
+        self._start_epoch()
+        print(f"Backplane messages may have been missed, resynchronizing {len(governance_ids)} governance(s)")
+        for governance_id in governance_ids:
+            queue_governance_broadcast(governance_id)
+    
+    def _start_epoch(self):
+        """Start a new epoch and announce it, so clients discard their sequence numbers"""
+        self.epoch = uuid.uuid4().hex[:12]
+        self.seq = 0
+        for websocket, synced in self.client_synced.items():
+            synced.clear()
+            self._enqueue(websocket, json.dumps({
+                "type": "subscribed",
+                "epoch": self.epoch,
+                "governance_ids": sorted(self.client_topics.get(websocket, set())),
+                "pending_session_ids": sorted(session_id for session_id, clients in self.pending_sessions.items() if websocket in clients)
+            }))
+    
     async def broadcast_chat_history(self, chat_data: dict):
         """Broadcast chat history update to all connected clients"""
         if not self.clients:
@@ -33,65 +334,365 @@ class WebSocketManager:
             "data": chat_data
         })
         
-        # Send to all connected clients
-        disconnected_clients = set()
-        for client in self.clients:
-            try:
-                await client.send(message)
-                print(f"Broadcasted chat history update to client")
-            except websockets.exceptions.ConnectionClosed:
-                disconnected_clients.add(client)
-                
-        # Clean up disconnected clients
-        for client in disconnected_clients:
-            await self.unregister(client)
+        # Queue for all connected clients
+        for client in list(self.clients):
+            self._enqueue(client, message)
+    
+    def _apply_governance_update(self, governance_data: dict) -> Optional[dict]:
+        """
+        Merge a governance payload into the stored snapshot and describe the change.
+        
+        Returns None when neither the content nor the navigation target changed,
+        otherwise a dict with the changed sections and the previous/current state.
+        """
+        governance_id = governance_data.get("governance_id")
+        previous = self.governance_state.get(governance_id) or {
+            "sections": {}, "hashes": {}, "hash": None, "section": None, "sub_section": None,
+            "seq": 0, "replay_floor": None, "changes": deque(maxlen=WS_REPLAY_BUFFER_SIZE)
+        }
+        
+        sections = dict(previous["sections"])
+        hashes = dict(previous["hashes"])
+        changed_sections = []
+        for name, value in governance_data.items():
+            if name in NAVIGATION_KEYS:
+                continue
+            section_hash = content_hash(value)
+            if hashes.get(name) != section_hash:
+                changed_sections.append(name)
+                sections[name] = value
+                hashes[name] = section_hash
+        
+        section = governance_data.get("section", "none")
+        sub_section = governance_data.get("sub_section", "none")
+        navigates = section != "none" or sub_section != "none"
+        if not changed_sections and not navigates and previous["hash"] is not None:
+            return None
+        
+        self.seq += 1
+        changes = previous["changes"]
+        current = {
+            "sections": sections,
+            "hashes": hashes,
+            "hash": content_hash(sorted(hashes.items())),
+            "section": section,
+            "sub_section": sub_section,
+            "seq": self.seq,
+            # Replay ring: (seq, changed sections) of the latest updates. It holds
+            # every change after replay_floor, so clients at or past that sequence
+            # number can be caught up from it
+            "replay_floor": previous["replay_floor"],
+            "changes": changes
+        }
+        if current["replay_floor"] is None or not changes.maxlen:
+            current["replay_floor"] = self.seq
+        elif len(changes) == changes.maxlen:
+            current["replay_floor"] = changes[0][0]
+        changes.append((current["seq"], tuple(changed_sections)))
+        self.governance_state[governance_id] = current
+        self.governance_state.move_to_end(governance_id)
+        while len(self.governance_state) > WS_STATE_MAX_GOVERNANCES:
+            evicted_id, _ = self.governance_state.popitem(last=False)
+            for synced in self.client_synced.values():
+                synced.discard(evicted_id)
+        
+        return {
+            "governance_id": governance_id,
+            "changed_sections": changed_sections,
+            "previous": previous,
+            "current": current
+        }
+    
+    @staticmethod
+    def _navigation(state: dict, navigate: bool) -> dict:
+        if not navigate:
+            return {"section": "none", "sub_section": "none"}
+        return {"section": state["section"], "sub_section": state["sub_section"]}
+    
+    def _full_message(self, governance_id: str, navigate: bool = True) -> str:
+        """
+        Serialize the full stored snapshot of a governance ID.
+        
+        With navigate False the message does not carry the section of the last
+        broadcast, so the frontend updates its data without navigating.
+        """
+        state = self.governance_state[governance_id]
+        return json.dumps({
+            "type": "governance_details_update",
+            "data": {
+                "governance_id": governance_id,
+                **self._navigation(state, navigate),
+                **state["sections"]
+            },
+            "hash": state["hash"],
+            "seq": state["seq"]
+        })
+    
+    def _changed_sections_message(self, governance_id: str, changed_sections: Iterable[str], navigate: bool = True) -> str:
+        """Serialize a governance_details_update carrying only the given sections of the stored snapshot"""
+        state = self.governance_state[governance_id]
+        return json.dumps({
+            "type": "governance_details_update",
+            "data": {
+                "governance_id": governance_id,
+                **self._navigation(state, navigate),
+                "partial": True,
+                **{name: state["sections"][name] for name in changed_sections}
+            },
+            "hash": state["hash"],
+            "seq": state["seq"]
+        })
+    
+    def _delta_message(self, update: dict) -> str:
+        """Serialize a governance_details_delta with a JSON patch and appended chat events"""
+        previous_sections = update["previous"]["sections"]
+        current = update["current"]
+        patch = []
+        chat_events = None
+        for name in update["changed_sections"]:
+            old_value = previous_sections.get(name)
+            new_value = current["sections"][name]
+            if name == "chat_history":
+                old_events = _chat_events(old_value)
+                new_events = _chat_events(new_value)
+                if old_events is not None and new_events is not None and new_events[:len(old_events)] == old_events:
+                    # Chat history is append-only: send the new events after the client's cursor
+                    chat_events = {"cursor": len(old_events), "events": new_events[len(old_events):]}
+                    old_value = _without_chat_events(old_value)
+                    new_value = _without_chat_events(new_value)
+            if name in previous_sections:
+                patch.extend(make_patch(old_value, new_value, f"/{name}"))
+            else:
+                patch.append({"op": "add", "path": f"/{name}", "value": new_value})
+        
+        return json.dumps({
+            "type": "governance_details_delta",
+            "governance_id": update["governance_id"],
+            "section": current["section"],
+            "sub_section": current["sub_section"],
+            "base_hash": update["previous"]["hash"],
+            "hash": current["hash"],
+            "seq": current["seq"],
+            "patch": patch,
+            "chat_events": chat_events
+        })
     
     async def broadcast_governance_details(self, governance_data: dict):
-        """Broadcast governance details (report, risk, cost, environment) to all connected clients"""
-        if not self.clients:
-            print("No clients connected to broadcast to")
+        """
+        Broadcast governance details (report, risk, cost, environment) to the subscribed clients.
+        
+        Only clients subscribed to the governance ID (directly or through its
+        chat session) and clients that never subscribed receive the broadcast.
+        
+        The manager remembers the last snapshot sent per governance_id. Clients that
+        do not hold that snapshot yet receive it in full; clients announcing the
+        "delta" capability receive a JSON patch, and other clients receive only the
+        sections that changed. Broadcasts that change nothing are skipped.
+        """
+        await self._bind_pending_sessions()
+        update = self._apply_governance_update(governance_data)
+        if update is None:
+            print(f"Governance details unchanged for {governance_data.get('governance_id')}, broadcast skipped")
+            return
+        
+        governance_id = update["governance_id"]
+        audience = self.subscribers(governance_id)
+        if not audience:
+            print(f"No clients subscribed to {governance_id}, broadcast skipped")
             return
+        
+        messages = {}
+        
+        # Queue for the subscribers of the governance ID; each client's writer sends it
+        for client in audience:
+            synced = self.client_synced.get(client, set())
+            if governance_id not in synced:
+                kind = "full"
+            elif "delta" in self.client_capabilities.get(client, set()):
+                kind = "delta"
+            else:
+                kind = "changed_sections"
             
-        message = json.dumps({
-            "type": "governance_details_update",
-            "data": governance_data
-        })
+            if kind not in messages:
+                if kind == "full":
+                    messages[kind] = self._full_message(governance_id)
+                elif kind == "delta":
+                    messages[kind] = self._delta_message(update)
+                else:
+                    messages[kind] = self._changed_sections_message(governance_id, update["changed_sections"])
+            
+            if self._enqueue(client, messages[kind], governance_id):
+                synced.add(governance_id)
+        print(f"Queued governance details update for {len(audience)} client(s)")
+    
+    async def send_resync(self, websocket: WebSocketServerProtocol, governance_id: Optional[str] = None):
+        """Send the full stored snapshot of one governance ID (or of all the client receives) to a client, without navigation"""
+        if governance_id:
+            governance_ids = [governance_id]
+        elif websocket in self.unsubscribed_clients:
+            governance_ids = list(self.governance_state)
+        else:
+            governance_ids = list(self.client_topics.get(websocket, set()))
+        for gid in governance_ids:
+            if gid not in self.governance_state:
+                continue
+            if self._enqueue(websocket, self._full_message(gid, navigate=False), gid):
+                self.client_synced.setdefault(websocket, set()).add(gid)
+    
+    def _cached_snapshot(self, governance_id: str) -> bool:
+        """Seed the stored snapshot of a governance ID from the snapshot cache, without backend requests"""
+        from utilities.api_helpers import GOVERNANCE_SECTIONS
+        from utilities.snapshot_cache import snapshot_cache
         
-        # Send to all connected clients
-        disconnected_clients = set()
-        for client in self.clients:
-            try:
-                await client.send(message)
-                print(f"Broadcasted governance details update to client")
-            except websockets.exceptions.ConnectionClosed:
-                disconnected_clients.add(client)
-                
-        # Clean up disconnected clients
-        for client in disconnected_clients:
-            await self.unregister(client)
+        sections = {}
+        for section in GOVERNANCE_SECTIONS:
+            cached = snapshot_cache.get(governance_id, section)
+            if cached is not None:
+                sections[section] = cached
+        if not sections:
+            return False
+        self._apply_governance_update({"governance_id": governance_id, "section": "none", "sub_section": "none", **sections})
+        self.catch_up_counts["cache_seeded"] += 1
+        return True
+    
+    async def send_catch_up(self, websocket: WebSocketServerProtocol, governance_ids: Iterable[str], epoch: Optional[str] = None, last_seq: Optional[dict] = None):
+        """
+        Bring a (re)subscribing client up to date on its governance IDs.
+        
+        A client that reports the last sequence number it received in the
+        current epoch gets the sections changed since then, if the replay ring
+        still covers them; otherwise it gets the full stored snapshot. Governance
+        IDs not broadcast yet are served from the snapshot cache. Nothing is
+        fetched from the backend. Catch-up messages carry section 'none', so
+        the frontend does not navigate to the section of an old broadcast.
+        
+        Args:
+            websocket: The client
+            governance_ids: Governance IDs the client subscribed to
+            epoch: Epoch the client's sequence numbers belong to
+            last_seq: Last sequence number received per governance ID
+        """
+        last_seq = last_seq if epoch == self.epoch and isinstance(last_seq, dict) else {}
+        synced = self.client_synced.setdefault(websocket, set())
+        for gid in governance_ids:
+            if gid in synced:
+                continue
+            state = self.governance_state.get(gid)
+            if state is None:
+                if not self._cached_snapshot(gid):
+                    continue
+                state = self.governance_state[gid]
+            
+            client_seq = last_seq.get(gid)
+            changes = state["changes"]
+            if client_seq == state["seq"]:
+                self.catch_up_counts["current"] += 1
+                synced.add(gid)
+                continue
+            if isinstance(client_seq, int) and state["replay_floor"] <= client_seq < state["seq"]:
+                missed = {}
+                for seq, changed_sections in changes:
+                    if seq > client_seq:
+                        missed.update(dict.fromkeys(changed_sections))
+                message = self._changed_sections_message(gid, missed, navigate=False)
+                self.catch_up_counts["replayed"] += 1
+            else:
+                message = self._full_message(gid, navigate=False)
+                self.catch_up_counts["snapshot"] += 1
+            if self._enqueue(websocket, message, gid):
+                synced.add(gid)
+    
+    async def handle_client_message(self, websocket: WebSocketServerProtocol, message):
+        """
+        Handle a control message sent by a client.
+        
+        Supported messages:
+            {"type": "hello", "capabilities": ["delta"]} - opt in to delta broadcasts
+            {"type": "resync", "governance_id": "GOV0001"} - request a full snapshot
+            {"type": "subscribe", "governance_ids": [...], "session_ids": [...],
+             "epoch": "...", "last_seq": {"GOV0001": 12}} - receive only the broadcasts
+                of these governance IDs / chat sessions, after catching up from the
+                last sequence number received (epoch and last_seq are optional)
+            {"type": "unsubscribe", "governance_ids": [...], "session_ids": [...]}
+        """
+        try:
+            payload = json.loads(message)
+        except (TypeError, ValueError):
+            print(f"Received message from client: {message}")
+            return
+        if not isinstance(payload, dict):
+            return
+        
+        message_type = payload.get("type")
+        if message_type == "hello":
+            self.client_capabilities[websocket] = set(payload.get("capabilities") or [])
+        elif message_type == "resync":
+            await self.send_resync(websocket, payload.get("governance_id"))
+        elif message_type == "subscribe":
+            subscribed = await self.subscribe(websocket, payload.get("governance_ids") or [], payload.get("session_ids") or [])
+            self._enqueue(websocket, json.dumps({"type": "subscribed", "epoch": self.epoch, **subscribed}))
+            await self.send_catch_up(websocket, subscribed["governance_ids"], payload.get("epoch"), payload.get("last_seq"))
+        elif message_type == "unsubscribe":
+            self.unsubscribe(websocket, payload.get("governance_ids") or [], payload.get("session_ids") or [])
+        else:
+            print(f"Received message from client: {message}")
     
     async def handle_client(self, websocket: WebSocketServerProtocol):
         """Handle individual client connection"""
         await self.register(websocket)
         try:
-            # Keep connection alive and listen for messages
+            # Keep connection alive and listen for control messages
             async for message in websocket:
-                # Echo or handle incoming messages if needed
-                print(f"Received message from client: {message}")
+                await self.handle_client_message(websocket, message)
         except websockets.exceptions.ConnectionClosed:
             pass
         finally:
             await self.unregister(websocket)
     
+    def stats(self) -> dict:
+        """Return the number of clients, topics and subscriptions, and the send queue of each client"""
+        send_queues = [send_queue.stats() for send_queue in list(self.send_queues.values())]
+        return {
+            "clients": len(self.clients),
+            "unsubscribed_clients": len(self.unsubscribed_clients),
+            "topics": len(self.topics),
+            "subscriptions": sum(len(subscribers) for subscribers in self.topics.values()),
+            "pending_sessions": len(self.pending_sessions),
+            "slow_consumer_policy": WS_SLOW_CONSUMER_POLICY,
+            "dropped": sum(queue_stats["dropped"] for queue_stats in send_queues),
+            "send_queues": send_queues,
+            "catch_up": dict(self.catch_up_counts),
+            "backplane": {
+                **self.backplane.stats(),
+                "fallbacks": self.backplane_fallbacks,
+                "remote_invalidations": self.remote_invalidations
+            }
+        }
+    
+    async def attach(self):
+        """Bind the manager to the running event loop and subscribe to the backplane"""
+        self.loop = asyncio.get_running_loop()
+        await self.backplane.start(self.deliver, self.resync_after_gap)
+    
+    async def detach(self):
+        """Unsubscribe from the backplane"""
+        await self.backplane.close()
+        self.loop = None
+    
+    async def handle_asgi_client(self, websocket):
+        """Starlette WebSocket endpoint: serve a client connected to the ASGI app"""
+        await websocket.accept()
+        await self.handle_client(StarletteClient(websocket))
+    
     async def start_server(self, host: str = "0.0.0.0", port: int = 8354):
         """Start the WebSocket server"""
-        self.loop = asyncio.get_event_loop()
         print(f"Starting WebSocket server on ws://{host}:{port}")
         self.server = await websockets.serve(
             self.handle_client,
             host,
             port
         )
+        await self.attach()
         print("WebSocket server started successfully")
         
     async def stop_server(self):
@@ -99,11 +700,43 @@ class WebSocketManager:
         if self.server:
             self.server.close()
             await self.server.wait_closed()
+            await self.detach()
             print("WebSocket server stopped")
 
 # Global WebSocket manager instance
 ws_manager = WebSocketManager()
 
+def _report_broadcast_failure(future):
+    if not future.cancelled() and future.exception() is not None:
+        print(f"Broadcast failed: {future.exception()}")
+
+async def broadcast_governance_details_async(governance_data: dict):
+    """
+    Broadcast governance details and wait until they are queued for the clients.
+    
+    On the WebSocket manager's own event loop (WS_MODE=asgi) the broadcast is
+    awaited directly; from another loop it is handed over to the manager's loop
+    and its completion awaited.
+    """
+    if ws_manager.loop is None or not ws_manager.loop.is_running():
+        print("Warning: WebSocket server loop not running, broadcast skipped")
+        return
+    publish = ws_manager.publish("governance_details", governance_data)
+    if ws_manager.loop is asyncio.get_running_loop():
+        await publish
+    else:
+        await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(publish, ws_manager.loop))
+
+def publish_invalidation_sync(governance_id: str, sections: Optional[Iterable[str]] = None):
+    """Publish a cache invalidation to the other workers without waiting for it"""
+    if ws_manager.loop is None or not ws_manager.loop.is_running():
+        return
+    sections = list(sections) if sections is not None else None
+    asyncio.run_coroutine_threadsafe(
+        ws_manager.publish_invalidation(governance_id, sections),
+        ws_manager.loop
+    ).add_done_callback(_report_broadcast_failure)
+
 def broadcast_chat_history_sync(chat_data: dict):
     """Synchronous wrapper to broadcast chat history from non-async code"""
     import threading
@@ -113,9 +746,9 @@ def broadcast_chat_history_sync(chat_data: dict):
         if ws_manager.loop and ws_manager.loop.is_running():
             # Schedule the coroutine in the WebSocket thread's event loop
             asyncio.run_coroutine_threadsafe(
-                ws_manager.broadcast_chat_history(chat_data),
+                ws_manager.publish("chat_history", chat_data),
                 ws_manager.loop
-            )
+            ).add_done_callback(_report_broadcast_failure)
             print("Chat history broadcast scheduled successfully")
         else:
             print("Warning: WebSocket server loop not running, broadcast skipped")
@@ -131,9 +764,9 @@ def broadcast_governance_details_sync(governance_data: dict):
         if ws_manager.loop and ws_manager.loop.is_running():
             # Schedule the coroutine in the WebSocket thread's event loop
             asyncio.run_coroutine_threadsafe(
-                ws_manager.broadcast_governance_details(governance_data),
+                ws_manager.publish("governance_details", governance_data),
                 ws_manager.loop
-            )
+            ).add_done_callback(_report_broadcast_failure)
             print("Governance details broadcast scheduled successfully")
         else:
             print("Warning: WebSocket server loop not running, broadcast skipped")
@@ -95,7 +95,9 @@ export class CostDetailsService {
       const newCostRef = costRef.push();
       await newCostRef.set(costDetailsData);
 
+      // Same shape as the records listed by the GET endpoints
       return {
+        id: newCostRef.key,
         cost_details_id: costDetailsData.cost_details_id,
         user_name: costDetailsData.user_name,
         governance_id: costDetailsData.governance_id,
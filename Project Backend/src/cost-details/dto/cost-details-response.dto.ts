@@ -6,6 +6,7 @@ export class CostBreakdownItem {
 }
 
 export class CostDetailsResponseDto {
+  id?: string;
   cost_details_id?: string;
   user_name: string;
   governance_id: string;
@@ -4,6 +4,7 @@ export class EnvironmentService {
 }
 
 export class EnvironmentDetailsResponseDto {
+  id?: string;
   environment_details_id?: string;
   user_name: string;
   governance_id: string;
@@ -86,7 +86,9 @@ export class EnvironmentDetailsService {
       const newEnvRef = envRef.push();
       await newEnvRef.set(environmentDetailsData);
 
+      // Same shape as the records listed by the GET endpoints
       return {
+        id: newEnvRef.key,
         environment_details_id: environmentDetailsData.environment_details_id,
         user_name: environmentDetailsData.user_name,
         governance_id: environmentDetailsData.governance_id,